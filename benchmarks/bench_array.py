@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+import databpy as db
+
+EDITS = {
+    "element": lambda array: array.__setitem__(0, (1.0, 2.0, 3.0)),
+    "slice": lambda array: array.__setitem__(slice(None, len(array) // 2), 1.0),
+    "column": lambda array: array.__setitem__((slice(None), 2), 0.5),
+    "mask": lambda array: array.__setitem__(array[:, 0] > 0.5, 0.0),
+    "inplace": lambda array: array.__iadd__(1.0),
+}
+
+
+@pytest.mark.parametrize("n_elements", [10**3, 10**5, 10**6])
+@pytest.mark.parametrize("edit", list(EDITS))
+def test_attribute_array_edit(bench, edit, n_elements):
+    "Editing `AttributeArray`, which writes the whole attribute back for each edit."
+    bob = db.create_bob(np.random.default_rng(0).random((n_elements, 3)))
+    position = bob.position
+    bench(
+        EDITS[edit],
+        position,
+        n_elements=n_elements,
+        n_bytes=position.nbytes,
+    )
+
+
+@pytest.mark.parametrize("n_elements", [10**3, 10**5, 10**6])
+def test_attribute_array_read(bench, n_elements):
+    bob = db.create_bob(np.random.default_rng(0).random((n_elements, 3)))
+    array = bench(lambda: bob.position, n_elements=n_elements)
+    bench.result.n_bytes = array.nbytes
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+import databpy as db
+from databpy.attribute import AttributeTypes
+
+SIZES = [10**3, 10**5, 10**7]
+
+
+def new_attribute(n_elements: int, atype: AttributeTypes) -> db.Attribute:
+    bob = db.create_bob(np.zeros((n_elements, 3)), name="Benchmark")
+    attribute = bob.data.attributes.new("values", atype.value.type_name, "POINT")
+    return db.Attribute(attribute)
+
+
+@pytest.mark.parametrize("n_elements", SIZES)
+@pytest.mark.parametrize("atype", list(AttributeTypes), ids=lambda atype: atype.name)
+def test_as_array(bench, atype, n_elements):
+    attribute = new_attribute(n_elements, atype)
+    array = bench(
+        attribute.as_array,
+        n_elements=n_elements,
+        n_bytes=attribute.size * np.dtype(attribute.dtype).itemsize,
+    )
+    assert len(array) == n_elements
+
+
+@pytest.mark.parametrize("n_elements", SIZES)
+@pytest.mark.parametrize("atype", list(AttributeTypes), ids=lambda atype: atype.name)
+def test_from_array(bench, atype, n_elements):
+    attribute = new_attribute(n_elements, atype)
+    array = attribute.as_array()
+    bench(attribute.from_array, array, n_elements=n_elements, n_bytes=array.nbytes)
+
+
+@pytest.mark.parametrize("n_elements", [10**5, 10**7])
+@pytest.mark.parametrize("skip_unchanged", [False, True])
+def test_store_unchanged(bench, skip_unchanged, n_elements):
+    "Rewriting the same values, with and without comparing their content hashes."
+    bob = db.create_bob(np.zeros((n_elements, 3)), name="Benchmark")
+    values = np.random.default_rng(0).random((n_elements, 3), dtype=np.float32)
+    bob.store_named_attribute(values, "values", skip_unchanged=skip_unchanged)
+
+    def store():
+        bob.store_named_attribute(values, "values", skip_unchanged=skip_unchanged)
+
+    bench(store, n_elements=n_elements, n_bytes=values.nbytes)
@@ -0,0 +1,59 @@
+import bpy
+import numpy as np
+import pytest
+
+import databpy as db
+
+SIZES = [10**3, 10**4, 10**5, 10**6, 10**7]
+POINTS_PER_CURVE = 10
+
+
+def remove(obj: bpy.types.Object) -> None:
+    data = obj.data
+    bpy.data.objects.remove(obj)
+    if isinstance(data, bpy.types.Mesh):
+        bpy.data.meshes.remove(data)
+    elif isinstance(data, bpy.types.PointCloud):
+        bpy.data.pointclouds.remove(data)
+    elif isinstance(data, bpy.types.Curves):
+        bpy.data.hair_curves.remove(data)
+
+
+@pytest.fixture
+def positions(n_elements):
+    return np.random.default_rng(0).random((n_elements, 3), dtype=np.float32)
+
+
+@pytest.mark.parametrize("n_elements", SIZES)
+def test_create_mesh_object(bench, positions, n_elements):
+    bench(
+        db.create_mesh_object,
+        positions,
+        teardown=remove,
+        n_elements=n_elements,
+        n_bytes=positions.nbytes,
+    )
+
+
+@pytest.mark.parametrize("n_elements", SIZES)
+def test_create_pointcloud_object(bench, positions, n_elements):
+    bench(
+        db.create_pointcloud_object,
+        positions,
+        teardown=remove,
+        n_elements=n_elements,
+        n_bytes=positions.nbytes,
+    )
+
+
+@pytest.mark.parametrize("n_elements", SIZES)
+def test_create_curves_object(bench, positions, n_elements):
+    curve_sizes = np.full(n_elements // POINTS_PER_CURVE, POINTS_PER_CURVE)
+    bench(
+        db.create_curves_object,
+        positions,
+        curve_sizes,
+        teardown=remove,
+        n_elements=n_elements,
+        n_bytes=positions.nbytes,
+    )
@@ -0,0 +1,28 @@
+import bpy
+import pytest
+
+from databpy.nodes import deduplicate_node_trees
+
+
+def create_duplicated_groups(n_groups: int) -> list[bpy.types.NodeTree]:
+    "Half of the node groups are duplicates named like `Group_1.001` of the rest."
+    for tree in list(bpy.data.node_groups):
+        bpy.data.node_groups.remove(tree)
+    originals = n_groups // 2
+    for i in range(originals):
+        bpy.data.node_groups.new(f"Group_{i}", "GeometryNodeTree")
+    for i in range(n_groups - originals):
+        bpy.data.node_groups.new(f"Group_{i % originals}", "GeometryNodeTree")
+    return list(bpy.data.node_groups)
+
+
+@pytest.mark.parametrize("n_groups", [1000, 5000])
+def test_deduplicate_node_trees(bench, n_groups):
+    stats = bench(
+        deduplicate_node_trees,
+        setup=lambda: (create_duplicated_groups(n_groups),),
+        n_elements=n_groups,
+        rounds=3,
+    )
+    assert len(bpy.data.node_groups) == n_groups // 2
+    assert stats.n_ids == n_groups - n_groups // 2
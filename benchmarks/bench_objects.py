@@ -0,0 +1,49 @@
+import bpy
+import numpy as np
+import pytest
+
+import databpy as db
+from databpy.object import get_from_uuid
+
+SCENE_SIZES = [100, 1000, 5000]
+
+
+def fill_scene(n_objects: int) -> list[db.BlenderObject]:
+    "Link a number of small objects to the scene, each with its own uuid."
+    vertices = np.zeros((1, 3))
+    return [db.create_bob(vertices, name=f"Object_{i}") for i in range(n_objects)]
+
+
+@pytest.mark.parametrize("n_objects", SCENE_SIZES)
+def test_object_tracker(bench, n_objects):
+    fill_scene(n_objects)
+
+    def track():
+        with db.ObjectTracker() as tracker:
+            bpy.data.objects["Object_0"].copy()
+        return tracker.new_objects()
+
+    bench(track, n_elements=n_objects)
+
+
+@pytest.mark.parametrize("n_objects", SCENE_SIZES)
+def test_get_from_uuid(bench, n_objects):
+    "Finding the most recently created object, which is searched for last."
+    bobs = fill_scene(n_objects)
+    obj = bench(get_from_uuid, bobs[-1].uuid, n_elements=n_objects)
+    assert obj == bobs[-1].object
+
+
+@pytest.mark.parametrize("n_objects", SCENE_SIZES)
+def test_renamed_object_lookup(bench, n_objects):
+    "Accessing `BlenderObject.object` after a rename falls back to the uuid."
+    bobs = fill_scene(n_objects)
+    bob = bobs[-1]
+    bob.object.name = "Renamed"
+
+    def forget_name():
+        bob._object_name = "Missing"
+        return ()
+
+    obj = bench(lambda: bob.object, setup=forget_name, n_elements=n_objects)
+    assert obj.name == "Renamed"
@@ -0,0 +1,322 @@
+"""
+Compare two sets of benchmark results written with `--databpy-bench-json`.
+
+    python benchmarks/compare.py baseline.json candidate.json
+
+Either side can also be a directory of JSON files from repeated runs, whose samples
+are pooled before comparing. A benchmark only counts as a regression when its median
+got slower by more than the threshold, the interquartile ranges of the two sides don't
+overlap and the medians are further apart than the noise factor times the larger IQR,
+so that noisy benchmarks don't fail the comparison. The more rounds and repeated runs
+the results have, the more reliable the quartiles are.
+
+The slope of the time against the number of elements is compared as well for
+benchmarks that were run at several sizes, to catch changes in how they scale.
+
+Exits with 1 if there are any regressions and 0 otherwise. Only the standard library
+is used, so it runs with Blender's bundled Python and without a network connection.
+"""
+
+import argparse
+import json
+import math
+import statistics
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence
+
+DEFAULT_THRESHOLD = 0.1
+DEFAULT_NOISE = 2.0
+DEFAULT_SCALING_THRESHOLD = 0.15
+
+
+@dataclass
+class Samples:
+    "The pooled samples of one benchmark."
+
+    name: str
+    group: str
+    params: dict[str, str]
+    samples: list[float]
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def quartiles(self) -> tuple[float, float]:
+        if len(self.samples) < 2:
+            return self.samples[0], self.samples[0]
+        q1, _, q3 = statistics.quantiles(self.samples, n=4, method="inclusive")
+        return q1, q3
+
+    @property
+    def iqr(self) -> float:
+        q1, q3 = self.quartiles
+        return q3 - q1
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline: Samples
+    candidate: Samples
+    threshold: float
+    noise: float = DEFAULT_NOISE
+
+    @property
+    def ratio(self) -> float:
+        "Candidate time over baseline time, above 1 is slower."
+        if self.baseline.median == 0:
+            return math.inf if self.candidate.median > 0 else 1.0
+        return self.candidate.median / self.baseline.median
+
+    @property
+    def significant(self) -> bool:
+        """
+        Whether the change isn't just noise, which needs the interquartile ranges to
+        be apart and the medians to differ by more than `noise` times the larger of
+        them.
+        """
+        base_q1, base_q3 = self.baseline.quartiles
+        cand_q1, cand_q3 = self.candidate.quartiles
+        if not (cand_q1 > base_q3 or cand_q3 < base_q1):
+            return False
+        spread = max(self.baseline.iqr, self.candidate.iqr)
+        return abs(self.candidate.median - self.baseline.median) > self.noise * spread
+
+    @property
+    def status(self) -> str:
+        if not self.significant:
+            return "same"
+        if self.ratio > 1 + self.threshold:
+            return "slower"
+        if self.ratio < 1 / (1 + self.threshold):
+            return "faster"
+        return "same"
+
+
+@dataclass
+class ScalingComparison:
+    family: str
+    baseline: float
+    candidate: float
+    threshold: float
+
+    @property
+    def status(self) -> str:
+        if self.candidate - self.baseline > self.threshold:
+            return "slower"
+        if self.baseline - self.candidate > self.threshold:
+            return "faster"
+        return "same"
+
+
+def load_results(path: str | Path) -> dict[str, Samples]:
+    """
+    Read the benchmarks of a JSON file, or pool those of every JSON file in a
+    directory.
+    """
+    path = Path(path)
+    files = sorted(path.glob("*.json")) if path.is_dir() else [path]
+    if not files:
+        raise FileNotFoundError(f"No benchmark results in {path}")
+
+    results: dict[str, Samples] = {}
+    for file in files:
+        for benchmark in json.loads(file.read_text())["benchmarks"]:
+            # older or foreign results may only have the summary rather than samples
+            samples = benchmark.get("samples") or [benchmark["median"]]
+            existing = results.get(benchmark["name"])
+            if existing is None:
+                results[benchmark["name"]] = Samples(
+                    name=benchmark["name"],
+                    group=benchmark.get("group", ""),
+                    params=benchmark.get("params", {}),
+                    samples=list(samples),
+                )
+            else:
+                existing.samples.extend(samples)
+    return results
+
+
+def _scaling_exponents(results: dict[str, Samples]) -> dict[str, float]:
+    """
+    The slope of log time against log number of elements for each benchmark that was
+    run at three or more sizes, where 1 is linear scaling.
+    """
+    families: dict[str, list[tuple[float, float]]] = {}
+    for result in results.values():
+        n_elements = result.params.get("n_elements")
+        if n_elements is None or result.median <= 0:
+            continue
+        others = ",".join(
+            f"{k}={v}" for k, v in sorted(result.params.items()) if k != "n_elements"
+        )
+        family = result.name.split("[")[0] + (f"[{others}]" if others else "")
+        families.setdefault(family, []).append(
+            (math.log(float(n_elements)), math.log(result.median))
+        )
+
+    exponents = {}
+    for family, points in families.items():
+        if len(points) < 3:
+            continue
+        x_mean = statistics.fmean(x for x, _ in points)
+        y_mean = statistics.fmean(y for _, y in points)
+        sxx = sum((x - x_mean) ** 2 for x, _ in points)
+        if sxx == 0:
+            continue
+        sxy = sum((x - x_mean) * (y - y_mean) for x, y in points)
+        exponents[family] = sxy / sxx
+    return exponents
+
+
+def compare(
+    baseline: dict[str, Samples],
+    candidate: dict[str, Samples],
+    threshold: float = DEFAULT_THRESHOLD,
+    scaling_threshold: float = DEFAULT_SCALING_THRESHOLD,
+    noise: float = DEFAULT_NOISE,
+) -> tuple[list[Comparison], list[ScalingComparison]]:
+    "Compare every benchmark and scaling exponent found in both results."
+    comparisons = [
+        Comparison(name, baseline[name], candidate[name], threshold, noise)
+        for name in baseline
+        if name in candidate
+    ]
+    base_exponents = _scaling_exponents(baseline)
+    cand_exponents = _scaling_exponents(candidate)
+    scaling = [
+        ScalingComparison(
+            family, base_exponents[family], cand_exponents[family], scaling_threshold
+        )
+        for family in base_exponents
+        if family in cand_exponents
+    ]
+    return comparisons, scaling
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def _table(rows: list[tuple[str, ...]]) -> str:
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(
+            cell.ljust(w) if i == 0 else cell.rjust(w)
+            for i, (cell, w) in enumerate(zip(row, widths))
+        ).rstrip()
+        for row in rows
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare two benchmark results and fail on regressions."
+    )
+    parser.add_argument("baseline", help="JSON results, or a directory of them")
+    parser.add_argument("candidate", help="JSON results, or a directory of them")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Relative slowdown of the median that counts as a regression "
+        f"(default {DEFAULT_THRESHOLD}).",
+    )
+    parser.add_argument(
+        "--noise",
+        type=float,
+        default=DEFAULT_NOISE,
+        help="How many interquartile ranges the medians have to differ by to not be "
+        f"considered noise (default {DEFAULT_NOISE}).",
+    )
+    parser.add_argument(
+        "--scaling-threshold",
+        type=float,
+        default=DEFAULT_SCALING_THRESHOLD,
+        help="Increase of the scaling exponent that counts as a regression "
+        f"(default {DEFAULT_SCALING_THRESHOLD}).",
+    )
+    parser.add_argument(
+        "--group",
+        action="append",
+        default=None,
+        help="Only fail on regressions in this group, such as 'attribute' or "
+        "'create'. Can be given more than once. Defaults to every group.",
+    )
+    parser.add_argument(
+        "--all", action="store_true", help="List unchanged benchmarks as well."
+    )
+    args = parser.parse_args(argv)
+
+    baseline = load_results(args.baseline)
+    candidate = load_results(args.candidate)
+    comparisons, scaling = compare(
+        baseline, candidate, args.threshold, args.scaling_threshold, args.noise
+    )
+
+    def gated(name: str) -> bool:
+        if args.group is None:
+            return True
+        # the group is the name of the file without the `bench_` prefix
+        return name.split("::")[0].removeprefix("bench_").removesuffix(".py") in (
+            args.group
+        )
+
+    regressions = [c.name for c in comparisons if c.status == "slower"]
+    regressions += [s.family for s in scaling if s.status == "slower"]
+    regressions = [name for name in regressions if gated(name.split("[")[0])]
+
+    rows = [("benchmark", "baseline", "candidate", "ratio", "iqr", "status")]
+    for c in sorted(comparisons, key=lambda c: -c.ratio):
+        if c.status == "same" and not args.all:
+            continue
+        rows.append(
+            (
+                c.name,
+                _format_time(c.baseline.median),
+                _format_time(c.candidate.median),
+                f"{c.ratio:.2f}x",
+                _format_time(max(c.baseline.iqr, c.candidate.iqr)),
+                c.status.upper() if c.status == "slower" else c.status,
+            )
+        )
+    if len(rows) > 1:
+        print(_table(rows))
+        print()
+
+    rows = [("scaling", "baseline", "candidate", "status")]
+    for s in sorted(scaling, key=lambda s: s.baseline - s.candidate):
+        if s.status == "same" and not args.all:
+            continue
+        rows.append(
+            (
+                s.family,
+                f"n^{s.baseline:.2f}",
+                f"n^{s.candidate:.2f}",
+                s.status.upper() if s.status == "slower" else s.status,
+            )
+        )
+    if len(rows) > 1:
+        print(_table(rows))
+        print()
+
+    only_baseline = sorted(set(baseline) - set(candidate))
+    only_candidate = sorted(set(candidate) - set(baseline))
+    print(
+        f"{len(comparisons)} compared, {len(regressions)} regressions, "
+        f"{sum(c.status == 'faster' for c in comparisons)} faster, "
+        f"{len(only_baseline)} only in baseline, "
+        f"{len(only_candidate)} only in candidate"
+    )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+"""
+Benchmarks of databpy, run with pytest inside Blender the same way as the tests:
+
+    blender -b -P tests/run.py -- benchmarks --databpy-bench-json results.json
+
+or with the `bpy` module installed:
+
+    python -m pytest benchmarks --databpy-bench-json results.json
+
+The `bench_*.py` files are only collected when `--databpy-bench-json` is given, so that
+running the test suite from the root of the repository doesn't run them. Every
+benchmark is timed over repeated rounds and the samples are written to the JSON file,
+which `benchmarks/compare.py` reads to compare two runs.
+
+The options and the `bench` fixture are prefixed so they don't clash with those of the
+pytest-benchmark plugin when it is installed in the same environment.
+"""
+
+import datetime
+import json
+import platform
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+import bpy
+import numpy as np
+import pytest
+
+import databpy
+
+BENCHMARK_FORMAT = 1
+DEFAULT_ROUNDS = 7
+
+databpy.register()
+
+_RESULTS = pytest.StashKey[list]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("databpy benchmarks")
+    group.addoption(
+        "--databpy-bench-json",
+        metavar="PATH",
+        default=None,
+        help="Run the benchmarks and write their timings to PATH.",
+    )
+    group.addoption(
+        "--databpy-bench-rounds",
+        type=int,
+        default=DEFAULT_ROUNDS,
+        help=f"Number of timed rounds of each benchmark (default {DEFAULT_ROUNDS}).",
+    )
+    group.addoption(
+        "--databpy-bench-max-elements",
+        type=float,
+        default=1e7,
+        help="Skip parametrizations with more elements than this (default 1e7).",
+    )
+
+
+def pytest_configure(config):
+    config.stash[_RESULTS] = []
+
+
+def pytest_collect_file(file_path: Path, parent):
+    if not parent.config.getoption("databpy_bench_json", None):
+        return None
+    if file_path.suffix == ".py" and file_path.name.startswith("bench_"):
+        return pytest.Module.from_parent(parent, path=file_path)
+    return None
+
+
+def pytest_collection_modifyitems(config, items):
+    "Deselect benchmarks that are larger than `--databpy-bench-max-elements`."
+    max_elements = config.getoption("databpy_bench_max_elements", 1e7)
+    selected, deselected = [], []
+    for item in items:
+        params = getattr(getattr(item, "callspec", None), "params", {})
+        if params.get("n_elements", 0) > max_elements:
+            deselected.append(item)
+        else:
+            selected.append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@dataclass
+class BenchmarkResult:
+    "Timings of a single benchmark, in seconds per round."
+
+    name: str
+    group: str
+    params: dict[str, str]
+    samples: list[float] = field(default_factory=list)
+    n_elements: int = 0
+    n_bytes: int = 0
+
+    def summary(self) -> dict[str, Any]:
+        samples = np.asarray(self.samples)
+        q1, median, q3 = np.percentile(samples, [25, 50, 75])
+        result = asdict(self)
+        result.update(
+            rounds=len(samples),
+            min=float(samples.min()),
+            max=float(samples.max()),
+            mean=float(samples.mean()),
+            median=float(median),
+            q1=float(q1),
+            q3=float(q3),
+            iqr=float(q3 - q1),
+            # throughput is based on the median so it is as robust as the timings
+            elements_per_second=self.n_elements / median if median else 0.0,
+            bytes_per_second=self.n_bytes / median if median else 0.0,
+        )
+        return result
+
+
+class Benchmark:
+    """
+    Time a function over repeated rounds.
+
+    The function is called once untimed to warm up, then once for each round. A
+    `setup` function is called before every call and its return value is passed as
+    the arguments, so that work like creating the data to operate on isn't timed. A
+    `teardown` function gets the return value of each call, such as to remove the
+    objects it created.
+    """
+
+    def __init__(self, result: BenchmarkResult, rounds: int):
+        self.result = result
+        self.rounds = rounds
+
+    def __call__(
+        self,
+        function: Callable,
+        *args,
+        setup: Callable[[], tuple] | None = None,
+        teardown: Callable[[Any], None] | None = None,
+        n_elements: int = 0,
+        n_bytes: int = 0,
+        rounds: int | None = None,
+    ) -> Any:
+        self.result.n_elements = int(n_elements)
+        self.result.n_bytes = int(n_bytes)
+        value = None
+        for i in range((rounds or self.rounds) + 1):
+            call_args = setup() if setup is not None else args
+            start = time.perf_counter()
+            value = function(*call_args)
+            seconds = time.perf_counter() - start
+            if i > 0:
+                self.result.samples.append(seconds)
+            if teardown is not None:
+                teardown(value)
+        return value
+
+
+@pytest.fixture
+def bench(request):
+    node = request.node
+    params = getattr(getattr(node, "callspec", None), "params", {})
+    result = BenchmarkResult(
+        name=node.nodeid.split("/")[-1],
+        group=node.path.stem.removeprefix("bench_"),
+        params={key: str(value) for key, value in params.items()},
+    )
+    yield Benchmark(result, request.config.getoption("databpy_bench_rounds"))
+    if result.samples:
+        request.config.stash[_RESULTS].append(result)
+
+
+@pytest.fixture(autouse=True)
+def run_around_benchmarks():
+    bpy.ops.wm.read_homefile(app_template="")
+    for tree in bpy.data.node_groups:
+        bpy.data.node_groups.remove(tree)
+
+    yield
+
+    bpy.ops.wm.read_homefile(app_template="")
+
+
+def _commit_info() -> dict[str, Any]:
+    "The commit of the checkout being benchmarked, if it is a git repository."
+    root = Path(__file__).parent
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return {}
+    return {"id": commit, "dirty": bool(status.strip())}
+
+
+def pytest_sessionfinish(session, exitstatus):
+    path = session.config.getoption("databpy_bench_json", None)
+    if not path:
+        return
+    results = session.config.stash[_RESULTS]
+    output = {
+        "format": BENCHMARK_FORMAT,
+        "datetime": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "machine_info": {
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "blender": bpy.app.version_string,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        },
+        "commit_info": _commit_info(),
+        "benchmarks": [result.summary() for result in results],
+    }
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(json.dumps(output, indent=2))
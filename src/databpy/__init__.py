@@ -12,16 +12,40 @@ from .object import (
     LinkedObjectError,
     bdo,
 )
-from .vdb import import_vdb
+from .vdb import import_vdb, import_vdb_sequence, read_vdb_header, scan_vdb_sequence
+from .ids import deduplicate_ids, purge_orphans, DeduplicationStats
 from . import nodes
+from . import stats
 from .nodes import utils
 from .addon import register, unregister
 from .utils import centre, lerp
-from .collection import create_collection, move_to_collection
+from .collection import (
+    CollectionMoveStats,
+    create_collection,
+    ensure_collection_path,
+    ensure_collection_paths,
+    move_to_collection,
+)
 from .array import AttributeArray
+from .table import iter_tables, store_table, table_arrays, table_columns, to_table
+from .snapshot import load_snapshot, save_snapshot
+from .memory import memory_report, scene_memory_report
+from .trajectory import FramePrefetcher, FrameTiming, TrajectoryPlayer
+from .cache import (
+    FrameCache,
+    FrameCacheError,
+    FrameCacheHeader,
+    FrameCacheWriter,
+    read_frame_cache_header,
+)
+from .categorical import (
+    store_categorical_attribute,
+    categorical_attribute,
+)
 from .attribute import (
     named_attribute,
     store_named_attribute,
+    store_named_attributes,
     remove_named_attribute,
     list_attributes,
     evaluate_object,
@@ -49,17 +73,47 @@ __all__ = [
     "LinkedObjectError",
     "bdo",
     "import_vdb",
+    "import_vdb_sequence",
+    "read_vdb_header",
+    "scan_vdb_sequence",
+    "deduplicate_ids",
+    "purge_orphans",
+    "DeduplicationStats",
     "nodes",
+    "stats",
     "utils",
     "register",
     "unregister",
     "centre",
     "lerp",
     "create_collection",
+    "ensure_collection_path",
+    "ensure_collection_paths",
     "move_to_collection",
+    "CollectionMoveStats",
     "AttributeArray",
+    "store_categorical_attribute",
+    "categorical_attribute",
     "named_attribute",
     "store_named_attribute",
+    "store_named_attributes",
+    "store_table",
+    "table_columns",
+    "table_arrays",
+    "to_table",
+    "iter_tables",
+    "save_snapshot",
+    "load_snapshot",
+    "memory_report",
+    "scene_memory_report",
+    "TrajectoryPlayer",
+    "FrameTiming",
+    "FramePrefetcher",
+    "FrameCache",
+    "FrameCacheWriter",
+    "FrameCacheHeader",
+    "FrameCacheError",
+    "read_frame_cache_header",
     "remove_named_attribute",
     "list_attributes",
     "evaluate_object",
@@ -1,5 +1,13 @@
 import bpy
 
+from .attribute import _clear_written_hashes
+from .collection import _clear_collection_index
+from .nodes.utils import _clear_tree_cache
+
+_LOAD_HANDLERS = (_clear_tree_cache, _clear_collection_index, _clear_written_hashes)
+# undoing replaces attribute data without going through databpy
+_UNDO_HANDLERS = (_clear_written_hashes,)
+
 
 def register():
     bpy.types.Object.uuid = bpy.props.StringProperty(
@@ -8,7 +16,21 @@ def register():
         default="",
         options={"HIDDEN"},
     )
+    for handler in _LOAD_HANDLERS:
+        if handler not in bpy.app.handlers.load_post:
+            bpy.app.handlers.load_post.append(handler)
+    for handler in _UNDO_HANDLERS:
+        for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+            if handler not in handlers:
+                handlers.append(handler)
 
 
 def unregister():
     del bpy.types.Object.uuid
+    for handler in _LOAD_HANDLERS:
+        if handler in bpy.app.handlers.load_post:
+            bpy.app.handlers.load_post.remove(handler)
+    for handler in _UNDO_HANDLERS:
+        for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+            if handler in handlers:
+                handlers.remove(handler)
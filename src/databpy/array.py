@@ -21,6 +21,8 @@ class AttributeArray(np.ndarray):
     - This is due to Blender's foreach_set API requiring the complete array
     - For large meshes (10K+ elements), consider batching multiple operations
     - Example: `pos[:, 2] += 1.0` writes all position data, not just Z coordinates
+    - With `skip_unchanged=True` the data is hashed first and the sync is skipped if
+      it matches the previous sync, such as when assigning values that are already set
 
     Supported Types
     ---------------
@@ -40,6 +42,8 @@ class AttributeArray(np.ndarray):
         Name of the attribute being wrapped.
     _root : AttributeArray
         Reference to the root array for handling views/slices correctly.
+    _skip_unchanged : bool
+        Whether syncs are skipped when the data matches the previous sync.
 
     Examples
     --------
@@ -98,7 +102,9 @@ class AttributeArray(np.ndarray):
     named_attribute : Function to read attribute data as regular arrays
     """
 
-    def __new__(cls, obj: bpy.types.Object, name: str) -> "AttributeArray":
+    def __new__(
+        cls, obj: bpy.types.Object, name: str, skip_unchanged: bool = False
+    ) -> "AttributeArray":
         """Create a new AttributeArray that wraps a Blender attribute.
 
         Parameters
@@ -107,6 +113,9 @@ class AttributeArray(np.ndarray):
             The Blender object containing the attribute.
         name : str
             The name of the attribute to wrap.
+        skip_unchanged : bool, optional
+            Whether to skip syncing to Blender when the data matches the previous
+            sync, see `store_named_attribute()`. Default is False.
 
         Returns
         -------
@@ -118,6 +127,7 @@ class AttributeArray(np.ndarray):
         arr._blender_object = obj
         arr._attribute = attr
         arr._attr_name = name
+        arr._skip_unchanged = skip_unchanged
         # Track the root array so that views can sync the full data
         arr._root = arr
         return arr
@@ -130,6 +140,7 @@ class AttributeArray(np.ndarray):
         self._blender_object = getattr(obj, "_blender_object", None)
         self._attribute = getattr(obj, "_attribute", None)
         self._attr_name = getattr(obj, "_attr_name", None)
+        self._skip_unchanged = getattr(obj, "_skip_unchanged", False)
         # Preserve reference to the root array for syncing
         self._root = getattr(obj, "_root", self)
 
@@ -212,6 +223,7 @@ class AttributeArray(np.ndarray):
             name=self._attr_name,
             atype=self._attribute.atype,
             domain=self._attribute.domain.name,
+            skip_unchanged=self._skip_unchanged,
         )
 
     def _inplace_operation_with_sync(self, operation, other):
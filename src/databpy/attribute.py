@@ -6,6 +6,8 @@ from bpy.types import Object
 import numpy as np
 import warnings
 
+from . import stats
+
 COMPATIBLE_TYPES = [bpy.types.Mesh, bpy.types.Curves, bpy.types.PointCloud]
 PossibleAttributeTypes = (
     bpy.types.IntAttribute
@@ -60,6 +62,44 @@ def _check_obj_attributes(obj: Object) -> None:
         )
 
 
+# the hash, type, domain and size of the data last written to an attribute with
+# `skip_unchanged=True`, keyed by the session uid of the data-block and attribute name
+_WRITTEN_HASHES: dict[tuple[int, str], tuple[bytes, str, str, int]] = {}
+
+
+def _forget_written(id_data: bpy.types.ID, name: str) -> None:
+    "Drop the recorded hash of an attribute whose data is written by other means."
+    if _WRITTEN_HASHES:
+        _WRITTEN_HASHES.pop((id_data.session_uid, name), None)
+
+
+@bpy.app.handlers.persistent
+def _clear_written_hashes(*args) -> None:
+    # loading a file or undoing replaces the attribute data the hashes describe
+    _WRITTEN_HASHES.clear()
+
+
+# the collection on each type of geometry which holds the elements of a domain
+_DOMAIN_ELEMENTS = {
+    "MESH": {
+        "POINT": "vertices",
+        "EDGE": "edges",
+        "FACE": "polygons",
+        "CORNER": "loops",
+    },
+    "CURVES": {"POINT": "points", "CURVE": "curves"},
+    "POINTCLOUD": {"POINT": "points"},
+}
+
+
+def _domain_size(obj: Object, domain: DomainNames) -> int:
+    "Number of elements of the domain on the object's geometry, 0 if it has none."
+    elements = _DOMAIN_ELEMENTS.get(obj.type, {}).get(domain)
+    if elements is None:
+        return 0
+    return len(getattr(obj.data, elements))
+
+
 def _check_is_mesh(obj: Object) -> None:
     if not isinstance(obj.data, bpy.types.Mesh):
         raise TypeError("Object must be a mesh to evaluate the modifiers")
@@ -508,6 +548,11 @@ class Attribute:
         """Returns the total number of scalar values in the attribute."""
         return np.prod(self.shape, dtype=int)
 
+    @property
+    def nbytes(self) -> int:
+        """Returns the number of bytes of the attribute data, without reading it."""
+        return int(self.size) * np.dtype(self.dtype).itemsize
+
     def from_array(self, array: np.ndarray) -> None:
         """
         Set the attribute data from a numpy array.
@@ -532,7 +577,12 @@ class Attribute:
                 f"Array shape {array.shape} cannot be reshaped to attribute shape {self.shape}"
             )
 
-        self.attribute.data.foreach_set(self.value_name, np.ravel(array))  # type: ignore
+        _forget_written(self.attribute.id_data, self.attribute.name)
+        data = self.attribute.data
+        with stats.measure(
+            "foreach_set", attribute=self.attribute, n_bytes=array.nbytes
+        ):
+            data.foreach_set(self.value_name, np.ravel(array))  # type: ignore
 
     def as_array(self) -> np.ndarray:
         """
@@ -544,10 +594,13 @@ class Attribute:
             Array containing the attribute data with appropriate shape and dtype.
         """
 
-        # initialize empty 1D array that is needed to then be filled with values
-        # from the Blender attribute
-        array = np.zeros(self.size, dtype=self.dtype)
-        self.attribute.data.foreach_get(self.value_name, array)  # type: ignore
+        # allocate the 1D array that `foreach_get` fills with every value, so it
+        # doesn't need to be initialised first
+        array = np.empty(self.size, dtype=self.dtype)
+        with stats.measure(
+            "foreach_get", attribute=self.attribute, n_bytes=array.nbytes
+        ):
+            self.attribute.data.foreach_get(self.value_name, array)  # type: ignore
 
         # if the attribute has more than one dimension reshape the array before returning
         if self.is_1d:
@@ -601,6 +654,7 @@ def store_named_attribute(
     atype: AttributeTypeNames | AttributeTypes | None = None,
     domain: DomainNames | AttributeDomains = AttributeDomains.POINT,
     overwrite: bool = True,
+    skip_unchanged: bool = False,
 ) -> bpy.types.Attribute:
     """
     Adds and sets the values of an attribute on the object.
@@ -619,6 +673,14 @@ def store_named_attribute(
         The domain of the attribute, by default 'POINT'.
     overwrite : bool, optional
         Whether to overwrite existing attribute, by default True.
+    skip_unchanged : bool, optional
+        Whether to hash the data with `utils.content_hash()` and skip writing it and
+        refreshing the object if it matches the data of the previous write to the
+        attribute that also used `skip_unchanged`. Hashing reads all of the data, so
+        it pays off when the skipped refresh would re-evaluate expensive modifiers or
+        node trees, and is much cheaper with `xxhash` installed. Only changes made
+        through databpy are seen, so don't use it for attributes that are also edited
+        by hand or by other add-ons. Default is False.
 
     Returns
     -------
@@ -650,6 +712,140 @@ def store_named_attribute(
     ```
     """
 
+    if skip_unchanged and overwrite:
+        attribute, written = _write_named_attribute_if_changed(
+            obj, data, name, atype, domain
+        )
+        if not written:
+            return attribute
+    else:
+        attribute = _write_named_attribute(obj, data, name, atype, domain, overwrite)
+    _refresh_object_data(obj)
+    return attribute
+
+
+def _write_named_attribute_if_changed(
+    obj: bpy.types.Object,
+    data: np.ndarray,
+    name: str,
+    atype: AttributeTypeNames | AttributeTypes | None,
+    domain: DomainNames | AttributeDomains,
+) -> tuple[bpy.types.Attribute, bool]:
+    "Write the attribute unless the data matches the last write, and whether it did."
+    # imported here as loading `databpy.utils` with this module would let the package
+    # bind `databpy.utils` to `databpy.nodes.utils` instead
+    from .utils import content_hash
+
+    atype = _match_atype(atype, data)
+    domain = _match_domain(domain)
+    key = (obj.data.session_uid, name)  # type: ignore
+    digest = content_hash(data)
+
+    attribute = obj.data.attributes.get(name)  # type: ignore
+    if attribute is not None:
+        record = (digest, atype.value.type_name, domain, len(attribute.data))
+        if _WRITTEN_HASHES.get(key) == record:
+            return attribute, False
+
+    attribute = _write_named_attribute(obj, data, name, atype, domain, True)
+    _WRITTEN_HASHES[key] = (digest, atype.value.type_name, domain, len(attribute.data))
+    return attribute, True
+
+
+def store_named_attributes(
+    obj: bpy.types.Object,
+    attributes: dict[str, np.ndarray],
+    atypes: dict[str, AttributeTypeNames | AttributeTypes] | None = None,
+    domain: DomainNames | AttributeDomains = AttributeDomains.POINT,
+    overwrite: bool = True,
+    skip_unchanged: bool = False,
+) -> list[bpy.types.Attribute]:
+    """
+    Adds and sets the values of several attributes on the object in one pass.
+
+    This behaves like calling `store_named_attribute()` for each of the attributes,
+    but the object data is only refreshed once after all of them have been written.
+
+    Parameters
+    ----------
+    obj : bpy.types.Object
+        The Blender object.
+    attributes : dict[str, np.ndarray]
+        The attribute data for each attribute name.
+    atypes : dict[str, str or AttributeTypes] or None, optional
+        The attribute type to store each attribute as. Attributes without a type are
+        inferred from their data.
+    domain : str or AttributeDomains, optional
+        The domain of the attributes, by default 'POINT'.
+    overwrite : bool, optional
+        Whether to overwrite existing attributes, by default True.
+    skip_unchanged : bool, optional
+        Whether to skip writing attributes whose data matches their previous write,
+        see `store_named_attribute()`. The object is only refreshed if at least one
+        attribute was written. Default is False.
+
+    Returns
+    -------
+    list[bpy.types.Attribute]
+        The added or modified attributes, in the same order as `attributes`.
+
+    Raises
+    ------
+    ValueError
+        If an atype string doesn't match available types.
+    NamedAttributeError
+        If data length doesn't match domain size.
+
+    Examples
+    --------
+    ```python
+    import numpy as np
+    import databpy as db
+
+    bob = db.create_bob(np.random.rand(100, 3))
+    db.store_named_attributes(
+        bob.object,
+        {"radius": np.random.rand(100), "chain_id": np.zeros(100, dtype=np.int32)},
+    )
+    ```
+    """
+    atypes = atypes or {}
+    if not attributes:
+        return []
+
+    written = []
+    changed = False
+    try:
+        for name, data in attributes.items():
+            if skip_unchanged and overwrite:
+                attribute, was_written = _write_named_attribute_if_changed(
+                    obj, data, name, atypes.get(name), domain
+                )
+                changed |= was_written
+            else:
+                attribute = _write_named_attribute(
+                    obj, data, name, atypes.get(name), domain, overwrite
+                )
+                changed = True
+            written.append(attribute.name)
+    finally:
+        if changed:
+            _refresh_object_data(obj)
+
+    # adding attributes can reallocate the storage of earlier ones, so look them up
+    # again rather than returning references that might be stale
+    return [obj.data.attributes[name] for name in written]  # type: ignore
+
+
+def _write_named_attribute(
+    obj: bpy.types.Object,
+    data: np.ndarray,
+    name: str,
+    atype: AttributeTypeNames | AttributeTypes | None,
+    domain: DomainNames | AttributeDomains,
+    overwrite: bool,
+) -> bpy.types.Attribute:
+    "Create or fetch the attribute and set its values, without refreshing the data."
     atype = _match_atype(atype, data)
     domain = _match_domain(domain)
 
@@ -716,27 +912,36 @@ def store_named_attribute(
 
     # the 'foreach_set' requires a 1D array, regardless of the shape of the attribute
     # so we have to flatten it first
-    attribute.data.foreach_set(atype.value.value_name, np.ravel(data))  # type: ignore
+    _forget_written(obj_data, attribute.name)  # type: ignore
+    values = np.ravel(data)
+    with stats.measure("foreach_set", obj, attribute, n_bytes=data.nbytes):
+        attribute.data.foreach_set(atype.value.value_name, values)  # type: ignore
+
+    return attribute
+
+
+def _refresh_object_data(obj: bpy.types.Object) -> None:
+    "Make Blender pick up attribute values that were written with `foreach_set`."
+    obj_data = obj.data
 
     # The updating of data doesn't work 100% of the time (see:
-    # https://projects.blender.org/blender/blender/issues/118507) so this resetting of a
-    # single vertex is the current fix. Not great as I can see it breaking when we are
-    # missing a vertex - but for now we shouldn't be dealing with any situations where this
-    # is the case For now we will set a single vert to it's own position, which triggers a
-    # proper refresh of the object data.
-    try:
-        obj_data.vertices[0].co = obj.data.vertices[0].co  # type: ignore
-    except AttributeError:
-        # For non-mesh objects (Curves, PointCloud), try update() if it exists
+    # https://projects.blender.org/blender/blender/issues/118507) so this resetting of
+    # a single vertex is the current fix. Not great as I can see it breaking when we
+    # are missing a vertex - but for now we shouldn't be dealing with any situations
+    # where this is the case For now we will set a single vert to it's own position,
+    # which triggers a proper refresh of the object data.
+    with stats.measure("refresh", obj):
         try:
-            obj_data.attributes["position"].data[0].vector = (  # type: ignore
-                obj_data.attributes["position"].data[0].vector  # type: ignore
-            )
+            obj_data.vertices[0].co = obj.data.vertices[0].co  # type: ignore
         except AttributeError:
-            if hasattr(obj.data, "update"):
-                obj_data.update()  # type: ignore
-
-    return attribute
+            # For non-mesh objects (Curves, PointCloud), try update() if it exists
+            try:
+                obj_data.attributes["position"].data[0].vector = (  # type: ignore
+                    obj_data.attributes["position"].data[0].vector  # type: ignore
+                )
+            except AttributeError:
+                if hasattr(obj.data, "update"):
+                    obj_data.update()  # type: ignore
 
 
 def evaluate_object(
@@ -774,8 +979,10 @@ def evaluate_object(
     if context is None:
         context = bpy.context
     _check_is_mesh(obj)
-    obj.update_tag()
-    return obj.evaluated_get(context.evaluated_depsgraph_get())  # type: ignore
+    with stats.measure("evaluate", obj):
+        obj.update_tag()
+        evaluated = obj.evaluated_get(context.evaluated_depsgraph_get())
+    return evaluated  # type: ignore
 
 
 def named_attribute(
@@ -867,6 +1074,7 @@ def remove_named_attribute(obj: bpy.types.Object, name: str):
     try:
         attr = obj.data.attributes[name]  # type: ignore
         obj.data.attributes.remove(attr)  # type: ignore
+        _forget_written(obj.data, name)  # type: ignore
     except KeyError:
         raise NamedAttributeError(
             f"The selected attribute '{name}' does not exist on the object"
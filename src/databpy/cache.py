@@ -0,0 +1,365 @@
+import struct
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+import numpy as np
+
+from .attribute import (
+    AttributeDomains,
+    AttributeMismatchError,
+    AttributeTypeNames,
+    AttributeTypes,
+    DomainNames,
+    _match_atype,
+    _match_domain,
+)
+
+# suffix of the file that stores the frames of a single attribute
+CACHE_SUFFIX = ".frames"
+CACHE_MAGIC = b"DBPYFRMS"
+CACHE_VERSION = 1
+
+# magic, version, attribute type name, domain name, n_frames, n_elements and padding
+# so that the frame data which follows the header starts 64 byte aligned
+_HEADER = struct.Struct("<8sI20s12sQQ4x")
+
+
+class FrameCacheError(Exception):
+    """
+    Error raised when a frame cache file can't be read or appended to.
+
+    Parameters
+    ----------
+    message : str
+        The error message describing what is wrong with the cache.
+    """
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+
+@dataclass
+class FrameCacheHeader:
+    """
+    The header at the start of each frame cache file.
+
+    Frames follow the header back to back, each holding `n_elements` values of the
+    attribute type, so frame `i` starts at `HEADER_SIZE + i * frame_nbytes`.
+
+    Attributes
+    ----------
+    atype : AttributeTypes
+        The type of the attribute, which determines the dtype and dimensions.
+    domain : str
+        The domain of the attribute.
+    n_frames : int
+        Number of complete frames in the file.
+    n_elements : int
+        Number of elements of the domain in each frame.
+    """
+
+    atype: AttributeTypes
+    domain: DomainNames
+    n_frames: int
+    n_elements: int
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(self.atype.value.dtype)
+
+    @property
+    def frame_shape(self) -> tuple[int, ...]:
+        "Shape of a single frame, matching the arrays of `named_attribute()`."
+        dimensions = self.atype.value.dimensions
+        if dimensions == (1,):
+            return (self.n_elements,)
+        return (self.n_elements, *dimensions)
+
+    @property
+    def frame_nbytes(self) -> int:
+        return int(np.prod(self.frame_shape)) * self.dtype.itemsize
+
+    def pack(self) -> bytes:
+        return _HEADER.pack(
+            CACHE_MAGIC,
+            CACHE_VERSION,
+            self.atype.value.type_name.encode(),
+            self.domain.encode(),
+            self.n_frames,
+            self.n_elements,
+        )
+
+    @classmethod
+    def unpack(cls, buffer: bytes) -> "FrameCacheHeader":
+        if len(buffer) < _HEADER.size:
+            raise FrameCacheError("Not a frame cache file, the header is truncated")
+        magic, version, type_name, domain, n_frames, n_elements = _HEADER.unpack(
+            buffer[: _HEADER.size]
+        )
+        if magic != CACHE_MAGIC:
+            raise FrameCacheError("Not a frame cache file")
+        if version > CACHE_VERSION:
+            raise FrameCacheError(f"Unsupported frame cache version {version}")
+        try:
+            atype = AttributeTypes[type_name.rstrip(b"\0").decode()]
+        except KeyError:
+            raise FrameCacheError(f"Unknown attribute type {type_name!r}")
+        return cls(
+            atype=atype,
+            domain=domain.rstrip(b"\0").decode(),  # type: ignore
+            n_frames=n_frames,
+            n_elements=n_elements,
+        )
+
+
+HEADER_SIZE = _HEADER.size
+
+
+def _cache_path(directory: Path, name: str) -> Path:
+    if not name or "/" in name or "\\" in name:
+        raise ValueError(f"Can't use '{name}' as the name of a cached attribute")
+    return directory / f"{name}{CACHE_SUFFIX}"
+
+
+def read_frame_cache_header(path: str | Path) -> FrameCacheHeader:
+    """
+    Read the header of a single frame cache file.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path to the `.frames` file of an attribute.
+
+    Returns
+    -------
+    FrameCacheHeader
+        The type, domain and size of the cached attribute.
+
+    Raises
+    ------
+    FrameCacheError
+        If the file isn't a frame cache file.
+    """
+    with open(path, "rb") as f:
+        return FrameCacheHeader.unpack(f.read(HEADER_SIZE))
+
+
+class FrameCacheWriter:
+    """
+    Append frames of attribute data to an on-disk frame cache.
+
+    Each attribute is written to its own file in the directory, made up of a small
+    header followed by fixed size frames. Frames are appended while a simulation runs
+    and the frame count in the header is only updated once a frame has been written
+    completely, so a `FrameCache` reading the directory at the same time never sees a
+    partial frame. Opening a directory that already holds a cache continues appending
+    to its files.
+
+    Parameters
+    ----------
+    directory : str | Path
+        The directory to write the cache files to, created if it doesn't exist.
+    domain : str or AttributeDomains, optional
+        The domain recorded for newly cached attributes. Default is "POINT".
+
+    Examples
+    --------
+    ```python
+    import numpy as np
+    import databpy as db
+
+    with db.FrameCacheWriter("cache") as writer:
+        for step in range(100):
+            positions = np.random.rand(1000, 3)
+            writer.append({"position": positions})
+
+    cache = db.FrameCache("cache")
+    cache["position"][42]  # a view of frame 42 without reading the others
+    ```
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        domain: DomainNames | AttributeDomains = AttributeDomains.POINT,
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.domain = _match_domain(domain)
+        self._files: dict[str, BinaryIO] = {}
+        self._headers: dict[str, FrameCacheHeader] = {}
+
+    def _open(
+        self, name: str, data: np.ndarray, atype: AttributeTypes | None
+    ) -> FrameCacheHeader:
+        path = _cache_path(self.directory, name)
+        if path.exists():
+            f = open(path, "r+b")
+            header = FrameCacheHeader.unpack(f.read(HEADER_SIZE))
+            # drop any partial frame left behind by an interrupted write
+            f.truncate(HEADER_SIZE + header.n_frames * header.frame_nbytes)
+        else:
+            atype = _match_atype(atype, data)
+            n_elements = data.size // int(np.prod(atype.value.dimensions))
+            header = FrameCacheHeader(atype, self.domain, 0, n_elements)
+            f = open(path, "w+b")
+            f.write(header.pack())
+        self._files[name] = f
+        self._headers[name] = header
+        return header
+
+    def append(
+        self,
+        frame: Mapping[str, np.ndarray],
+        atypes: Mapping[str, AttributeTypeNames | AttributeTypes] | None = None,
+    ) -> None:
+        """
+        Append the data of a frame for each of the attributes.
+
+        Attributes don't have to be given for every frame, so static attributes can be
+        cached only once.
+
+        Parameters
+        ----------
+        frame : Mapping[str, np.ndarray]
+            The data of the frame for each attribute name.
+        atypes : Mapping[str, str or AttributeTypes] | None, optional
+            The type of newly cached attributes. Attributes without a type are inferred
+            from their data.
+
+        Raises
+        ------
+        AttributeMismatchError
+            If the data doesn't match the size of the attribute's earlier frames.
+        """
+        atypes = atypes or {}
+        for name, data in frame.items():
+            data = np.asarray(data)
+            header = self._headers.get(name)
+            if header is None:
+                atype = atypes.get(name)
+                if isinstance(atype, str):
+                    atype = AttributeTypes[atype]
+                header = self._open(name, data, atype)
+
+            if data.size * header.dtype.itemsize != header.frame_nbytes:
+                raise AttributeMismatchError(
+                    f"Frame data for '{name}' has shape {data.shape} which doesn't "
+                    f"match the cached frame shape {header.frame_shape}"
+                )
+            data = np.ascontiguousarray(data, dtype=header.dtype)
+
+            f = self._files[name]
+            f.seek(HEADER_SIZE + header.n_frames * header.frame_nbytes)
+            f.write(memoryview(data).cast("B"))
+            header.n_frames += 1
+            f.seek(0)
+            f.write(header.pack())
+            f.flush()
+
+    def close(self) -> None:
+        "Close the cache files."
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+        self._headers.clear()
+
+    def __enter__(self) -> "FrameCacheWriter":
+        return self
+
+    def __exit__(self, type, value, traceback) -> None:
+        self.close()
+
+
+class FrameCache(Mapping):
+    """
+    Read the frames of an on-disk frame cache as memory-mapped arrays.
+
+    The cache maps each attribute name to an array of shape `(n_frames, n_elements,
+    *dimensions)` backed by its file, so indexing a frame is an offset into the mapping
+    and returns a view without reading or copying other frames. The cost of reading a
+    frame doesn't depend on the length of the trajectory.
+
+    As a mapping of attribute names to frame arrays the cache can be given straight to
+    a `TrajectoryPlayer` as its sources.
+
+    Parameters
+    ----------
+    directory : str | Path
+        The directory written by a `FrameCacheWriter`.
+
+    Examples
+    --------
+    ```python
+    import databpy as db
+
+    cache = db.FrameCache("cache")
+    bob = db.create_bob(cache["position"][0])
+    player = db.TrajectoryPlayer(bob, cache)
+    player.register()
+    ```
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        if not self.directory.is_dir():
+            raise FileNotFoundError(f"No frame cache at {self.directory}")
+        self.headers: dict[str, FrameCacheHeader] = {}
+        self._arrays: dict[str, np.ndarray] = {}
+        self.refresh()
+
+    def _map(self, name: str, header: FrameCacheHeader) -> np.ndarray:
+        shape = (header.n_frames, *header.frame_shape)
+        if header.n_frames == 0 or header.frame_nbytes == 0:
+            return np.empty(shape, dtype=header.dtype)
+        return np.memmap(
+            _cache_path(self.directory, name),
+            dtype=header.dtype,
+            mode="r",
+            offset=HEADER_SIZE,
+            shape=shape,
+        )
+
+    def refresh(self) -> None:
+        """
+        Pick up new attributes and frames that were appended since the cache was
+        opened. Attributes whose frame count didn't change keep their mapping.
+        """
+        for path in sorted(self.directory.glob(f"*{CACHE_SUFFIX}")):
+            name = path.name.removesuffix(CACHE_SUFFIX)
+            header = read_frame_cache_header(path)
+            previous = self.headers.get(name)
+            if previous is not None and previous.n_frames == header.n_frames:
+                continue
+            self.headers[name] = header
+            self._arrays[name] = self._map(name, header)
+
+    def n_frames(self, name: str | None = None) -> int:
+        """
+        Number of cached frames of an attribute, or the fewest of any attribute.
+
+        Parameters
+        ----------
+        name : str | None, optional
+            The attribute to count the frames of. Defaults to every attribute.
+
+        Returns
+        -------
+        int
+            The number of frames.
+        """
+        if name is not None:
+            return self.headers[name].n_frames
+        return min((h.n_frames for h in self.headers.values()), default=0)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._arrays[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._arrays)
+
+    def __len__(self) -> int:
+        return len(self._arrays)
@@ -0,0 +1,159 @@
+from typing import Iterable
+
+import bpy
+import numpy as np
+
+from .attribute import (
+    AttributeDomains,
+    AttributeTypes,
+    DomainNames,
+    NamedAttributeError,
+    _check_obj_attributes,
+    named_attribute,
+    store_named_attribute,
+)
+from .nodes.generating import custom_string_iswitch
+
+# ID property on the object data which stores the categories for each attribute
+CATEGORIES_PROP = "_databpy_categories"
+
+# INT8 attributes store values from -128 to 127, so codes 0-127 fit
+_INT8_MAX_CATEGORIES = 128
+
+
+def store_categorical_attribute(
+    obj: bpy.types.Object,
+    strings: Iterable[str] | np.ndarray,
+    name: str,
+    domain: DomainNames | AttributeDomains = AttributeDomains.POINT,
+    tree_name: str | None = None,
+) -> bpy.types.NodeTree:
+    """
+    Store string values as an integer attribute, with a node tree to look them up.
+
+    The strings are encoded as integer codes into the sorted unique values, which are
+    stored as an `INT8` attribute if there are few enough categories and `INT`
+    otherwise, so each element takes 1 or 4 bytes. The categories are stored on the
+    object data for reading the values back with `categorical_attribute()`, and a
+    `custom_string_iswitch()` node tree is created (or reused) to turn the codes back
+    into strings inside of Geometry Nodes.
+
+    Parameters
+    ----------
+    obj : bpy.types.Object
+        The Blender object.
+    strings : Iterable[str] | np.ndarray
+        One string for each element of the domain.
+    name : str
+        The name of the integer attribute to store the codes in.
+    domain : str or AttributeDomains, optional
+        The domain of the attribute, by default 'POINT'.
+    tree_name : str | None, optional
+        Name of the lookup node tree if a new one is created. Defaults to `name`.
+
+    Returns
+    -------
+    bpy.types.NodeTree
+        The node tree that returns the string for a given code.
+
+    Examples
+    --------
+    ```python
+    import numpy as np
+    import databpy as db
+
+    bob = db.create_bob(np.random.rand(4, 3))
+    tree = db.store_categorical_attribute(bob.object, ["A", "B", "A", "C"], "chain_id")
+    db.named_attribute(bob.object, "chain_id")  # array([0, 1, 0, 2], dtype=int8)
+    db.categorical_attribute(bob.object, "chain_id")  # array(['A', 'B', 'A', 'C'])
+    ```
+    """
+    _check_obj_attributes(obj)
+    values, codes, atype = _encode_categorical(obj, strings, name)
+    store_named_attribute(obj, codes, name=name, atype=atype, domain=domain)
+    return _store_categories(obj, name, values, tree_name)
+
+
+def _encode_categorical(
+    obj: bpy.types.Object, strings: Iterable[str] | np.ndarray, name: str
+) -> tuple[list[str], np.ndarray, AttributeTypes]:
+    "Categories, integer codes and attribute type for storing the strings."
+    unique, codes = np.unique(np.asarray(strings), return_inverse=True)
+
+    if len(unique) <= _INT8_MAX_CATEGORIES:
+        atype = AttributeTypes.INT8
+    else:
+        atype = AttributeTypes.INT
+
+    # the number of categories might have changed since the attribute was last stored
+    # in which case the type can differ, so remove the old attribute first
+    attribute = obj.data.attributes.get(name)  # type: ignore
+    if attribute is not None and attribute.data_type != atype.value.type_name:
+        obj.data.attributes.remove(attribute)  # type: ignore
+
+    return unique.tolist(), codes.astype(atype.value.dtype), atype
+
+
+def _store_categories(
+    obj: bpy.types.Object, name: str, values: list[str], tree_name: str | None
+) -> bpy.types.NodeTree:
+    "Record the categories of an attribute and return its lookup node tree."
+    if CATEGORIES_PROP not in obj.data:  # type: ignore
+        obj.data[CATEGORIES_PROP] = {}  # type: ignore
+    obj.data[CATEGORIES_PROP][name] = values  # type: ignore
+
+    return custom_string_iswitch(name=tree_name or name, values=values, attr_name=name)
+
+
+def categories(obj: bpy.types.Object, name: str) -> np.ndarray:
+    """
+    Get the categories of a stored categorical attribute.
+
+    Parameters
+    ----------
+    obj : bpy.types.Object
+        The Blender object.
+    name : str
+        The name of the categorical attribute.
+
+    Returns
+    -------
+    np.ndarray
+        The unique strings, where the codes stored in the attribute index this array.
+
+    Raises
+    ------
+    NamedAttributeError
+        If no categorical attribute with that name was stored on the object.
+    """
+    try:
+        return np.asarray(obj.data[CATEGORIES_PROP][name])  # type: ignore
+    except KeyError:
+        raise NamedAttributeError(
+            f"The attribute '{name}' was not stored as a categorical attribute"
+        )
+
+
+def categorical_attribute(
+    obj: bpy.types.Object, name: str, evaluate: bool = False
+) -> np.ndarray:
+    """
+    Read the strings of a categorical attribute back from the object.
+
+    Parameters
+    ----------
+    obj : bpy.types.Object
+        The Blender object.
+    name : str
+        The name of the categorical attribute.
+    evaluate : bool, optional
+        Whether to evaluate modifiers before reading the codes, by default False.
+
+    Returns
+    -------
+    np.ndarray
+        A string array with one value for each element of the attribute's domain.
+    """
+    values = categories(obj, name)
+    codes = named_attribute(obj, name, evaluate=evaluate)
+    return values[codes]
@@ -1,6 +1,80 @@
+import re
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
 import bpy
 from bpy.types import Collection
 
+from .ids import DUP_SUFFIX
+
+
+class CollectionIndex:
+    """
+    Name to collection lookup for the collections in the file.
+
+    Looking up a collection by name in `bpy.data.collections` searches every
+    collection, which adds up when creating thousands of collections. The index is
+    built once and each entry is checked to still be valid when used. It is cleared
+    whenever a file is loaded, as the collections it refers to no longer exist.
+    """
+
+    def __init__(self) -> None:
+        self._index: dict[str, Collection] = {}
+        self._scanned = False
+
+    def _scan(self) -> None:
+        self._index = {coll.name: coll for coll in bpy.data.collections}
+        self._scanned = True
+
+    def get(self, name: str) -> Collection | None:
+        "Return the indexed collection with the given name, or None."
+        if not self._scanned:
+            self._scan()
+        coll = self._index.get(name)
+        if coll is None:
+            return None
+        try:
+            if coll.name == name:
+                return coll
+        except ReferenceError:
+            pass
+        # the collection was renamed or removed since it was indexed
+        del self._index[name]
+        return None
+
+    def add(self, coll: Collection) -> None:
+        self._index[coll.name] = coll
+
+    def clear(self) -> None:
+        "Clear the index, which is rebuilt from the file on the next lookup."
+        self._index.clear()
+        self._scanned = False
+
+
+COLLECTION_INDEX = CollectionIndex()
+
+
+@bpy.app.handlers.persistent
+def _clear_collection_index(*args) -> None:
+    # the indexed collections belong to the previous file, so rebuild after loading
+    COLLECTION_INDEX.clear()
+
+
+def _get_or_new_collection(name: str) -> tuple[Collection, bool]:
+    "Return the collection with the given name and whether it was newly created."
+    coll = COLLECTION_INDEX.get(name)
+    if coll is None:
+        # created or renamed outside of databpy since the index was built
+        coll = bpy.data.collections.get(name)
+    if coll is not None:
+        COLLECTION_INDEX.add(coll)
+        return coll, False
+
+    # names that are too long are shortened by Blender, so accept the new name
+    coll = bpy.data.collections.new(name)
+    COLLECTION_INDEX.add(coll)
+    return coll, True
+
 
 def _get_collection(name: str) -> Collection:
     """
@@ -16,11 +90,8 @@ def _get_collection(name: str) -> Collection:
     Collection
         The retrieved or created Blender collection
     """
-    if name in bpy.data.collections:
-        return bpy.data.collections[name]
-
-    coll = bpy.data.collections.new(name)
-    if bpy.context.scene:
+    coll, created = _get_or_new_collection(name)
+    if created and bpy.context.scene:
         bpy.context.scene.collection.children.link(coll)
     return coll
 
@@ -73,33 +144,256 @@ def create_collection(
     return coll
 
 
+def _split_path(path: str | Sequence[str], sep: str, parent_name: str) -> list[str]:
+    names = path.split(sep) if isinstance(path, str) else list(path)
+    names = [name for name in names if name]
+    if not names:
+        raise ValueError(f"Collection path is empty: {path!r}")
+    # a collection can't be nested inside of itself
+    seen = {parent_name}
+    for name in names:
+        if name in seen:
+            raise ValueError(
+                f"Collection path {path!r} would nest '{name}' inside of itself"
+            )
+        seen.add(name)
+    return names
+
+
+def _parents() -> dict[str, list[Collection]]:
+    "The collections each collection is a child of, by the name of the child."
+    parents: dict[str, list[Collection]] = {}
+    for coll in _all_collections():
+        for child in coll.children:
+            parents.setdefault(child.name, []).append(coll)
+    return parents
+
+
+def _find_child(parent: Collection, name: str) -> Collection | None:
+    "The child called `name`, or made unique from it such as `name.001`."
+    child = parent.children.get(name)
+    if child is not None:
+        return child
+    pattern = re.compile(re.escape(name) + DUP_SUFFIX)
+    matches = sorted(c.name for c in parent.children if pattern.match(c.name))
+    return parent.children[matches[0]] if matches else None
+
+
+def _path_child(
+    parent: Collection, name: str, parents: dict[str, list[Collection]]
+) -> Collection:
+    "Get or create the collection for one level of a path under the parent."
+    coll = _find_child(parent, name)
+    if coll is not None:
+        return coll
+
+    coll, created = _get_or_new_collection(name)
+    if not created and (parents.get(coll.name) or parent in coll.children_recursive):
+        # the name is already used somewhere else in the hierarchy, and collection
+        # names are shared by the whole file, so give this path its own collection
+        coll = bpy.data.collections.new(name)
+        COLLECTION_INDEX.add(coll)
+    parent.children.link(coll)
+    parents.setdefault(coll.name, []).append(parent)
+    return coll
+
+
+def ensure_collection_paths(
+    paths: Iterable[str | Sequence[str]],
+    parent: Collection | str | None = None,
+    sep: str = "/",
+) -> list[Collection]:
+    """
+    Create or retrieve the collection hierarchies for many paths in one pass.
+
+    Every collection along each path is looked up among the children of the
+    previous one, or created and linked to it. Paths that share a prefix, such as
+    "Project/Chains/A" and "Project/Chains/B", only resolve the shared part once.
+
+    Collection names are unique within a file, so an existing collection is only
+    reused for a level of a path when it is already a child of the previous level or
+    isn't linked anywhere. Otherwise a new collection is created which Blender makes
+    unique, such that "Mol1/Chains/A" and "Mol2/Chains/A" each get their own "Chains"
+    and "A" collections, the second ones being named "Chains.001" and "A.001". These
+    are found again by their path on later calls.
+
+    Parameters
+    ----------
+    paths : Iterable[str | Sequence[str]]
+        Paths of collection names, either as strings separated by `sep` or as
+        sequences of names.
+    parent : Collection | str | None, optional
+        The collection to create the first level of each path in. If None, the
+        scene's root collection is used. Default is None.
+    sep : str, optional
+        Separator between the names of a path given as a string. Default is "/".
+
+    Returns
+    -------
+    list[Collection]
+        The last collection of each path, in the same order as `paths`.
+
+    Raises
+    ------
+    ValueError
+        If a path doesn't contain any names or contains the same name more than once,
+        including the name of `parent`, as a collection can't be nested inside of
+        itself. All paths are checked before any collection is created.
+    """
+    if isinstance(parent, str):
+        parent = _get_collection(parent)
+    scene_root = bpy.context.scene.collection if bpy.context.scene else None
+    if parent is None:
+        parent = scene_root
+    # the root collection of a scene is never a child, so its name can't clash
+    parent_name = parent.name if parent is not None and parent != scene_root else ""
+    split = [_split_path(path, sep, parent_name) for path in paths]
+
+    parents = _parents()
+    resolved: dict[tuple[str, ...], Collection] = {}
+    leaves = []
+    for names in split:
+        current = parent
+        for depth in range(1, len(names) + 1):
+            key = tuple(names[:depth])
+            coll = resolved.get(key)
+            if coll is None:
+                if current is None:
+                    coll, _ = _get_or_new_collection(names[depth - 1])
+                else:
+                    coll = _path_child(current, names[depth - 1], parents)
+                resolved[key] = coll
+            current = coll
+        leaves.append(current)
+
+    return leaves
+
+
+def ensure_collection_path(
+    path: str | Sequence[str],
+    parent: Collection | str | None = None,
+    sep: str = "/",
+) -> Collection:
+    """
+    Create or retrieve a hierarchy of nested collections from a path.
+
+    Parameters
+    ----------
+    path : str | Sequence[str]
+        A path of collection names such as "Project/Molecule/Chains/A", or a sequence
+        of the names.
+    parent : Collection | str | None, optional
+        The collection to create the first level of the path in. If None, the scene's
+        root collection is used. Default is None.
+    sep : str, optional
+        Separator between the names of a path given as a string. Default is "/".
+
+    Returns
+    -------
+    Collection
+        The last collection of the path.
+
+    Raises
+    ------
+    ValueError
+        If the path doesn't contain any names.
+
+    Examples
+    --------
+    ```python
+    import databpy as db
+
+    chain = db.ensure_collection_path("Project/Molecule/Chains/A")
+    chain.name  # "A", a child of "Chains" which is a child of "Molecule"
+    ```
+    """
+    return ensure_collection_paths([path], parent=parent, sep=sep)[0]
+
+
+def _all_collections() -> list[Collection]:
+    "All collections in the file, including the root collection of each scene."
+    return [*bpy.data.collections, *(scene.collection for scene in bpy.data.scenes)]
+
+
+@dataclass
+class CollectionMoveStats:
+    """
+    Number of link operations performed by `move_to_collection()`.
+
+    Attributes
+    ----------
+    n_linked : int
+        Number of objects that were linked into the target collection.
+    n_unlinked : int
+        Number of times an object was unlinked from a collection.
+    n_skipped : int
+        Number of objects that were already only in the target collection.
+    """
+
+    n_linked: int = 0
+    n_unlinked: int = 0
+    n_skipped: int = 0
+
+
 def move_to_collection(
-    objs: bpy.types.Object | list[bpy.types.Object],
+    objs: bpy.types.Object | Iterable[bpy.types.Object],
     target_collection: bpy.types.Collection,
-) -> None:
+) -> CollectionMoveStats:
     """
     Move one or many objects into a target collection.
 
+    Only the minimal set of operations is performed: objects already in the target
+    are not relinked, objects only in the target are skipped entirely and the
+    unlinks are grouped per source collection.
+
     Parameters
     ----------
-    objs : bpy.types.Object or list[bpy.types.Object]
-        A single object or list of objects to move.
+    objs : bpy.types.Object or Iterable[bpy.types.Object]
+        A single object or the objects to move.
     target_collection : bpy.types.Collection
         The collection to move the objects into.
 
     Returns
     -------
-    None
-        This function does not return a value.
+    CollectionMoveStats
+        The number of link and unlink operations and skipped objects.
     """
     # Allow single object
     if isinstance(objs, bpy.types.Object):
         objs = [objs]
 
+    # an object listed twice would otherwise be linked twice
+    objs = dict.fromkeys(objs)
+    stats = CollectionMoveStats()
+
+    # `Object.users_collection` searches every collection in the file on each access,
+    # so instead go over the objects of each collection once and group the unlinks
+    # by the collection they come from
+    in_target = set(target_collection.objects) & objs.keys()
+    n_other: dict[bpy.types.Object, int] = {}
+    to_unlink: dict[Collection, list[bpy.types.Object]] = {}
+    for coll in _all_collections():
+        if coll == target_collection:
+            continue
+        coll_objs = [obj for obj in coll.objects if obj in objs]
+        if coll_objs:
+            to_unlink[coll] = coll_objs
+            for obj in coll_objs:
+                n_other[obj] = n_other.get(obj, 0) + 1
+
+    for coll, coll_objs in to_unlink.items():
+        unlink = coll.objects.unlink
+        for obj in coll_objs:
+            unlink(obj)
+        stats.n_unlinked += len(coll_objs)
+
+    link = target_collection.objects.link
     for obj in objs:
-        # Unlink from all current collections
-        for c in obj.users_collection:
-            c.objects.unlink(obj)
+        if obj in in_target:
+            if obj not in n_other:
+                stats.n_skipped += 1
+            continue
+        link(obj)
+        stats.n_linked += 1
 
-        # Link to target collection
-        target_collection.objects.link(obj)
+    return stats
@@ -0,0 +1,240 @@
+import re
+from dataclasses import dataclass, field
+from typing import Iterable
+
+import bpy
+
+from .attribute import Attribute
+
+# matches the numeric suffix Blender appends on name collisions, e.g. "Name.001"
+DUP_SUFFIX = r"\.\d{3}$"
+
+# ID collections that are deduplicated by default. Duplicates are only matched by name,
+# which is safe for node groups as appended node trees are regenerated from the same
+# source, but a user's unrelated "Material" or "Image" would absorb an appended
+# "Material.001". Materials, images, textures and objects can be opted in by passing
+# `collections=(..., "materials")` when the same-named IDs are known to be identical
+ID_COLLECTIONS = ("node_groups",)
+
+# map from `ID.id_type` to the name of the collection on `bpy.data` that stores them
+_ID_TYPE_COLLECTIONS = {
+    "NODETREE": "node_groups",
+    "MATERIAL": "materials",
+    "IMAGE": "images",
+    "TEXTURE": "textures",
+    "OBJECT": "objects",
+    "MESH": "meshes",
+    "CURVES": "hair_curves",
+    "POINTCLOUD": "pointclouds",
+    "VOLUME": "volumes",
+    "COLLECTION": "collections",
+    "WORLD": "worlds",
+}
+
+
+@dataclass
+class DeduplicationStats:
+    """
+    Summary of the IDs removed by `deduplicate_ids()`.
+
+    Attributes
+    ----------
+    n_ids : int
+        Total number of duplicate IDs that were remapped and removed.
+    n_bytes : int
+        Approximate number of bytes of bulk data (image pixels, geometry attributes)
+        that were reclaimed. IDs without bulk data count as zero bytes.
+    per_collection : dict[str, int]
+        Number of removed IDs for each of the `bpy.data` collections.
+    """
+
+    n_ids: int = 0
+    n_bytes: int = 0
+    per_collection: dict[str, int] = field(default_factory=dict)
+
+    def __add__(self, other: "DeduplicationStats") -> "DeduplicationStats":
+        per_collection = dict(self.per_collection)
+        for name, count in other.per_collection.items():
+            per_collection[name] = per_collection.get(name, 0) + count
+        return DeduplicationStats(
+            n_ids=self.n_ids + other.n_ids,
+            n_bytes=self.n_bytes + other.n_bytes,
+            per_collection=per_collection,
+        )
+
+
+def _estimate_id_bytes(block: bpy.types.ID) -> int:
+    "Approximate size of the bulk data owned by the ID, without loading anything."
+    if isinstance(block, bpy.types.Image):
+        # only count pixels that are actually loaded, querying the size of an unloaded
+        # image would otherwise trigger loading it from disk
+        if not block.has_data:
+            return 0
+        width, height = block.size
+        return width * height * block.channels * (4 if block.is_float else 1)
+
+    if isinstance(block, (bpy.types.Mesh, bpy.types.Curves, bpy.types.PointCloud)):
+        total = 0
+        for attribute in block.attributes:
+            try:
+                total += Attribute(attribute).nbytes  # type: ignore
+            except KeyError:
+                # data types that we don't currently support reading
+                continue
+        return total
+
+    return 0
+
+
+def _group_by_collection(
+    ids: Iterable[bpy.types.ID],
+) -> dict[str, list[bpy.types.ID]]:
+    grouped: dict[str, list[bpy.types.ID]] = {}
+    for block in ids:
+        name = _ID_TYPE_COLLECTIONS.get(block.id_type)
+        if name is None:
+            continue
+        grouped.setdefault(name, []).append(block)
+    return grouped
+
+
+def deduplicate_ids(
+    ids: Iterable[bpy.types.ID] | None = None,
+    collections: Iterable[str] = ID_COLLECTIONS,
+) -> DeduplicationStats:
+    """
+    Remap duplicated IDs to their originals and remove the duplicates in bulk.
+
+    Duplicates are identified by Blender's naming pattern for colliding names, so that
+    "Material.001" is considered a duplicate of "Material" if that exists and is of
+    the same type. Each collection is scanned once, all duplicates are remapped with
+    `ID.user_remap()` and then removed in a single `bpy.data.batch_remove()` call.
+
+    Parameters
+    ----------
+    ids : Iterable[bpy.types.ID] | None, optional
+        The IDs to check for being duplicates, such as the IDs that were created by an
+        append operation. If None, every ID in the given collections is checked.
+    collections : Iterable[str], optional
+        Names of the `bpy.data` collections to deduplicate. Defaults to only node
+        groups, as any ID whose name matches is treated as the original. Only opt in
+        other collections such as "materials" or "images" when same-named IDs are known
+        to hold the same data.
+
+    Returns
+    -------
+    DeduplicationStats
+        The number of IDs and approximate bytes that were reclaimed.
+
+    Examples
+    --------
+    ```python
+    import databpy as db
+
+    stats = db.deduplicate_ids(collections=("materials", "images"))
+    print(stats.n_ids, stats.per_collection)
+    ```
+    """
+    pattern = re.compile(DUP_SUFFIX)
+    collections = tuple(collections)
+    grouped = None if ids is None else _group_by_collection(ids)
+
+    stats = DeduplicationStats()
+    to_remove: set[bpy.types.ID] = set()
+    remap_pairs = []
+
+    for collection_name in collections:
+        data = getattr(bpy.data, collection_name)
+        candidates = data if grouped is None else grouped.get(collection_name, [])
+        count = 0
+
+        for block in candidates:
+            if block in to_remove:
+                continue
+            if not pattern.search(block.name):
+                continue
+
+            original = data.get(block.name.rsplit(".", 1)[0])
+            if original is None or original in to_remove:
+                continue
+            if type(original) is not type(block):
+                continue
+
+            remap_pairs.append((block, original))
+            to_remove.add(block)
+            stats.n_bytes += _estimate_id_bytes(block)
+            count += 1
+
+        if count:
+            stats.per_collection[collection_name] = count
+
+    for block, original in remap_pairs:
+        block.user_remap(original)
+
+    if to_remove:
+        bpy.data.batch_remove(to_remove)
+
+    stats.n_ids = len(to_remove)
+    return stats
+
+
+def _is_orphan(block: bpy.types.ID) -> bool:
+    try:
+        return block.users == 0
+    except ReferenceError:
+        # already removed from the file
+        return False
+
+
+def purge_orphans(ids: Iterable[bpy.types.ID], recursive: bool = True) -> int:
+    """
+    Remove the IDs from the given set which no longer have any users.
+
+    Unlike `bpy.ops.outliner.orphans_purge()` or `bpy.data.orphans_purge()` this only
+    considers the given IDs, such as those created by an import or left behind after
+    deduplication, so the cost scales with the number of tracked IDs rather than the
+    size of the file. It also doesn't require an operator context.
+
+    Parameters
+    ----------
+    ids : Iterable[bpy.types.ID]
+        The IDs that are candidates for removal. IDs that have already been removed
+        are ignored.
+    recursive : bool, optional
+        Whether to keep removing candidates which became orphans because their only
+        users were removed in a previous pass. Default is True.
+
+    Returns
+    -------
+    int
+        The number of IDs that were removed.
+
+    Examples
+    --------
+    ```python
+    import bpy
+    import databpy as db
+
+    before = set(bpy.data.node_groups)
+    # ... import operation that may leave unused node groups behind ...
+    db.purge_orphans(set(bpy.data.node_groups) - before)
+    ```
+    """
+    candidates = set(ids)
+    n_removed = 0
+
+    while candidates:
+        orphans = {block for block in candidates if _is_orphan(block)}
+        if not orphans:
+            break
+
+        bpy.data.batch_remove(orphans)
+        n_removed += len(orphans)
+        if not recursive:
+            break
+
+        # removing orphans decrements the user counts of the IDs they referenced, which
+        # can in turn make other candidates orphans
+        candidates -= orphans
+
+    return n_removed
@@ -1,20 +1,49 @@
 from pathlib import Path
+from typing import Iterable
 
 import bpy
 from bpy.types import Material
 
+from .ids import ID_COLLECTIONS
+from .nodes.appending import DuplicatePrevention
 
-# TODO: use DuplicatePrevention when adding material node trees
-def append_from_blend(name: str, filepath: str) -> Material:
+
+def append_from_blend(
+    name: str, filepath: str, collections: Iterable[str] = ID_COLLECTIONS
+) -> Material:
+    """
+    Append a material from the given .blend file.
+
+    Parameters
+    ----------
+    name : str
+        Name of the material to append. If a material with this name already exists it
+        is returned instead.
+    filepath : str
+        Path to the .blend file containing the material.
+    collections : Iterable[str], optional
+        The `bpy.data` collections in which IDs created by the append are remapped to
+        existing IDs with the same name, such as "Group.001" to "Group". Defaults to
+        only node groups, so that unrelated images or textures that happen to share a
+        name with the appended ones are left untouched.
+
+    Returns
+    -------
+    Material
+        The appended material.
+    """
     file_path = Path(filepath)
     if not file_path.exists():
         raise FileNotFoundError(f"Given file not found: {filepath}")
     try:
         return bpy.data.materials[name]
     except KeyError:
-        bpy.ops.wm.append(
-            directory=str(file_path / "Material"),
-            filename=name,
-            link=False,
-        )
+        # appending a material also brings along its node groups which might already
+        # exist in the file, so remap them to the existing ones
+        with DuplicatePrevention(collections=collections):
+            bpy.ops.wm.append(
+                directory=str(file_path / "Material"),
+                filename=name,
+                link=False,
+            )
         return bpy.data.materials[name]
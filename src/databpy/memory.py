@@ -0,0 +1,183 @@
+from typing import Iterable
+
+import bpy
+import numpy as np
+
+from .attribute import (
+    COMPATIBLE_TYPES,
+    Attribute,
+    AttributeTypes,
+    _check_obj_attributes,
+    _domain_size,
+)
+
+# the smaller type each type can be stored as, along with the range of values the
+# smaller type can hold without losing anything
+DOWNCASTS: dict[AttributeTypes, tuple[AttributeTypes, float, float]] = {
+    AttributeTypes.INT: (AttributeTypes.INT8, -128, 127),
+    AttributeTypes.FLOAT_COLOR: (AttributeTypes.BYTE_COLOR, 0.0, 1.0),
+}
+
+_TYPE_WIDTH = max(len(atype.name) for atype in AttributeTypes)
+
+
+def _report_dtype(name_width: int) -> np.dtype:
+    return np.dtype(
+        [
+            ("object", f"U{name_width}"),
+            ("data", f"U{name_width}"),
+            ("name", f"U{name_width}"),
+            ("domain", "U8"),
+            ("type", f"U{_TYPE_WIDTH}"),
+            ("n_elements", np.int64),
+            ("n_bytes", np.int64),
+            ("hidden", np.bool_),
+            ("suggested_type", f"U{_TYPE_WIDTH}"),
+            ("n_saved_bytes", np.int64),
+        ]
+    )
+
+
+def _suggest_downcast(attribute: Attribute) -> AttributeTypes | None:
+    "A smaller type that holds every value of the attribute, if there is one."
+    downcast = DOWNCASTS.get(attribute.atype)
+    if downcast is None or len(attribute) == 0:
+        return None
+    smaller, low, high = downcast
+    values = attribute.as_array()
+    if values.min() >= low and values.max() <= high:
+        return smaller
+    return None
+
+
+def _report_rows(obj: bpy.types.Object, downcast: bool) -> list[tuple]:
+    domain_sizes: dict[str, int] = {}
+    rows = []
+    for blender_attribute in obj.data.attributes:  # type: ignore
+        try:
+            atype = AttributeTypes[blender_attribute.data_type]
+        except KeyError:
+            # types such as strings have no fixed size per element
+            continue
+        domain = blender_attribute.domain
+        if domain not in domain_sizes:
+            domain_sizes[domain] = _domain_size(obj, domain)
+        n_elements = domain_sizes[domain] or len(blender_attribute.data)
+        itemsize = np.dtype(atype.value.dtype).itemsize
+        n_bytes = n_elements * int(np.prod(atype.value.dimensions)) * itemsize
+
+        hidden = blender_attribute.name.startswith(".")
+        suggested = None
+        # hidden attributes are mostly used internally by Blender with a fixed type
+        if downcast and not hidden:
+            suggested = _suggest_downcast(Attribute(blender_attribute))
+        n_saved_bytes = 0
+        if suggested is not None:
+            smaller = np.dtype(suggested.value.dtype).itemsize * int(
+                np.prod(suggested.value.dimensions)
+            )
+            n_saved_bytes = n_bytes - n_elements * smaller
+
+        rows.append(
+            (
+                obj.name,
+                obj.data.name,  # type: ignore
+                blender_attribute.name,
+                domain,
+                atype.name,
+                n_elements,
+                n_bytes,
+                hidden,
+                suggested.name if suggested is not None else "",
+                n_saved_bytes,
+            )
+        )
+    return rows
+
+
+def _sorted_report(rows: list[tuple]) -> np.ndarray:
+    name_width = max((len(name) for row in rows for name in row[:3]), default=1)
+    report = np.array(rows, dtype=_report_dtype(name_width))
+    return report[np.argsort(-report["n_bytes"], kind="stable")]
+
+
+def memory_report(obj: bpy.types.Object, downcast: bool = False) -> np.ndarray:
+    """
+    Report how much memory each attribute of an object uses.
+
+    The size of each attribute is worked out from its type and the size of its domain
+    without reading any of its values, unless `downcast` is enabled. Hidden
+    attributes, whose names start with a `.`, are marked so that ones bloating a file
+    can be found.
+
+    Parameters
+    ----------
+    obj : bpy.types.Object
+        The mesh, curves or point cloud object to report on.
+    downcast : bool, optional
+        Whether to check if attributes could be stored as a smaller type, such as `INT`
+        attributes with values that fit in `INT8` or `FLOAT_COLOR` attributes with
+        values between 0 and 1 that could be `BYTE_COLOR`. This reads the values of
+        every attribute of those types, so it is off by default. Default is False.
+
+    Returns
+    -------
+    np.ndarray
+        Structured array with a row for each attribute, largest first, with the fields
+        `object`, `data`, `name`, `domain`, `type`, `n_elements`, `n_bytes`, `hidden`,
+        `suggested_type` (empty when no smaller type fits) and `n_saved_bytes`. Sort
+        it by another field with `np.sort(report, order="n_saved_bytes")`.
+
+    Examples
+    --------
+    ```python
+    import numpy as np
+    import databpy as db
+
+    bob = db.create_bob(np.random.rand(1000, 3))
+    bob.store_named_attribute(np.arange(1000) % 20, "chain_id")
+    report = db.memory_report(bob.object, downcast=True)
+    report[report["suggested_type"] != ""][["name", "suggested_type"]]
+    ```
+    """
+    _check_obj_attributes(obj)
+    return _sorted_report(_report_rows(obj, downcast))
+
+
+def scene_memory_report(
+    objects: Iterable[bpy.types.Object] | None = None, downcast: bool = False
+) -> np.ndarray:
+    """
+    Report how much memory the attributes of every object in a scene use.
+
+    Geometry that is shared between objects is only reported once, for the first
+    object using it. Objects without attributes, such as cameras and lights, are
+    skipped.
+
+    Parameters
+    ----------
+    objects : Iterable[bpy.types.Object] | None, optional
+        The objects to report on. Defaults to the objects of the current scene.
+    downcast : bool, optional
+        Whether to check if attributes could be stored as a smaller type, see
+        `memory_report()`. This reads the values of those attributes. Default is
+        False.
+
+    Returns
+    -------
+    np.ndarray
+        Structured array with a row for each attribute of each object, largest first,
+        with the same fields as `memory_report()`.
+    """
+    if objects is None:
+        objects = bpy.context.scene.objects  # type: ignore
+    seen: set[int] = set()
+    rows = []
+    for obj in objects:
+        if not isinstance(obj.data, tuple(COMPATIBLE_TYPES)):
+            continue
+        if obj.data.session_uid in seen:
+            continue
+        seen.add(obj.data.session_uid)
+        rows.extend(_report_rows(obj, downcast))
+    return _sorted_report(rows)
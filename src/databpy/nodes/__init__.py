@@ -4,19 +4,44 @@ from .appending import (
     DuplicatePrevention,
     append_from_blend,
 )
-from .generating import custom_string_iswitch, new_tree, swap_tree
-from .utils import get_input, get_output, MaintainConnections, NodeGroupCreationError
+from .generating import (
+    build_tree,
+    custom_string_iswitch,
+    LinkSpec,
+    NodeSpec,
+    SocketSpec,
+    TreeSpec,
+    new_tree,
+    swap_tree,
+    swap_tree_everywhere,
+)
+from .utils import (
+    get_input,
+    get_output,
+    MaintainConnections,
+    NodeGroupCreationError,
+    TreeCacheInfo,
+    tree_cache_info,
+)
 
 __all__ = [
     "cleanup_duplicates",
     "deduplicate_node_trees",
     "DuplicatePrevention",
     "append_from_blend",
+    "build_tree",
     "custom_string_iswitch",
+    "LinkSpec",
+    "NodeSpec",
+    "SocketSpec",
+    "TreeSpec",
     "new_tree",
     "swap_tree",
+    "swap_tree_everywhere",
     "get_input",
     "get_output",
     "MaintainConnections",
     "NodeGroupCreationError",
+    "TreeCacheInfo",
+    "tree_cache_info",
 ]
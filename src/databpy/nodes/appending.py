@@ -1,15 +1,16 @@
-import re
 import time
 import warnings
 from pathlib import Path
-from typing import List
+from typing import Iterable, List
 
 import bpy
 
-from .utils import NODE_DUP_SUFFIX
+from ..ids import DeduplicationStats, deduplicate_ids, purge_orphans
 
 
-def deduplicate_node_trees(node_trees: List[bpy.types.NodeTree]):
+def deduplicate_node_trees(
+    node_trees: List[bpy.types.NodeTree],
+) -> DeduplicationStats:
     """Deduplicate node trees by remapping duplicates to their originals.
 
     Identifies node trees with duplicate naming patterns (e.g., "NodeTree.001",
@@ -25,15 +26,16 @@ def deduplicate_node_trees(node_trees: List[bpy.types.NodeTree]):
 
     Returns
     -------
-    None
-        This function modifies the Blender data in-place.
+    DeduplicationStats
+        The number of node trees that were removed. The Blender data is modified
+        in-place.
 
     Notes
     -----
     - Duplicate pattern: Matches node trees with names ending in ".###" where
       ### is a 3-digit number (e.g., ".001", ".042", ".999")
     - Thread-safe: No, modifies global Blender data structures
-    - Uses a set for O(1) lookup performance when checking already-processed trees
+    - All duplicates are removed in a single `bpy.data.batch_remove()` call
 
     Examples
     --------
@@ -72,71 +74,62 @@ def deduplicate_node_trees(node_trees: List[bpy.types.NodeTree]):
     See Also
     --------
     cleanup_duplicates : Higher-level function that handles collection and purging
+    databpy.ids.deduplicate_ids : Deduplication for other ID types such as materials
     DuplicatePrevention : Context manager for preventing duplicates during import
     """
-    node_duplicate_pattern = re.compile(NODE_DUP_SUFFIX)
-    to_remove: set[bpy.types.NodeTree] = set()
+    return deduplicate_ids(node_trees, collections=("node_groups",))
 
-    # First pass: identify all duplicates and their replacements
-    remap_pairs = []
 
-    for node_tree in node_trees:
-        # Skip if already marked for removal
-        if node_tree in to_remove:
-            continue
-
-        old_name = node_tree.name
-
-        if node_duplicate_pattern.search(old_name):
-            # Remove the numeric suffix to get the original name
-            name_sans = old_name.rsplit(".", 1)[0]
-            replacement = bpy.data.node_groups.get(name_sans)
-
-            # Only remap if replacement exists and isn't also marked for removal
-            if replacement and replacement not in to_remove:
-                remap_pairs.append((node_tree, replacement))
-                to_remove.add(node_tree)
-
-    # Second pass: perform all remappings
-    for node_tree, replacement in remap_pairs:
-        node_tree.user_remap(replacement)
-
-    # Third pass: remove all duplicates
-    for tree in to_remove:
-        try:
-            bpy.data.node_groups.remove(tree)
-        except ReferenceError:
-            pass
+def cleanup_duplicates(purge: bool = False) -> DeduplicationStats:
+    """Deduplicate all node groups in the file, optionally purging unused ones.
 
+    Parameters
+    ----------
+    purge : bool, optional
+        Whether to also remove node groups that are left without any users. Only node
+        groups are considered, rather than purging orphans across the whole file.
+        Default is False.
 
-def cleanup_duplicates(purge: bool = False):
+    Returns
+    -------
+    DeduplicationStats
+        The number of duplicated node trees that were removed.
+    """
     # Collect all node trees from node groups, excluding "NodeGroup" named ones
     node_trees = [tree for tree in bpy.data.node_groups if "NodeGroup" not in tree.name]
 
     # Call the deduplication function with the collected node trees
-    deduplicate_node_trees(node_trees)
+    stats = deduplicate_node_trees(node_trees)
 
     if purge:
-        # Purge orphan data blocks from the file
-        bpy.ops.outliner.orphans_purge()
+        # Only purge the node trees we were working with, instead of the whole file
+        purge_orphans(node_trees)
+
+    return stats
 
 
 class DuplicatePrevention:
     "Context manager to cleanup duplicated node trees when appending node groups"
 
-    def __init__(self, timing=False):
-        self.old_names: List[str] = []
+    def __init__(self, timing=False, collections: Iterable[str] = ("node_groups",)):
+        self.collections = tuple(collections)
+        self.old_ids: set[bpy.types.ID] = set()
         self.start_time: float = 0.0
         self.timing = timing
+        self.stats = DeduplicationStats()
+
+    def _current_ids(self) -> set[bpy.types.ID]:
+        return {block for name in self.collections for block in getattr(bpy.data, name)}
 
     def __enter__(self):
-        self.old_names = [tree.name for tree in bpy.data.node_groups]
+        self.old_ids = self._current_ids()
         if self.timing:
             self.start_time = time.time()
+        return self
 
     def __exit__(self, type, value, traceback):
-        deduplicate_node_trees(
-            [tree for tree in bpy.data.node_groups if tree.name not in self.old_names]
+        self.stats = deduplicate_ids(
+            self._current_ids() - self.old_ids, collections=self.collections
         )
         if self.timing:
             end_time = time.time()
@@ -1,6 +1,22 @@
 import bpy
-from .utils import MaintainConnections, NodeGroupCreationError, get_input, get_output
-from typing import Iterable
+from .utils import (
+    TREE_CACHE,
+    MaintainConnections,
+    NodeGroupCreationError,
+    _tree_key,
+    apply_interface_defaults,
+    get_input,
+    get_output,
+    interface_defaults,
+)
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Literal
+
+# Adding items to an `Index Switch` gets slower with every socket already in the
+# tree, so lookups with more values than this are split across node groups that
+# each hold a chunk of the items
+ISWITCH_MAX_ITEMS = 1024
+ISWITCH_CHUNK_SIZE = 256
 
 
 def swap_tree(node: bpy.types.GeometryNode, tree: bpy.types.GeometryNodeTree) -> None:
@@ -9,6 +25,127 @@ def swap_tree(node: bpy.types.GeometryNode, tree: bpy.types.GeometryNodeTree) ->
         node.name = tree.name
 
 
+def _trees_in_file():
+    "All node trees in the file, including those embedded in materials and worlds."
+    yield from bpy.data.node_groups
+    for block in (*bpy.data.materials, *bpy.data.worlds):
+        if block.node_tree is not None:
+            yield block.node_tree
+
+
+def _swap_group_nodes(
+    tree: bpy.types.NodeTree,
+    nodes: list[bpy.types.Node],
+    new_tree: bpy.types.NodeTree,
+    defaults: list[tuple[str, object]],
+) -> None:
+    swapped = set(nodes)
+
+    # sockets on the swapped nodes are recreated when the node tree changes, so they are
+    # stored by name and looked up again, while sockets on other nodes stay valid
+    def socket_key(node, socket):
+        return socket.name if node in swapped else socket
+
+    # a single pass over the links of the tree, rather than over every socket of every
+    # swapped node
+    links = []
+    for link in list(tree.links):
+        if link.from_node in swapped or link.to_node in swapped:
+            links.append(
+                (
+                    link.from_node,
+                    socket_key(link.from_node, link.from_socket),
+                    link.to_node,
+                    socket_key(link.to_node, link.to_socket),
+                )
+            )
+            tree.links.remove(link)
+
+    for node in nodes:
+        try:
+            material = node.inputs["Material"].default_value  # type: ignore
+        except KeyError:
+            material = None
+
+        node.node_tree = new_tree  # type: ignore
+        node.name = new_tree.name
+        apply_interface_defaults(node, defaults)
+
+        if material:
+            try:
+                node.inputs["Material"].default_value = material  # type: ignore
+            except KeyError:
+                # the new node doesn't contain a material slot
+                pass
+
+    # rebuild the links based on names of the sockets, not their identifiers
+    link = tree.links.new
+    for from_node, from_key, to_node, to_key in links:
+        try:
+            from_socket = (
+                from_node.outputs[from_key] if isinstance(from_key, str) else from_key
+            )
+            to_socket = to_node.inputs[to_key] if isinstance(to_key, str) else to_key
+        except KeyError:
+            continue
+        link(from_socket, to_socket)
+
+
+def swap_tree_everywhere(
+    old_tree: bpy.types.NodeTree, new_tree: bpy.types.NodeTree
+) -> int:
+    """
+    Swap the node tree of every group node using `old_tree` over to `new_tree`.
+
+    All node groups, materials and worlds are searched in a single pass. Links in and
+    out of the swapped nodes are rebuilt by socket name as with `swap_tree()`, with the
+    links of each tree collected and rebuilt together, and the interface defaults of
+    `new_tree` are only computed once.
+
+    Parameters
+    ----------
+    old_tree : bpy.types.NodeTree
+        The node tree to replace.
+    new_tree : bpy.types.NodeTree
+        The node tree to use instead.
+
+    Returns
+    -------
+    int
+        The number of group nodes that were swapped.
+
+    Examples
+    --------
+    ```python
+    import bpy
+    import databpy as db
+
+    old = bpy.data.node_groups["Style Cartoon"]
+    new = db.nodes.append_from_blend("Style Cartoon v2", "nodes.blend")
+    db.nodes.swap_tree_everywhere(old, new)
+    ```
+    """
+    defaults = interface_defaults(new_tree)
+    n_swapped = 0
+
+    # collect all of the nodes first, as swapping can alter the trees being iterated
+    to_swap = []
+    for tree in _trees_in_file():
+        nodes = [
+            node
+            for node in tree.nodes
+            if node.type == "GROUP" and node.node_tree == old_tree  # type: ignore
+        ]
+        if nodes:
+            to_swap.append((tree, nodes))
+
+    for tree, nodes in to_swap:
+        _swap_group_nodes(tree, nodes, new_tree, defaults)
+        n_swapped += len(nodes)
+
+    return n_swapped
+
+
 def new_tree(
     name: str = "Geometry Nodes",
     geometry: bool = True,
@@ -38,62 +175,393 @@ def new_tree(
     return tree
 
 
+def _string_iswitch_interface(
+    tree: bpy.types.NodeTree, attr_name: str
+) -> tuple[bpy.types.NodeTreeInterfaceSocket, bpy.types.NodeTreeInterfaceSocket]:
+    socket_in = tree.interface.new_socket(
+        attr_name, in_out="INPUT", socket_type="NodeSocketInt"
+    )
+    socket_in.name = attr_name
+    socket_out = tree.interface.new_socket(
+        attr_name, in_out="OUTPUT", socket_type="NodeSocketString"
+    )
+    socket_out.name = "String"
+    return socket_in, socket_out  # type: ignore
+
+
+def _new_string_iswitch_node(
+    tree: bpy.types.NodeTree, n_items: int
+) -> bpy.types.GeometryNodeIndexSwitch:
+    node: bpy.types.GeometryNodeIndexSwitch = tree.nodes.new(  # type: ignore
+        "GeometryNodeIndexSwitch"
+    )
+    node.data_type = "STRING"
+    # the node starts with 2 items already, so we only create the extra items
+    new_item = node.index_switch_items.new
+    for _ in range(n_items - 2):
+        new_item()
+    return node
+
+
+def _build_string_iswitch(
+    tree: bpy.types.NodeTree, values: list, attr_name: str
+) -> None:
+    link = tree.links.new
+    socket_in, socket_out = _string_iswitch_interface(tree, attr_name)
+
+    node_iswitch = _new_string_iswitch_node(tree, len(values))
+    link(get_input(tree).outputs[socket_in.identifier], node_iswitch.inputs["Index"])
+
+    # the first input is the index, and the last input is the virtual socket for
+    # extending the items, so zip stops before reaching it
+    for socket, item in zip(node_iswitch.inputs[1:], values):
+        socket.default_value = item
+
+    link(
+        node_iswitch.outputs["Output"],
+        get_output(tree).inputs[socket_out.identifier],
+    )
+
+
+def _build_chunked_string_iswitch(
+    tree: bpy.types.NodeTree, values: list, attr_name: str
+) -> None:
+    link = tree.links.new
+    socket_in, socket_out = _string_iswitch_interface(tree, attr_name)
+    index = get_input(tree).outputs[socket_in.identifier]
+
+    # split the index into which chunk it falls in, and the index inside of the chunk
+    node_chunk = tree.nodes.new("FunctionNodeIntegerMath")
+    node_chunk.operation = "DIVIDE_FLOOR"  # type: ignore
+    node_offset = tree.nodes.new("FunctionNodeIntegerMath")
+    node_offset.operation = "FLOORED_MODULO"  # type: ignore
+    for node in (node_chunk, node_offset):
+        link(index, node.inputs[0])
+        node.inputs[1].default_value = ISWITCH_CHUNK_SIZE  # type: ignore
+
+    chunks = [
+        values[i : i + ISWITCH_CHUNK_SIZE]
+        for i in range(0, len(values), ISWITCH_CHUNK_SIZE)
+    ]
+    node_iswitch = _new_string_iswitch_node(tree, len(chunks))
+    link(node_chunk.outputs[0], node_iswitch.inputs["Index"])
+
+    existing = set(bpy.data.node_groups)
+    try:
+        for i, (socket, chunk) in enumerate(zip(node_iswitch.inputs[1:], chunks)):
+            node_group = tree.nodes.new("GeometryNodeGroup")
+            # chunks are hidden from the add menu with the leading '.' and are cached
+            # the same as other trees, so lists which share chunks also share the trees
+            node_group.node_tree = custom_string_iswitch(  # type: ignore
+                f".{tree.name}_{i}", chunk, attr_name
+            )
+            node_group.location.y = -i * 200
+            link(node_offset.outputs[0], node_group.inputs[0])
+            link(node_group.outputs[0], socket)
+    except Exception:
+        # remove the chunk trees built so far, chunks that were already cached before
+        # this lookup may be used elsewhere and are kept
+        for chunk_tree in set(bpy.data.node_groups) - existing:
+            bpy.data.node_groups.remove(chunk_tree)
+        raise
+
+    link(
+        node_iswitch.outputs["Output"],
+        get_output(tree).inputs[socket_out.identifier],
+    )
+
+
 def custom_string_iswitch(
     name: str, values: Iterable[str], attr_name: str = "attr_id"
 ) -> bpy.types.NodeTree:
     """
     Creates a node group containing a `Index Switch` node with all the given values.
+
+    Trees are cached based on the `values` and `attr_name`, so requesting a lookup for
+    values which already have a generated tree returns the existing tree (which might
+    have a different name) rather than creating a new one. Use `tree_cache_info()` to
+    see how many trees have been reused.
+
+    Adding items to an `Index Switch` node gets slower the more sockets there are in
+    the tree, so lists longer than `ISWITCH_MAX_ITEMS` are split into chunks that are
+    each built in their own hidden node group, and the index is routed to the
+    corresponding chunk.
+
+    Parameters
+    ----------
+    name : str
+        Name for the node group, if a new one has to be created.
+    values : Iterable[str]
+        The strings that will be returned for the indices 0 to len(values) - 1.
+    attr_name : str, optional
+        Name of the integer input socket. Default is "attr_id".
+
+    Returns
+    -------
+    bpy.types.NodeTree
+        The new or reused node group.
+
+    Raises
+    ------
+    NodeGroupCreationError
+        If the node group could not be created, such as when the values are not
+        strings.
     """
+    values = list(values)
+    key = _tree_key("custom_string_iswitch", attr_name, values)
+    tree = TREE_CACHE.get(key)
+    if tree is not None:
+        return tree
 
-    # dont' attempt to return an already existing node tree. If a user is requesting a
-    # new one they are likely passing in a new list, so we have to createa a new one
-    # to ensure we are using the new iterables
+    # if a tree with the same name but different values already exists we still create
+    # a new one, as the user is likely passing in a new list
     tree = new_tree(name=name, geometry=False, fallback=False)
-    # name might have originally been the same, but on creation it might be name.001 or
-    # something similar so we just grab the name from the tree
-    name = tree.name
     tree.color_tag = "CONVERTER"
 
     # try creating the node group, otherwise on fail cleanup the created group and
     # report the error
     try:
-        link = tree.links.new
-        node_input = get_input(tree)
-        socket_in = tree.interface.new_socket(
-            attr_name, in_out="INPUT", socket_type="NodeSocketInt"
+        if len(values) > ISWITCH_MAX_ITEMS:
+            _build_chunked_string_iswitch(tree, values, attr_name)
+        else:
+            _build_string_iswitch(tree, values, attr_name)
+    # if something broke when creating the node group, delete whatever was created
+    except Exception as e:
+        node_name = tree.name
+        bpy.data.node_groups.remove(tree)
+        raise NodeGroupCreationError(
+            f"Unable to make node group: {node_name}.\nError: {e}"
         )
-        socket_in.name = attr_name
-        node_output = get_output(tree)
-        socket_out = tree.interface.new_socket(
-            attr_name, in_out="OUTPUT", socket_type="NodeSocketString"
+
+    TREE_CACHE.add(key, tree)
+    return tree
+
+
+# keys for referring to the group input and output nodes in a TreeSpec, these nodes are
+# always created by `build_tree()`
+GROUP_INPUT = "Group Input"
+GROUP_OUTPUT = "Group Output"
+
+
+@dataclass
+class SocketSpec:
+    """
+    An input or output socket on the interface of a node tree.
+
+    Attributes
+    ----------
+    name : str
+        Name of the socket.
+    socket_type : str
+        Blender socket type, such as "NodeSocketGeometry" or "NodeSocketFloat".
+    in_out : str
+        Whether the socket is an "INPUT" or "OUTPUT" of the tree.
+    default_value : Any
+        Default value for the socket, or None to keep Blender's default.
+    """
+
+    name: str
+    socket_type: str
+    in_out: Literal["INPUT", "OUTPUT"] = "INPUT"
+    default_value: Any = None
+
+
+@dataclass
+class NodeSpec:
+    """
+    A node inside of a node tree.
+
+    Attributes
+    ----------
+    bl_idname : str
+        Blender node type, such as "GeometryNodeTransform".
+    name : str | None
+        Name used to refer to the node in links. Defaults to the name Blender gives it.
+    location : tuple[float, float]
+        Location of the node in the editor.
+    properties : dict[str, Any]
+        Node properties to set, such as `{"data_type": "FLOAT"}`. They are set in order
+        before the input values, as properties can change the available sockets.
+    inputs : dict[str | int, Any]
+        Default values for the input sockets by name or index.
+    """
+
+    bl_idname: str
+    name: str | None = None
+    location: tuple[float, float] = (0.0, 0.0)
+    properties: dict[str, Any] = field(default_factory=dict)
+    inputs: dict[str | int, Any] = field(default_factory=dict)
+
+
+@dataclass
+class LinkSpec:
+    """
+    A link between the output socket of one node and the input socket of another.
+
+    Sockets are referred to by name or index, and nodes by their name in the spec or
+    `GROUP_INPUT` / `GROUP_OUTPUT`.
+    """
+
+    from_node: str
+    from_socket: str | int
+    to_node: str
+    to_socket: str | int
+
+
+@dataclass
+class TreeSpec:
+    """
+    Declarative description of a node tree, to be built with `build_tree()`.
+
+    Attributes
+    ----------
+    name : str
+        Name for the node tree, if a new one has to be created.
+    sockets : list[SocketSpec]
+        The interface sockets of the tree.
+    nodes : list[NodeSpec]
+        The nodes in the tree, not including the group input and output nodes.
+    links : list[LinkSpec]
+        Links between the nodes.
+    tree_type : str
+        The type of node tree, by default "GeometryNodeTree".
+    """
+
+    name: str
+    sockets: list[SocketSpec] = field(default_factory=list)
+    nodes: list[NodeSpec] = field(default_factory=list)
+    links: list[LinkSpec] = field(default_factory=list)
+    tree_type: str = "GeometryNodeTree"
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TreeSpec":
+        """
+        Create a TreeSpec from a dictionary of plain Python values.
+
+        Sockets and nodes are given as dictionaries of their fields, and links as
+        either a dictionary or a `(from_node, from_socket, to_node, to_socket)` tuple.
+        """
+
+        def _link(link):
+            if isinstance(link, dict):
+                return LinkSpec(**link)
+            return LinkSpec(*link)
+
+        return cls(
+            name=data["name"],
+            sockets=[SocketSpec(**socket) for socket in data.get("sockets", [])],
+            nodes=[NodeSpec(**node) for node in data.get("nodes", [])],
+            links=[_link(link) for link in data.get("links", [])],
+            tree_type=data.get("tree_type", "GeometryNodeTree"),
         )
-        socket_out.name = "String"
 
-        node_iswitch: bpy.types.GeometryNodeIndexSwitch = tree.nodes.new(  # type: ignore
-            "GeometryNodeIndexSwitch"
+
+def _build_from_spec(tree: bpy.types.NodeTree, spec: TreeSpec) -> None:
+    # Blender updates the tree after each node and link is added and this can't be
+    # paused from Python, so everything is created in the order that invalidates the
+    # least: the interface first, then nodes with their properties and values, and
+    # links last
+    for socket in spec.sockets:
+        item = tree.interface.new_socket(
+            socket.name, in_out=socket.in_out, socket_type=socket.socket_type
         )
-        node_iswitch.data_type = "STRING"
-        link(node_input.outputs[socket_in.identifier], node_iswitch.inputs["Index"])
+        if socket.default_value is not None:
+            item.default_value = socket.default_value  # type: ignore
 
-        for i, item in enumerate(values):
-            # the node starts with 2 items already, so we only create new items
-            # if they are above that
-            if i > 1:
-                node_iswitch.index_switch_items.new()
+    node_input = tree.nodes.new("NodeGroupInput")
+    node_output = tree.nodes.new("NodeGroupOutput")
+    node_input.location.x = -200 - node_input.width
+    node_output.location.x = 200
+    nodes = {GROUP_INPUT: node_input, GROUP_OUTPUT: node_output}
 
-            node_iswitch.inputs[int(i + 1)].default_value = item
+    for node_spec in spec.nodes:
+        node = tree.nodes.new(node_spec.bl_idname)
+        if node_spec.name:
+            node.name = node_spec.name
+        node.location = node_spec.location
+        for prop, value in node_spec.properties.items():
+            setattr(node, prop, value)
+        for socket, value in node_spec.inputs.items():
+            node.inputs[socket].default_value = value  # type: ignore
+        nodes[node_spec.name or node.name] = node
 
+    link = tree.links.new
+    for link_spec in spec.links:
         link(
-            node_iswitch.outputs["Output"],
-            node_output.inputs[socket_out.identifier],
+            nodes[link_spec.from_node].outputs[link_spec.from_socket],
+            nodes[link_spec.to_node].inputs[link_spec.to_socket],
         )
 
+
+def build_tree(spec: TreeSpec | dict) -> bpy.types.NodeTree:
+    """
+    Build a node tree from a declarative specification.
+
+    Built trees are cached by the hash of their spec, so building the same spec again
+    returns the existing tree (which might since have been renamed) without rebuilding
+    it. Use `tree_cache_info()` to see how many trees have been reused.
+
+    Parameters
+    ----------
+    spec : TreeSpec | dict
+        The specification of the tree, either as a `TreeSpec` or a dictionary in the
+        form accepted by `TreeSpec.from_dict()`.
+
+    Returns
+    -------
+    bpy.types.NodeTree
+        The new or reused node tree.
+
+    Raises
+    ------
+    NodeGroupCreationError
+        If the tree could not be built from the spec, such as when a node type or
+        socket doesn't exist. Nothing is left behind in the file in this case.
+
+    Examples
+    --------
+    ```python
+    import databpy as db
+
+    tree = db.nodes.build_tree(
+        {
+            "name": "Offset",
+            "sockets": [
+                {"name": "Geometry", "socket_type": "NodeSocketGeometry"},
+                {"name": "Offset", "socket_type": "NodeSocketVector"},
+                {
+                    "name": "Geometry",
+                    "socket_type": "NodeSocketGeometry",
+                    "in_out": "OUTPUT",
+                },
+            ],
+            "nodes": [{"bl_idname": "GeometryNodeSetPosition", "name": "Set"}],
+            "links": [
+                ("Group Input", "Geometry", "Set", "Geometry"),
+                ("Group Input", "Offset", "Set", "Offset"),
+                ("Set", "Geometry", "Group Output", "Geometry"),
+            ],
+        }
+    )
+    ```
+    """
+    if isinstance(spec, dict):
+        spec = TreeSpec.from_dict(spec)
+
+    key = _tree_key("build_tree", spec)
+    tree = TREE_CACHE.get(key)
+    if tree is not None:
         return tree
 
-    # if something broke when creating the node group, delete whatever was created
+    tree = bpy.data.node_groups.new(spec.name, spec.tree_type)  # type: ignore
+    try:
+        _build_from_spec(tree, spec)
     except Exception as e:
         node_name = tree.name
         bpy.data.node_groups.remove(tree)
         raise NodeGroupCreationError(
             f"Unable to make node group: {node_name}.\nError: {e}"
         )
+
+    TREE_CACHE.add(key, tree)
+    return tree
@@ -1,7 +1,16 @@
+import hashlib
+from dataclasses import asdict, dataclass, is_dataclass
+
 import bpy
+import numpy as np
+from bpy.types import bpy_prop_array
+from mathutils import Color, Euler, Matrix, Quaternion, Vector
 
+from ..ids import DUP_SUFFIX as NODE_DUP_SUFFIX  # noqa: F401
 
-NODE_DUP_SUFFIX = r"\.\d{3}$"
+# custom property storing the content hash of a generated tree, properties starting with
+# an underscore are hidden from the UI
+TREE_HASH_PROP = "_databpy_hash"
 
 
 class NodeGroupCreationError(Exception):
@@ -10,6 +19,126 @@ class NodeGroupCreationError(Exception):
         super().__init__(self.message)
 
 
+def _normalise(value):
+    # convert to plain Python types so that equal content gives the same key, such as
+    # `np.str_("a")` and `"a"`, or a tuple and a list of the same values
+    if isinstance(value, np.ndarray | np.generic):
+        return _normalise(value.tolist())
+    if is_dataclass(value) and not isinstance(value, type):
+        return [type(value).__name__, _normalise(asdict(value))]
+    if isinstance(value, dict):
+        return [[_normalise(k), _normalise(v)] for k, v in value.items()]
+    if isinstance(
+        value,
+        list | tuple | bpy_prop_array | Vector | Color | Euler | Quaternion | Matrix,
+    ):
+        return [_normalise(item) for item in value]
+    return value
+
+
+def _tree_key(*parts) -> str:
+    "Stable hash of the given parts, used as the key for generated node trees."
+    return hashlib.blake2b(repr(_normalise(parts)).encode(), digest_size=16).hexdigest()
+
+
+@dataclass
+class TreeCacheInfo:
+    """
+    Statistics for the generated node tree cache.
+
+    Attributes
+    ----------
+    hits : int
+        Number of times an existing tree was reused instead of building a new one.
+    misses : int
+        Number of times a tree had to be built.
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+
+class TreeCache:
+    """
+    Content-addressed lookup of generated node trees.
+
+    Generated trees are tagged with the hash of the content they were built from, so
+    that identical trees can be reused instead of creating another `name.001`. The
+    hash is stored on the tree itself so that trees saved in a .blend file are found
+    again after reloading. A hash to tree name index avoids scanning every node group
+    on each lookup and is rebuilt whenever it is found to be stale.
+    """
+
+    def __init__(self) -> None:
+        self.info = TreeCacheInfo()
+        self._index: dict[str, str] = {}
+        self._scanned = False
+
+    def _scan(self) -> None:
+        self._index = {
+            tree[TREE_HASH_PROP]: tree.name
+            for tree in bpy.data.node_groups
+            if TREE_HASH_PROP in tree
+        }
+        self._scanned = True
+
+    def _lookup(self, key: str) -> bpy.types.NodeTree | None:
+        name = self._index.get(key)
+        if name is None:
+            return None
+        tree = bpy.data.node_groups.get(name)
+        if tree is None or tree.get(TREE_HASH_PROP) != key:
+            return None
+        return tree
+
+    def get(self, key: str) -> bpy.types.NodeTree | None:
+        "Return the tree that was built for the given key, or None if there isn't one."
+        if not self._scanned:
+            self._scan()
+        tree = self._lookup(key)
+        if tree is None and key in self._index:
+            # the tree has been renamed or removed since it was indexed
+            self._scan()
+            tree = self._lookup(key)
+
+        if tree is None:
+            self.info.misses += 1
+        else:
+            self.info.hits += 1
+        return tree
+
+    def add(self, key: str, tree: bpy.types.NodeTree) -> None:
+        "Tag the tree with the key and add it to the index."
+        tree[TREE_HASH_PROP] = key
+        self._index[key] = tree.name
+
+    def clear(self) -> None:
+        "Clear the index, which is rebuilt from the trees in the file on next lookup."
+        self._index.clear()
+        self._scanned = False
+
+
+TREE_CACHE = TreeCache()
+
+
+def tree_cache_info() -> TreeCacheInfo:
+    """
+    Return the hit and miss counts of the generated node tree cache.
+
+    Returns
+    -------
+    TreeCacheInfo
+        The number of trees that were reused (hits) and built (misses).
+    """
+    return TREE_CACHE.info
+
+
+@bpy.app.handlers.persistent
+def _clear_tree_cache(*args) -> None:
+    # names in the index refer to the previous file, so rebuild it after loading
+    TREE_CACHE.clear()
+
+
 def get_output(group):
     return group.nodes[
         bpy.app.translations.pgettext_data(
@@ -26,6 +155,25 @@ def get_input(group):
     ]
 
 
+def interface_defaults(tree: bpy.types.NodeTree) -> list[tuple[str, object]]:
+    "Identifiers and default values of the input sockets of the tree's interface."
+    return [
+        (item.identifier, item.default_value)
+        for item in tree.interface.items_tree
+        if item.item_type != "PANEL"
+        and item.in_out == "INPUT"
+        and hasattr(item, "default_value")
+    ]
+
+
+def apply_interface_defaults(
+    node: bpy.types.Node, defaults: list[tuple[str, object]]
+) -> None:
+    "Reset the inputs of a group node to the given interface defaults."
+    for identifier, value in defaults:
+        node.inputs[identifier].default_value = value  # type: ignore
+
+
 class MaintainConnections:
     # capture input and output links, so we can rebuild the links based on name
     # and the sockets they were connected to
@@ -72,13 +220,7 @@ class MaintainConnections:
                 pass
 
         # reset all values to tree defaults
-        tree = self.node.node_tree
-        for item in tree.interface.items_tree:
-            if item.item_type == "PANEL":
-                continue
-            if item.in_out == "INPUT":
-                if hasattr(item, "default_value"):
-                    self.node.inputs[item.identifier].default_value = item.default_value
+        apply_interface_defaults(self.node, interface_defaults(self.node.node_tree))
 
         if self.material:
             try:
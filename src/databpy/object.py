@@ -1,3 +1,5 @@
+from pathlib import Path
+from typing import Mapping, Sequence
 from uuid import uuid1
 import warnings
 
@@ -8,6 +10,7 @@ from numpy import typing as npt
 from .array import AttributeArray
 
 from . import attribute as attr
+from . import stats
 from .addon import register
 from .attribute import (
     AttributeDomains,
@@ -20,6 +23,18 @@ from .attribute import (
     Attribute,
 )
 from .collection import create_collection
+from .memory import memory_report
+from .snapshot import load_snapshot, save_snapshot
+from .table import (
+    TableBackends,
+    TableLike,
+    VectorLayouts,
+    _stack_vector,
+    iter_tables,
+    store_table,
+    table_columns,
+    to_table,
+)
 
 
 class LinkedObjectError(Exception):
@@ -140,9 +155,12 @@ def get_from_uuid(uuid: str) -> Object:
     Object
         The object from the bpy.data.objects collection.
     """
-    for obj in bpy.data.objects:
-        if obj.uuid == uuid:  # type: ignore
-            return obj
+    with stats.measure("uuid_lookup") as lookup:
+        for i, obj in enumerate(bpy.data.objects):
+            if obj.uuid == uuid:  # type: ignore
+                lookup.update(owner=obj, n_elements=i + 1)
+                return obj
+        lookup.update(n_elements=len(bpy.data.objects))
 
     raise LinkedObjectError(
         "Failed to find an object in the database with given uuid: " + uuid
@@ -316,6 +334,7 @@ class BlenderObjectAttribute(BlenderObjectBase):
         name: str,
         atype: AttributeTypeNames | AttributeTypes | None = None,
         domain: DomainNames | AttributeDomains = AttributeDomains.POINT,
+        skip_unchanged: bool = False,
     ) -> None:
         """
         Store a named attribute on the Blender object.
@@ -332,6 +351,9 @@ class BlenderObjectAttribute(BlenderObjectBase):
             input array.
         domain : str or AttributeDomain, optional
             The domain to store the attribute on. Defaults to Domains.POINT.
+        skip_unchanged : bool, optional
+            Whether to skip the write if the data matches the previous write to the
+            attribute, see `store_named_attribute()`. Default is False.
 
         Returns
         -------
@@ -339,9 +361,165 @@ class BlenderObjectAttribute(BlenderObjectBase):
         """
         self._check_obj()
         attr.store_named_attribute(
-            self.object, data=data, name=name, atype=atype, domain=domain
+            self.object,
+            data=data,
+            name=name,
+            atype=atype,
+            domain=domain,
+            skip_unchanged=skip_unchanged,
         )
 
+    def store_table(
+        self,
+        table: TableLike,
+        domain: DomainNames | AttributeDomains = AttributeDomains.POINT,
+        position: str | Sequence[str] | None = None,
+        vectors: Mapping[str, Sequence[str]] | None = None,
+    ) -> list[str]:
+        """
+        Store every column of a table as an attribute, in a single batch.
+
+        Parameters
+        ----------
+        table : TableLike
+            A dict of arrays, a polars or pandas DataFrame, a pyarrow Table or any
+            object implementing the Arrow PyCapsule stream interface.
+        domain : str or AttributeDomain, optional
+            The domain to store the attributes on. Defaults to Domains.POINT.
+        position : str | Sequence[str] | None, optional
+            Column, or the x, y and z columns, to store as the `position` attribute.
+        vectors : Mapping[str, Sequence[str]] | None, optional
+            Further vectors to build from differently named columns, such as
+            `{"velocity": ("vx", "vy", "vz")}`. Columns named `{name}_x`, `{name}_y`
+            and `{name}_z` are grouped automatically.
+
+        Returns
+        -------
+        list[str]
+            The names of the stored attributes.
+        """
+        self._check_obj()
+        return store_table(
+            self.object, table, domain=domain, position=position, vectors=vectors
+        )
+
+    def to_table(
+        self,
+        domain: DomainNames | AttributeDomains = AttributeDomains.POINT,
+        names: Sequence[str] | None = None,
+        vectors: VectorLayouts = "components",
+        backend: TableBackends | None = None,
+        categorical: bool = True,
+    ):
+        """
+        Read the attributes of a domain into a polars DataFrame or pyarrow Table.
+
+        Parameters
+        ----------
+        domain : str or AttributeDomain, optional
+            The domain to read the attributes of. Defaults to Domains.POINT.
+        names : Sequence[str] | None, optional
+            The attributes to read. If None, every visible attribute on the domain.
+        vectors : {"components", "list"}, optional
+            Whether multi-dimensional attributes are split into one column per
+            component or kept as a fixed-size list column. Default is "components".
+        backend : {"polars", "pyarrow"} | None, optional
+            The library to build the table with. If None, polars is used if it is
+            installed and pyarrow otherwise.
+        categorical : bool, optional
+            Whether to decode categorical attributes into their strings, rather than
+            exporting the integer codes. Default is True.
+
+        Returns
+        -------
+        polars.DataFrame | pyarrow.Table
+            A table with one row per element of the domain, built without copying the
+            attribute data.
+        """
+        self._check_obj()
+        return to_table(
+            self.object,
+            domain=domain,
+            names=names,
+            vectors=vectors,
+            backend=backend,
+            categorical=categorical,
+        )
+
+    def iter_tables(
+        self,
+        domains: Sequence[DomainNames | AttributeDomains] | None = None,
+        vectors: VectorLayouts = "components",
+        backend: TableBackends | None = None,
+        categorical: bool = True,
+    ):
+        """
+        Read the attributes of each domain into a table, one domain at a time.
+
+        Parameters
+        ----------
+        domains : Sequence[str or AttributeDomain] | None, optional
+            The domains to read. If None, every domain that has visible attributes.
+        vectors : {"components", "list"}, optional
+            How multi-dimensional attributes are laid out, see `to_table()`.
+        backend : {"polars", "pyarrow"} | None, optional
+            The library to build the tables with, see `to_table()`.
+        categorical : bool, optional
+            Whether to decode categorical attributes into their strings, see
+            `to_table()`. Default is True.
+
+        Yields
+        ------
+        tuple[str, polars.DataFrame | pyarrow.Table]
+            The name of the domain and the table of its attributes.
+        """
+        self._check_obj()
+        return iter_tables(
+            self.object,
+            domains=domains,
+            vectors=vectors,
+            backend=backend,
+            categorical=categorical,
+        )
+
+    def save_snapshot(self, path: str | Path) -> Path:
+        """
+        Save every attribute and the topology of the object to disk.
+
+        Parameters
+        ----------
+        path : str | Path
+            Where to write the snapshot. A path ending in `.npz` is written as a
+            single uncompressed archive, any other path as a directory of `.npy`
+            files with a `manifest.json`.
+
+        Returns
+        -------
+        Path
+            The path the snapshot was written to.
+        """
+        self._check_obj()
+        return save_snapshot(self.object, path)
+
+    def memory_report(self, downcast: bool = False) -> np.ndarray:
+        """
+        Report how much memory each attribute of the object uses.
+
+        Parameters
+        ----------
+        downcast : bool, optional
+            Whether to check if `INT` and `FLOAT_COLOR` attributes could be stored as
+            `INT8` and `BYTE_COLOR`, which reads their values. Default is False.
+
+        Returns
+        -------
+        np.ndarray
+            Structured array with a row for each attribute, largest first. See
+            `databpy.memory_report()` for the fields.
+        """
+        self._check_obj()
+        return memory_report(self.object, downcast=downcast)
+
     def remove_named_attribute(self, name: str) -> None:
         """
         Remove a named attribute from the object.
@@ -715,6 +893,129 @@ class BlenderObject(BlenderObjectAttribute):
         )
         return cls(obj)
 
+    @classmethod
+    def from_table(
+        cls,
+        table: TableLike,
+        position: str | Sequence[str] = ("x", "y", "z"),
+        vectors: Mapping[str, Sequence[str]] | None = None,
+        name: str = "Table",
+        collection: bpy.types.Collection | None = None,
+    ) -> "BlenderObject":
+        """
+        Create a BlenderObject with a point for each row of a table.
+
+        The position columns become the vertices of a new mesh and every other
+        column is stored as a point attribute in a single batch, see `store_table()`
+        for how columns are mapped to attribute types.
+
+        Parameters
+        ----------
+        table : TableLike
+            A dict of arrays, a polars or pandas DataFrame, a pyarrow Table or any
+            object implementing the Arrow PyCapsule stream interface.
+        position : str | Sequence[str], optional
+            The x, y and z columns to use as the positions of the points, or a single
+            column holding (N, 3) vectors. Default is ("x", "y", "z").
+        vectors : Mapping[str, Sequence[str]] | None, optional
+            Further vectors to build from differently named columns, such as
+            `{"velocity": ("vx", "vy", "vz")}`. Columns named `{name}_x`, `{name}_y`
+            and `{name}_z` are grouped automatically.
+        name : str, optional
+            Name of the created object.
+            Default is "Table".
+        collection : bpy.types.Collection or None, optional
+            Blender collection to link the object to.
+            Default is None.
+
+        Returns
+        -------
+        BlenderObject
+            A wrapped Blender mesh object with one vertex per row.
+
+        Examples
+        --------
+        ```python
+        import numpy as np
+        import polars as pl
+        import databpy as db
+
+        df = pl.DataFrame(
+            {
+                "x": np.random.rand(100),
+                "y": np.random.rand(100),
+                "z": np.random.rand(100),
+                "b_factor": np.random.rand(100),
+                "chain_id": np.random.choice(["A", "B"], 100),
+            }
+        )
+        bob = db.BlenderObject.from_table(df)
+        bob["b_factor"]  # FLOAT attribute
+        ```
+        """
+        columns = table_columns(table)
+        if isinstance(position, str):
+            columns["position"] = columns.pop(position)
+        else:
+            columns["position"] = _stack_vector(columns, position)
+            for column in position:
+                del columns[column]
+
+        bob = cls.from_mesh(name=name, collection=collection)
+        # `Mesh.from_pydata()` flattens the vertices through Python tuples, so only add
+        # the vertices here and write the positions along with the other columns
+        bob.data.vertices.add(len(columns["position"]))
+        try:
+            store_table(bob.object, columns, vectors=vectors)
+        except Exception:
+            # don't leave a half-built object behind when a column can't be stored
+            mesh = bob.data
+            bpy.data.objects.remove(bob.object)
+            bpy.data.meshes.remove(mesh)
+            raise
+        return bob
+
+    @classmethod
+    def load_snapshot(
+        cls,
+        path: str | Path,
+        name: str | None = None,
+        collection: bpy.types.Collection | None = None,
+    ) -> "BlenderObject":
+        """
+        Create a BlenderObject from a snapshot written by `save_snapshot()`.
+
+        The arrays are memory-mapped and written to the new object in one batch per
+        domain, so restoring large objects is bound by reading the files.
+
+        Parameters
+        ----------
+        path : str | Path
+            The `.npz` file or directory of the snapshot.
+        name : str | None, optional
+            Name of the created object. Defaults to the name of the saved object.
+        collection : bpy.types.Collection or None, optional
+            Blender collection to link the object to.
+            Default is None.
+
+        Returns
+        -------
+        BlenderObject
+            A wrapped Blender object with the saved geometry and attributes.
+
+        Examples
+        --------
+        ```python
+        import numpy as np
+        import databpy as db
+
+        bob = db.create_bob(np.random.rand(100, 3))
+        bob.save_snapshot("snapshot")
+        restored = db.BlenderObject.load_snapshot("snapshot")
+        ```
+        """
+        return cls(load_snapshot(path, name=name, collection=collection))
+
     def new_from_pydata(
         self,
         vertices: npt.ArrayLike | None = None,
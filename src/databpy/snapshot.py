@@ -0,0 +1,320 @@
+import json
+import struct
+import warnings
+import zipfile
+from pathlib import Path
+
+import bpy
+import numpy as np
+from mathutils import Matrix
+
+from . import stats
+from .attribute import (
+    Attribute,
+    _check_obj_attributes,
+    store_named_attributes,
+)
+from .categorical import CATEGORIES_PROP
+
+# version of the manifest layout, bumped when it changes incompatibly
+SNAPSHOT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+# size of the fixed part of a zip local file header, which is followed by the file
+# name and the extra field before the stored data starts
+_ZIP_LOCAL_HEADER = struct.Struct("<4s22xHH")
+
+# readers of the header of each version of the .npy format that can be memory-mapped
+_NPY_HEADER_READERS = {
+    (1, 0): np.lib.format.read_array_header_1_0,
+    (2, 0): np.lib.format.read_array_header_2_0,
+}
+
+
+def _snapshot_arrays(obj: bpy.types.Object) -> tuple[dict, dict[str, np.ndarray]]:
+    "The manifest and the arrays that make up a snapshot of the object."
+    data = obj.data
+    arrays: dict[str, np.ndarray] = {}
+    attributes = []
+
+    for i, attribute in enumerate(data.attributes):  # type: ignore
+        try:
+            wrapped = Attribute(attribute)
+            array = wrapped.as_array()
+        except KeyError:
+            warnings.warn(
+                f"Attribute '{attribute.name}' of type {attribute.data_type} "
+                "can't be read into an array and isn't part of the snapshot"
+            )
+            continue
+        key = f"attribute_{i:04d}"
+        arrays[key] = array
+        attributes.append(
+            {
+                "name": attribute.name,
+                "domain": attribute.domain,
+                "type": attribute.data_type,
+                "array": key,
+            }
+        )
+
+    topology = {}
+    if isinstance(data, bpy.types.Mesh):
+        topology = {
+            "n_vertices": len(data.vertices),
+            "n_edges": len(data.edges),
+            "n_corners": len(data.loops),
+            "n_faces": len(data.polygons),
+        }
+        face_offsets = np.empty(len(data.polygons), dtype=np.int32)
+        with stats.measure(
+            "foreach_get", obj, "loop_start", len(face_offsets), face_offsets.nbytes
+        ):
+            data.polygons.foreach_get("loop_start", face_offsets)
+        arrays["face_offsets"] = face_offsets
+    elif isinstance(data, bpy.types.Curves):
+        curve_offsets = np.empty(len(data.curves) + 1, dtype=np.int32)
+        with stats.measure(
+            "foreach_get", obj, "curve_offset", len(curve_offsets), curve_offsets.nbytes
+        ):
+            data.curve_offset_data.foreach_get("value", curve_offsets)
+        arrays["curve_offsets"] = curve_offsets
+        topology = {"n_points": len(data.points), "n_curves": len(data.curves)}
+    else:
+        topology = {"n_points": len(data.points)}
+
+    categories = data.get(CATEGORIES_PROP)
+    manifest = {
+        "version": SNAPSHOT_VERSION,
+        "name": obj.name,
+        "type": obj.type,
+        "matrix_basis": [list(row) for row in obj.matrix_basis],
+        "topology": topology,
+        "attributes": attributes,
+        "categories": categories.to_dict() if categories is not None else {},
+    }
+    return manifest, arrays
+
+
+def save_snapshot(obj: bpy.types.Object, path: str | Path) -> Path:
+    """
+    Save every attribute and the topology of an object to disk.
+
+    A path ending in `.npz` is written as a single uncompressed archive, any other
+    path as a directory of `.npy` files. Both contain a `manifest.json` describing
+    each attribute's name, domain and type along with the sizes of the domains, so
+    that `load_snapshot()` can recreate the object without inspecting the arrays.
+
+    Parameters
+    ----------
+    obj : bpy.types.Object
+        The mesh, curves or point cloud object to save.
+    path : str | Path
+        Where to write the snapshot, either a `.npz` file or a directory.
+
+    Returns
+    -------
+    Path
+        The path the snapshot was written to.
+
+    Examples
+    --------
+    ```python
+    import numpy as np
+    import databpy as db
+
+    bob = db.create_bob(np.random.rand(100, 3))
+    db.save_snapshot(bob.object, "stage_1.npz")
+    restored = db.load_snapshot("stage_1.npz")
+    ```
+    """
+    _check_obj_attributes(obj)
+    path = Path(path)
+    manifest, arrays = _snapshot_arrays(obj)
+    manifest_bytes = json.dumps(manifest, indent=2).encode()
+
+    if path.suffix == ".npz":
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # the arrays are stored rather than compressed so that they can be mapped
+        # straight from the archive when loading
+        with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED) as archive:
+            archive.writestr(MANIFEST_NAME, manifest_bytes)
+            for key, array in arrays.items():
+                with archive.open(f"{key}.npy", "w", force_zip64=True) as f:
+                    np.lib.format.write_array(f, array, allow_pickle=False)
+        return path
+
+    path.mkdir(parents=True, exist_ok=True)
+    for key, array in arrays.items():
+        np.save(path / f"{key}.npy", array, allow_pickle=False)
+    (path / MANIFEST_NAME).write_bytes(manifest_bytes)
+    return path
+
+
+def _map_npz_member(path: Path, archive: zipfile.ZipFile, key: str) -> np.ndarray:
+    "Memory-map an array stored in an uncompressed .npz archive."
+    info = archive.getinfo(f"{key}.npy")
+    if info.compress_type != zipfile.ZIP_STORED:
+        with archive.open(info) as f:
+            return np.lib.format.read_array(f, allow_pickle=False)
+
+    with open(path, "rb") as f:
+        f.seek(info.header_offset)
+        signature, name_length, extra_length = _ZIP_LOCAL_HEADER.unpack(
+            f.read(_ZIP_LOCAL_HEADER.size)
+        )
+        if signature != b"PK\x03\x04":
+            raise ValueError(f"Corrupt snapshot archive: {path}")
+        f.seek(name_length + extra_length, 1)
+
+        read_header = _NPY_HEADER_READERS.get(np.lib.format.read_magic(f))
+        if read_header is not None:
+            shape, fortran_order, dtype = read_header(f)
+            offset = f.tell()
+
+    if read_header is None:
+        # numpy has no public reader for the header of newer versions of the format
+        with archive.open(info) as f:
+            return np.lib.format.read_array(f, allow_pickle=False)
+
+    if 0 in shape:
+        return np.empty(shape, dtype=dtype)
+    order = "F" if fortran_order else "C"
+    return np.memmap(
+        path, dtype=dtype, mode="r", shape=shape, order=order, offset=offset
+    )
+
+
+def _read_snapshot(path: Path, mmap: bool) -> tuple[dict, dict[str, np.ndarray]]:
+    mmap_mode = "r" if mmap else None
+    if path.is_dir():
+        manifest = json.loads((path / MANIFEST_NAME).read_text())
+        arrays = {
+            file.stem: np.load(file, mmap_mode=mmap_mode, allow_pickle=False)
+            for file in path.glob("*.npy")
+        }
+        return manifest, arrays
+
+    with zipfile.ZipFile(path) as archive:
+        manifest = json.loads(archive.read(MANIFEST_NAME))
+        arrays = {}
+        for name in archive.namelist():
+            if not name.endswith(".npy"):
+                continue
+            key = name.removesuffix(".npy")
+            if mmap:
+                arrays[key] = _map_npz_member(path, archive, key)
+            else:
+                with archive.open(name) as f:
+                    arrays[key] = np.lib.format.read_array(f, allow_pickle=False)
+    return manifest, arrays
+
+
+def _new_snapshot_object(
+    manifest: dict,
+    arrays: dict[str, np.ndarray],
+    name: str,
+    collection: bpy.types.Collection | None,
+) -> bpy.types.Object:
+    "Create an object with the domain sizes of the snapshot, without any values."
+    # `object` imports this module to add snapshots to `BlenderObject`
+    from .object import (
+        create_curves_object,
+        create_mesh_object,
+        create_pointcloud_object,
+    )
+
+    topology = manifest["topology"]
+    object_type = manifest["type"]
+
+    if object_type == "CURVES":
+        obj = create_curves_object(name=name, collection=collection)
+        offsets = np.asarray(arrays["curve_offsets"])
+        if topology["n_curves"]:
+            obj.data.add_curves(np.diff(offsets).tolist())  # type: ignore
+        return obj
+
+    if object_type == "POINTCLOUD":
+        # point clouds can't be resized through the Python API, so they are created
+        # the same way as any other point cloud and the positions are overwritten
+        positions = np.zeros((topology["n_points"], 3), dtype=np.float32)
+        return create_pointcloud_object(positions, name=name, collection=collection)
+
+    obj = create_mesh_object(name=name, collection=collection)
+    mesh: bpy.types.Mesh = obj.data  # type: ignore
+    mesh.vertices.add(topology["n_vertices"])
+    mesh.edges.add(topology["n_edges"])
+    mesh.loops.add(topology["n_corners"])
+    mesh.polygons.add(topology["n_faces"])
+    face_offsets = np.asarray(arrays["face_offsets"])
+    with stats.measure(
+        "foreach_set", name, "loop_start", len(face_offsets), face_offsets.nbytes
+    ):
+        mesh.polygons.foreach_set("loop_start", face_offsets)
+    return obj
+
+
+def load_snapshot(
+    path: str | Path,
+    name: str | None = None,
+    collection: bpy.types.Collection | None = None,
+    mmap: bool = True,
+) -> bpy.types.Object:
+    """
+    Recreate an object from a snapshot written by `save_snapshot()`.
+
+    The arrays are memory-mapped by default and handed straight to
+    `store_named_attributes()` for each domain, so restoring large objects is bound
+    by reading the files rather than by Python.
+
+    Parameters
+    ----------
+    path : str | Path
+        The `.npz` file or directory of the snapshot.
+    name : str | None, optional
+        Name of the new object. Defaults to the name of the saved object.
+    collection : bpy.types.Collection | None, optional
+        The collection to link the object to. Defaults to None, which links it to
+        "Collection" the same as `create_object()`.
+    mmap : bool, optional
+        Whether to memory-map the arrays rather than reading them into memory first.
+        Default is True.
+
+    Returns
+    -------
+    bpy.types.Object
+        The restored object.
+
+    Raises
+    ------
+    ValueError
+        If the snapshot was written by a newer, incompatible version.
+    """
+    path = Path(path)
+    manifest, arrays = _read_snapshot(path, mmap)
+    if manifest.get("version", 0) > SNAPSHOT_VERSION:
+        raise ValueError(
+            f"Snapshot version {manifest['version']} is newer than the supported "
+            f"version {SNAPSHOT_VERSION}"
+        )
+
+    obj = _new_snapshot_object(manifest, arrays, name or manifest["name"], collection)
+    obj.matrix_basis = Matrix(manifest["matrix_basis"])
+
+    by_domain: dict[str, list[dict]] = {}
+    for attribute in manifest["attributes"]:
+        by_domain.setdefault(attribute["domain"], []).append(attribute)
+
+    for domain, attributes in by_domain.items():
+        store_named_attributes(
+            obj,
+            {a["name"]: arrays[a["array"]] for a in attributes},
+            atypes={a["name"]: a["type"] for a in attributes},
+            domain=domain,
+        )
+
+    if manifest["categories"]:
+        obj.data[CATEGORIES_PROP] = manifest["categories"]  # type: ignore
+    if isinstance(obj.data, bpy.types.Mesh):
+        obj.data.update()
+    return obj
@@ -0,0 +1,351 @@
+import time
+from dataclasses import dataclass
+from typing import Literal
+
+import bpy
+import numpy as np
+
+Operation = Literal["foreach_get", "foreach_set", "refresh", "evaluate", "uuid_lookup"]
+OPERATIONS: tuple[Operation, ...] = (
+    "foreach_get",
+    "foreach_set",
+    "refresh",
+    "evaluate",
+    "uuid_lookup",
+)
+GroupBy = Literal["operation", "object", "attribute"]
+
+# the profiler that is currently recording, if any. Instrumented code only checks
+# this through `measure()` so that profiling costs a single call and comparison when
+# it's off
+_ACTIVE: "Profiler | None" = None
+
+
+@dataclass
+class OperationStats:
+    """
+    Accumulated counts for one kind of operation.
+
+    Attributes
+    ----------
+    n_calls : int
+        Number of times the operation was performed.
+    n_elements : int
+        Number of elements of the domain read or written, or the number of objects
+        searched by a `uuid_lookup`.
+    n_bytes : int
+        Number of bytes copied between numpy and Blender.
+    seconds : float
+        Wall time spent in the operation.
+    """
+
+    n_calls: int = 0
+    n_elements: int = 0
+    n_bytes: int = 0
+    seconds: float = 0.0
+
+    def add(self, other: "OperationStats") -> None:
+        self.n_calls += other.n_calls
+        self.n_elements += other.n_elements
+        self.n_bytes += other.n_bytes
+        self.seconds += other.seconds
+
+
+class Profiler:
+    """
+    Record how much data databpy moves between numpy and Blender.
+
+    While the profiler is active every `foreach_get()` and `foreach_set()` of attribute
+    data, every refresh of an object after writing, every `evaluate_object()` and every
+    fallback to searching the scene with `get_from_uuid()` is counted and timed. The
+    counts are kept per operation, object and attribute so they can be broken down with
+    `totals()` or `to_array()`.
+
+    Attributes read or written through `Attribute` directly are recorded against the
+    name of the data-block that owns them, such as the mesh, as the object isn't known.
+
+    When no profiler is active the instrumented code only checks whether one is, so
+    leaving the instrumentation in place costs next to nothing. Profilers can be
+    nested, in which case only the innermost one records.
+
+    Attributes
+    ----------
+    entries : dict[tuple[str, str, str], OperationStats]
+        The counts for each `(operation, object, attribute)`. The attribute is an
+        empty string for operations on a whole object.
+
+    Examples
+    --------
+    ```python
+    import numpy as np
+    import databpy as db
+
+    bob = db.create_bob(np.random.rand(1000, 3))
+    with db.stats.Profiler() as profiler:
+        bob.store_named_attribute(np.random.rand(1000), "b_factor")
+        bob.named_attribute("position")
+
+    print(profiler.report())
+    profiler.totals("operation")["foreach_set"].n_bytes
+    ```
+    """
+
+    def __init__(self):
+        self.entries: dict[tuple[str, str, str], OperationStats] = {}
+        self._previous: "Profiler | None" = None
+
+    def __enter__(self) -> "Profiler":
+        global _ACTIVE
+        self._previous = _ACTIVE
+        _ACTIVE = self
+        return self
+
+    def __exit__(self, type, value, traceback) -> None:
+        global _ACTIVE
+        _ACTIVE = self._previous
+        self._previous = None
+
+    def reset(self) -> None:
+        "Forget everything recorded so far."
+        self.entries.clear()
+
+    def record(
+        self,
+        operation: Operation,
+        owner: str,
+        attribute: str = "",
+        n_elements: int = 0,
+        n_bytes: int = 0,
+        seconds: float = 0.0,
+    ) -> None:
+        "Add a single call of an operation to the counts."
+        key = (operation, owner, attribute)
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self.entries[key] = OperationStats()
+        entry.n_calls += 1
+        entry.n_elements += n_elements
+        entry.n_bytes += n_bytes
+        entry.seconds += seconds
+
+    def totals(self, *by: GroupBy) -> dict[tuple[str, ...] | str, OperationStats]:
+        """
+        Sum the counts over everything but the given fields.
+
+        Parameters
+        ----------
+        *by : str
+            Any of "operation", "object" and "attribute" to group by. With a single
+            field the keys are plain strings, otherwise tuples in the given order.
+            Without any fields everything is summed under the key "total".
+
+        Returns
+        -------
+        dict[tuple[str, ...] | str, OperationStats]
+            The summed counts for each group.
+        """
+        fields = ("operation", "object", "attribute")
+        for name in by:
+            if name not in fields:
+                raise ValueError(f"Can't group by '{name}', must be one of {fields}")
+        indices = [fields.index(name) for name in by]
+
+        totals: dict[tuple[str, ...] | str, OperationStats] = {}
+        for key, entry in self.entries.items():
+            if not indices:
+                group = "total"
+            elif len(indices) == 1:
+                group = key[indices[0]]
+            else:
+                group = tuple(key[i] for i in indices)
+            if group not in totals:
+                totals[group] = OperationStats()
+            totals[group].add(entry)
+        return totals
+
+    def to_array(self) -> np.ndarray:
+        """
+        The counts as a structured array with a row for each operation, object and
+        attribute, which can be sorted with `np.sort(array, order="seconds")`.
+
+        Returns
+        -------
+        np.ndarray
+            Structured array with the fields `operation`, `object`, `attribute`,
+            `n_calls`, `n_elements`, `n_bytes` and `seconds`.
+        """
+        width = max((len(s) for key in self.entries for s in key), default=1)
+        dtype = np.dtype(
+            [
+                ("operation", f"U{len(max(OPERATIONS, key=len))}"),
+                ("object", f"U{width}"),
+                ("attribute", f"U{width}"),
+                ("n_calls", np.int64),
+                ("n_elements", np.int64),
+                ("n_bytes", np.int64),
+                ("seconds", np.float64),
+            ]
+        )
+        return np.array(
+            [
+                (*key, e.n_calls, e.n_elements, e.n_bytes, e.seconds)
+                for key, e in self.entries.items()
+            ],
+            dtype=dtype,
+        )
+
+    def report(self, limit: int | None = 20) -> str:
+        """
+        A table of the recorded operations, slowest first.
+
+        Parameters
+        ----------
+        limit : int | None, optional
+            The number of rows to include. Default is 20, None includes every row.
+
+        Returns
+        -------
+        str
+            The formatted table.
+        """
+        rows = sorted(self.entries.items(), key=lambda item: -item[1].seconds)
+        if limit is not None:
+            rows = rows[:limit]
+        header = ("operation", "object", "attribute", "calls", "elements", "MB", "ms")
+        lines = [
+            (
+                operation,
+                owner,
+                attribute,
+                str(e.n_calls),
+                str(e.n_elements),
+                f"{e.n_bytes / 1e6:.2f}",
+                f"{e.seconds * 1e3:.2f}",
+            )
+            for (operation, owner, attribute), e in rows
+        ]
+        widths = [max(len(row[i]) for row in [header, *lines]) for i in range(7)]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(w) if i < 3 else cell.rjust(w)
+                for i, (cell, w) in enumerate(zip(row, widths))
+            ).rstrip()
+            for row in [header, *lines]
+        )
+
+
+class Measurement:
+    """
+    Times the block it wraps and records it on the profiler that was active when it
+    was created. Returned by `measure()`.
+
+    Names of Blender data and the length of an attribute's data are only looked up
+    once the block has finished, so that nothing is read when profiling is off.
+    """
+
+    def __init__(
+        self,
+        profiler: Profiler,
+        operation: Operation,
+        owner: "str | bpy.types.ID",
+        attribute: "str | bpy.types.Attribute",
+        n_elements: int | None,
+        n_bytes: int,
+    ):
+        self.profiler = profiler
+        self.operation = operation
+        self.owner = owner
+        self.attribute = attribute
+        self.n_elements = n_elements
+        self.n_bytes = n_bytes
+        self.started = 0.0
+
+    def __enter__(self) -> "Measurement":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, type, value, traceback) -> None:
+        seconds = time.perf_counter() - self.started
+        # failed operations aren't counted
+        if type is not None:
+            return
+        owner, attribute, n_elements = self.owner, self.attribute, self.n_elements
+        if not isinstance(attribute, str):
+            if n_elements is None:
+                n_elements = len(attribute.data)
+            if owner == "":
+                owner = attribute.id_data
+            attribute = attribute.name
+        if not isinstance(owner, str):
+            owner = owner.name
+        self.profiler.record(
+            self.operation, owner, attribute, n_elements or 0, self.n_bytes, seconds
+        )
+
+    def update(
+        self, owner: "str | bpy.types.ID | None" = None, n_elements: int | None = None
+    ) -> None:
+        "Change what is recorded once it is known inside of the block."
+        if owner is not None:
+            self.owner = owner
+        if n_elements is not None:
+            self.n_elements = n_elements
+
+
+class _NotMeasuring(Measurement):
+    "Stands in for a `Measurement` when no profiler is active."
+
+    def __init__(self):
+        pass
+
+    def __enter__(self) -> "_NotMeasuring":
+        return self
+
+    def __exit__(self, type, value, traceback) -> None:
+        pass
+
+    def update(self, owner=None, n_elements=None) -> None:
+        pass
+
+
+_NOT_MEASURING = _NotMeasuring()
+
+
+def measure(
+    operation: Operation,
+    owner: "str | bpy.types.ID" = "",
+    attribute: "str | bpy.types.Attribute" = "",
+    n_elements: int | None = None,
+    n_bytes: int = 0,
+) -> Measurement:
+    """
+    Time a block of code as an operation on the active profiler.
+
+    ```python
+    with stats.measure("foreach_set", obj, attribute, n_bytes=array.nbytes):
+        attribute.data.foreach_set("value", array)
+    ```
+
+    Parameters
+    ----------
+    operation : str
+        The kind of operation.
+    owner : str | bpy.types.ID, optional
+        The object or data-block operated on, or its name. Defaults to the data-block
+        owning `attribute`.
+    attribute : str | bpy.types.Attribute, optional
+        The attribute read or written, or its name.
+    n_elements : int | None, optional
+        Number of elements read or written. Defaults to the length of the data of
+        `attribute`, or 0 if it is given by name.
+    n_bytes : int, optional
+        Number of bytes copied between numpy and Blender.
+
+    Returns
+    -------
+    Measurement
+        A context manager, which does nothing when no profiler is active.
+    """
+    if _ACTIVE is None:
+        return _NOT_MEASURING
+    return Measurement(_ACTIVE, operation, owner, attribute, n_elements, n_bytes)
@@ -0,0 +1,504 @@
+from typing import Any, Iterator, Literal, Mapping, Sequence
+
+import bpy
+import numpy as np
+
+from .attribute import (
+    Attribute,
+    AttributeDomains,
+    AttributeTypes,
+    DomainNames,
+    NamedAttributeError,
+    _check_obj_attributes,
+    _match_domain,
+    guess_atype_from_array,
+    store_named_attributes,
+)
+from .categorical import (
+    CATEGORIES_PROP,
+    _encode_categorical,
+    _store_categories,
+    categories,
+)
+
+# columns named "{name}_x", "{name}_y" and "{name}_z" are stored as a single vector
+VECTOR_SUFFIXES = ("_x", "_y", "_z")
+
+# anything that `table_columns()` can read columns from: a dict of arrays, a polars or
+# pandas DataFrame, a pyarrow Table or any object implementing the Arrow stream
+# interface
+TableLike = Mapping[str, Any] | Any
+
+VectorLayouts = Literal["components", "list"]
+TableBackends = Literal["polars", "pyarrow"]
+
+# suffixes of the per-component columns that multi-dimensional attributes are split
+# into, matching `VECTOR_SUFFIXES` so that vectors are grouped again when stored
+_COMPONENT_SUFFIXES = {
+    AttributeTypes.FLOAT2: ("_x", "_y"),
+    AttributeTypes.INT32_2D: ("_x", "_y"),
+    AttributeTypes.FLOAT_VECTOR: VECTOR_SUFFIXES,
+    AttributeTypes.FLOAT_COLOR: ("_r", "_g", "_b", "_a"),
+    AttributeTypes.BYTE_COLOR: ("_r", "_g", "_b", "_a"),
+    AttributeTypes.QUATERNION: ("_w", "_x", "_y", "_z"),
+    AttributeTypes.FLOAT4X4: tuple(f"_{i}{j}" for i in range(4) for j in range(4)),
+}
+
+
+def _column_to_numpy(column: Any) -> np.ndarray:
+    if isinstance(column, np.ndarray):
+        return column
+    try:
+        # pyarrow arrays refuse to convert booleans or nulls without this
+        return np.asarray(column.to_numpy(zero_copy_only=False))
+    except (AttributeError, TypeError):
+        pass
+    try:
+        return np.asarray(column.to_numpy())
+    except AttributeError:
+        return np.asarray(column)
+
+
+def _from_arrow_stream(table: Any) -> Any:
+    "Read an object implementing `__arrow_c_stream__` into a table we can read from."
+    try:
+        import pyarrow
+
+        return pyarrow.table(table)
+    except ImportError:
+        pass
+    try:
+        import polars
+
+        return polars.DataFrame(table)
+    except ImportError:
+        raise TypeError(
+            "Reading an Arrow compatible table requires either pyarrow or polars"
+        )
+
+
+def table_columns(table: TableLike) -> dict[str, np.ndarray]:
+    """
+    Get the columns of a table as numpy arrays.
+
+    Columns are converted without copying wherever the source allows it, and without
+    going through pandas or Python objects.
+
+    Parameters
+    ----------
+    table : TableLike
+        A dict of arrays, a polars or pandas DataFrame, a pyarrow Table or any
+        object implementing the Arrow PyCapsule stream interface.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        One array for each column, in the order of the table's columns.
+
+    Raises
+    ------
+    TypeError
+        If columns can't be read from the table.
+    """
+    if isinstance(table, Mapping):
+        return {str(name): _column_to_numpy(col) for name, col in table.items()}
+
+    # pyarrow Table and RecordBatch
+    column_names = getattr(table, "column_names", None)
+    if column_names is not None:
+        return {name: _column_to_numpy(table.column(name)) for name in column_names}
+
+    # polars DataFrame
+    if hasattr(table, "get_column"):
+        return {
+            name: _column_to_numpy(table.get_column(name)) for name in table.columns
+        }
+
+    if hasattr(table, "__arrow_c_stream__"):
+        return table_columns(_from_arrow_stream(table))
+
+    # pandas and other DataFrames that can be indexed by column name
+    if hasattr(table, "columns"):
+        return {str(name): _column_to_numpy(table[name]) for name in table.columns}
+
+    raise TypeError(f"Can't read columns from a table of type {type(table)}")
+
+
+def _stack_vector(columns: dict[str, np.ndarray], names: Sequence[str]) -> np.ndarray:
+    "Interleave three columns into a single float32 array, casting while copying."
+    try:
+        components = [columns[name] for name in names]
+    except KeyError as e:
+        raise ValueError(f"Table has no column {e} to build a vector from {names}")
+    vector = np.empty((len(components[0]), len(components)), dtype=np.float32)
+    for i, component in enumerate(components):
+        vector[:, i] = component
+    return vector
+
+
+def _group_vectors(
+    columns: dict[str, np.ndarray], vectors: Mapping[str, Sequence[str]] | None
+) -> dict[str, np.ndarray]:
+    "Replace the component columns of each vector with a single vector column."
+    vectors = dict(vectors or {})
+    for name in columns:
+        if not name.endswith(VECTOR_SUFFIXES[0]):
+            continue
+        base = name[: -len(VECTOR_SUFFIXES[0])]
+        components = [base + suffix for suffix in VECTOR_SUFFIXES]
+        if base and base not in vectors and all(c in columns for c in components):
+            vectors[base] = components
+
+    used = {name for components in vectors.values() for name in components}
+    grouped = {name: col for name, col in columns.items() if name not in used}
+    for name, components in vectors.items():
+        grouped[name] = _stack_vector(columns, components)
+    return grouped
+
+
+def _check_int32_range(name: str, column: np.ndarray) -> None:
+    "Raise if the integer column has values that `INT` attributes can't hold."
+    if column.size == 0 or np.can_cast(column.dtype, np.int32):
+        return
+    info = np.iinfo(np.int32)
+    low, high = column.min(), column.max()
+    if low < info.min or high > info.max:
+        raise ValueError(
+            f"Column '{name}' has values from {low} to {high}, which don't fit in a "
+            f"32-bit INT attribute ({info.min} to {info.max})"
+        )
+
+
+def _column_atype(name: str, column: np.ndarray) -> AttributeTypes | None:
+    "Attribute type to store the column as, or None for string columns."
+    kind = column.dtype.kind
+    if kind in "OUS":
+        return None
+    # integer attributes are at most 32-bit, so larger values would wrap around
+    if kind in "iu":
+        _check_int32_range(name, column)
+    if column.ndim == 1:
+        if kind == "b":
+            return AttributeTypes.BOOLEAN
+        if column.dtype == np.int8:
+            return AttributeTypes.INT8
+        # unsigned bytes would wrap around when stored as INT8 so widen them
+        if kind in "iu":
+            return AttributeTypes.INT
+        if kind == "f":
+            return AttributeTypes.FLOAT
+        raise TypeError(f"Column '{name}' has unsupported dtype {column.dtype}")
+    return guess_atype_from_array(column)
+
+
+def store_table(
+    obj: bpy.types.Object,
+    table: TableLike,
+    domain: DomainNames | AttributeDomains = AttributeDomains.POINT,
+    position: str | Sequence[str] | None = None,
+    vectors: Mapping[str, Sequence[str]] | None = None,
+) -> list[str]:
+    """
+    Store every column of a table as an attribute on the object.
+
+    Column types are mapped to attribute types (floats to `FLOAT`, integers to `INT`,
+    booleans to `BOOLEAN`, strings to categorical attributes) and columns named
+    `{name}_x`, `{name}_y` and `{name}_z` are grouped into a single `FLOAT_VECTOR`
+    attribute called `{name}`. All attributes are written in a single batch with one
+    refresh of the object data at the end.
+
+    Parameters
+    ----------
+    obj : bpy.types.Object
+        The Blender object.
+    table : TableLike
+        A dict of arrays, a polars or pandas DataFrame, a pyarrow Table or any
+        object implementing the Arrow PyCapsule stream interface. Each column must
+        have one value for each element of the domain.
+    domain : str or AttributeDomains, optional
+        The domain to store the attributes on, by default 'POINT'.
+    position : str | Sequence[str] | None, optional
+        Column, or the x, y and z columns, to store as the `position` attribute.
+    vectors : Mapping[str, Sequence[str]] | None, optional
+        Further vectors to build from differently named columns, such as
+        `{"velocity": ("vx", "vy", "vz")}`.
+
+    Returns
+    -------
+    list[str]
+        The names of the stored attributes.
+
+    Raises
+    ------
+    TypeError
+        If columns can't be read from the table or a column has an unsupported type.
+    ValueError
+        If a column that a vector is built from doesn't exist, or an integer column
+        has values that don't fit in a 32-bit `INT` attribute.
+    NamedAttributeError
+        If a column's length doesn't match the size of the domain.
+    """
+    _check_obj_attributes(obj)
+    if isinstance(position, str):
+        position = [position]
+    if position is not None:
+        vectors = {**(vectors or {}), "position": position}
+
+    columns = table_columns(table)
+    # a single position column can already hold vectors, so it isn't stacked
+    if position is not None and len(position) == 1:
+        vectors.pop("position")  # type: ignore
+        columns["position"] = columns.pop(position[0])
+    columns = _group_vectors(columns, vectors)
+
+    arrays = {}
+    atypes = {}
+    categorical = {}
+    for name, column in columns.items():
+        atype = _column_atype(name, column)
+        if atype is None:
+            values, codes, atype = _encode_categorical(obj, column, name)
+            categorical[name] = values
+            column = codes
+        arrays[name] = column.astype(atype.value.dtype, copy=False)
+        atypes[name] = atype
+
+    store_named_attributes(obj, arrays, atypes=atypes, domain=domain)
+    for name, values in categorical.items():
+        _store_categories(obj, name, values, tree_name=None)
+
+    return list(arrays)
+
+
+def _domain_attributes(
+    obj: bpy.types.Object, domain: str, names: Sequence[str] | None
+) -> list[Attribute]:
+    if names is not None:
+        attributes = []
+        for name in names:
+            attribute = obj.data.attributes.get(name)  # type: ignore
+            if attribute is None or attribute.domain != domain:
+                raise NamedAttributeError(
+                    f"The object has no attribute '{name}' on the {domain} domain"
+                )
+            attributes.append(Attribute(attribute))
+        return attributes
+
+    attributes = []
+    for attribute in obj.data.attributes:  # type: ignore
+        if attribute.domain != domain or attribute.name.startswith("."):
+            continue
+        if attribute.data_type not in AttributeTypes.__members__:
+            # types such as strings that can't be read into arrays
+            continue
+        attributes.append(Attribute(attribute))
+    return attributes
+
+
+def table_arrays(
+    obj: bpy.types.Object,
+    domain: DomainNames | AttributeDomains = AttributeDomains.POINT,
+    names: Sequence[str] | None = None,
+    vectors: VectorLayouts = "components",
+    categorical: bool = True,
+) -> dict[str, np.ndarray]:
+    """
+    Read the attributes of a domain into one contiguous array per column.
+
+    Parameters
+    ----------
+    obj : bpy.types.Object
+        The Blender object.
+    domain : str or AttributeDomains, optional
+        The domain to read the attributes of, by default 'POINT'.
+    names : Sequence[str] | None, optional
+        The attributes to read. If None, every attribute on the domain that isn't
+        hidden (starting with ".") is read.
+    vectors : {"components", "list"}, optional
+        Whether multi-dimensional attributes are split into one column per component,
+        such as `position_x`, `position_y` and `position_z`, or kept as a single
+        (N, k) column. Default is "components".
+    categorical : bool, optional
+        Whether to decode categorical attributes into their strings, rather than
+        reading the integer codes. Default is True.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        One array for each column.
+
+    Raises
+    ------
+    NamedAttributeError
+        If one of the given names isn't an attribute on the domain.
+    """
+    _check_obj_attributes(obj)
+    domain = _match_domain(domain)
+    if vectors not in ("components", "list"):
+        raise ValueError(f"vectors must be 'components' or 'list', not {vectors!r}")
+
+    decoded = obj.data.get(CATEGORIES_PROP, {}) if categorical else {}  # type: ignore
+    columns = {}
+    for attribute in _domain_attributes(obj, domain, names):
+        array = attribute.as_array()
+        if attribute.name in decoded:
+            columns[attribute.name] = categories(obj, attribute.name)[array]
+            continue
+        if array.ndim == 1 or vectors == "list":
+            columns[attribute.name] = array
+            continue
+
+        # the values of each component are interleaved in Blender's storage, so copy
+        # them once into rows that are each contiguous
+        components = np.ascontiguousarray(array.reshape(len(array), -1).T)
+        for suffix, component in zip(_COMPONENT_SUFFIXES[attribute.atype], components):
+            columns[attribute.name + suffix] = component
+    return columns
+
+
+def _resolve_backend(backend: TableBackends | None) -> TableBackends:
+    if backend is not None:
+        if backend not in ("polars", "pyarrow"):
+            raise ValueError(f"backend must be 'polars' or 'pyarrow', not {backend!r}")
+        return backend
+    for name in ("polars", "pyarrow"):
+        try:
+            __import__(name)
+            return name  # type: ignore
+        except ImportError:
+            continue
+    raise ImportError("Exporting tables requires either polars or pyarrow")
+
+
+def _build_table(columns: dict[str, np.ndarray], backend: TableBackends) -> Any:
+    "Wrap the arrays in a table without copying them where the format allows it."
+    if backend == "polars":
+        import polars
+
+        return polars.DataFrame(
+            [polars.Series(name, array) for name, array in columns.items()]
+        )
+
+    import pyarrow
+
+    arrays = []
+    for array in columns.values():
+        if array.ndim == 1:
+            arrays.append(pyarrow.array(array))
+        else:
+            values = pyarrow.array(array.reshape(-1))
+            width = int(np.prod(array.shape[1:]))
+            arrays.append(pyarrow.FixedSizeListArray.from_arrays(values, width))
+    return pyarrow.table(arrays, names=list(columns))
+
+
+def to_table(
+    obj: bpy.types.Object,
+    domain: DomainNames | AttributeDomains = AttributeDomains.POINT,
+    names: Sequence[str] | None = None,
+    vectors: VectorLayouts = "components",
+    backend: TableBackends | None = None,
+    categorical: bool = True,
+) -> Any:
+    """
+    Read the attributes of a domain into a polars DataFrame or pyarrow Table.
+
+    Each attribute is read once into a single contiguous array, which the table is
+    then built over without copying. Only boolean columns are copied by pyarrow, as
+    Arrow stores booleans as bits, and categorical attributes are decoded into
+    string columns, so that storing the table again with `store_table()` gives the
+    same attributes.
+
+    Parameters
+    ----------
+    obj : bpy.types.Object
+        The Blender object.
+    domain : str or AttributeDomains, optional
+        The domain to read the attributes of, by default 'POINT'.
+    names : Sequence[str] | None, optional
+        The attributes to read. If None, every attribute on the domain that isn't
+        hidden (starting with ".") is read.
+    vectors : {"components", "list"}, optional
+        Whether multi-dimensional attributes are split into one column per component,
+        such as `position_x`, or kept as a single fixed-size list column, which avoids
+        the copy needed to split them. Default is "components".
+    backend : {"polars", "pyarrow"} | None, optional
+        The library to build the table with. If None, polars is used if it is
+        installed and pyarrow otherwise.
+    categorical : bool, optional
+        Whether to decode categorical attributes into their strings, rather than
+        exporting the integer codes. Default is True.
+
+    Returns
+    -------
+    polars.DataFrame | pyarrow.Table
+        A table with one row per element of the domain.
+
+    Raises
+    ------
+    ImportError
+        If neither polars nor pyarrow is installed.
+
+    Examples
+    --------
+    ```python
+    import numpy as np
+    import databpy as db
+
+    bob = db.create_bob(np.random.rand(100, 3))
+    bob.store_named_attribute(np.random.rand(100), "b_factor")
+    df = db.to_table(bob.object)
+    df.columns  # ['b_factor', 'position_x', 'position_y', 'position_z']
+    ```
+    """
+    backend = _resolve_backend(backend)
+    return _build_table(table_arrays(obj, domain, names, vectors, categorical), backend)
+
+
+def iter_tables(
+    obj: bpy.types.Object,
+    domains: Sequence[DomainNames | AttributeDomains] | None = None,
+    vectors: VectorLayouts = "components",
+    backend: TableBackends | None = None,
+    categorical: bool = True,
+) -> Iterator[tuple[str, Any]]:
+    """
+    Read the attributes of each domain into a table, one domain at a time.
+
+    Only the columns of the domain that is currently being yielded are held in
+    memory, so peak memory is bounded by the largest domain rather than the whole
+    object.
+
+    Parameters
+    ----------
+    obj : bpy.types.Object
+        The Blender object.
+    domains : Sequence[str or AttributeDomains] | None, optional
+        The domains to read. If None, every domain that has visible attributes.
+    vectors : {"components", "list"}, optional
+        How multi-dimensional attributes are laid out, see `to_table()`.
+    backend : {"polars", "pyarrow"} | None, optional
+        The library to build the tables with, see `to_table()`.
+    categorical : bool, optional
+        Whether to decode categorical attributes into their strings, see
+        `to_table()`. Default is True.
+
+    Yields
+    ------
+    tuple[str, polars.DataFrame | pyarrow.Table]
+        The name of the domain and the table of its attributes.
+    """
+    _check_obj_attributes(obj)
+    backend = _resolve_backend(backend)
+    if domains is None:
+        present = {
+            attribute.domain
+            for attribute in obj.data.attributes  # type: ignore
+            if not attribute.name.startswith(".")
+        }
+        domains = [d.value for d in AttributeDomains if d.value in present]
+
+    for domain in domains:
+        domain = _match_domain(domain)
+        arrays = table_arrays(obj, domain, None, vectors, categorical)
+        yield domain, _build_table(arrays, backend)
@@ -0,0 +1,637 @@
+import math
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Literal, Mapping
+
+import bpy
+import numpy as np
+from numpy import typing as npt
+
+from . import stats
+from .attribute import (
+    AttributeDomains,
+    AttributeMismatchError,
+    AttributeTypes,
+    DomainNames,
+    _domain_size,
+    _forget_written,
+    _match_domain,
+    _refresh_object_data,
+    store_named_attribute,
+)
+from .object import BlenderObject, LinkedObjectError
+from .utils import content_hash, lerp
+
+# a frame source is either an array indexed by frame along its first axis, such as a
+# `np.memmap` of a trajectory on disk, or a callable returning the data for a frame
+FrameSource = np.ndarray | Callable[[int], np.ndarray]
+
+# how a player decides that an attribute needs writing: when the frame index of its
+# source changes, or only when the hash of the frame data changes as well
+ChangeDetection = Literal["index", "hash"]
+
+# number of frame timings kept by default, older timings are discarded
+MAX_TIMINGS = 1000
+
+# default memory budget for the frames held by a `FramePrefetcher`
+PREFETCH_BYTES = 512 * 2**20
+
+# attribute types that are interpolated between frames, all others show the earlier
+# frame, as interpolating integers, rotations or matrices component-wise is invalid
+INTERPOLATED_TYPES = (
+    AttributeTypes.FLOAT,
+    AttributeTypes.FLOAT2,
+    AttributeTypes.FLOAT_VECTOR,
+    AttributeTypes.FLOAT_COLOR,
+)
+
+
+@dataclass
+class FrameTiming:
+    """
+    Timing of a single frame update of a `TrajectoryPlayer`.
+
+    Attributes
+    ----------
+    frame : float
+        The scene frame that was updated to, including any subframe.
+    index : int
+        The index into the frame sources that was read for the frame.
+    read : float
+        Seconds spent getting the frame data from the sources into the write buffers.
+    write : float
+        Seconds spent writing the buffers to the attributes and refreshing the object.
+    n_written : int
+        Number of attributes that were written, attributes which were already showing
+        the frame are skipped.
+    n_skipped : int
+        Number of attributes whose data was read but not written, as its hash matched
+        the data the attribute already holds.
+    n_bytes : int
+        Number of bytes of attribute data that were written.
+    """
+
+    frame: float
+    index: int
+    read: float = 0.0
+    write: float = 0.0
+    n_written: int = 0
+    n_skipped: int = 0
+    n_bytes: int = 0
+
+    @property
+    def total(self) -> float:
+        "Total seconds spent on the frame update."
+        return self.read + self.write
+
+
+def _source_length(source: FrameSource) -> int | None:
+    "Number of frames of the source, None if it can't tell."
+    try:
+        return len(source)  # type: ignore
+    except TypeError:
+        return None
+
+
+def _is_static(source: FrameSource, size: int, atype: AttributeTypes) -> bool:
+    "Whether the source is an array holding a single frame without a frame axis."
+    if not isinstance(source, np.ndarray) or source.ndim == 0:
+        return False
+    n_values = size * int(np.prod(atype.value.dimensions))
+    return len(source) == size and source.size == n_values
+
+
+def _read_source(source: FrameSource, index: int) -> np.ndarray:
+    if callable(source):
+        return np.asarray(source(index))
+    return source[index]
+
+
+class FramePrefetcher:
+    """
+    Load upcoming frames of a frame source in background threads.
+
+    The prefetcher is itself a frame source that can be given to a
+    `TrajectoryPlayer`. Whenever a frame is requested the next `n_ahead` frames in the
+    direction of playback are loaded by a thread pool, so reading from disk,
+    decompressing and converting the data happens off the main thread and only the
+    attribute writes remain in the frame change handler. Scrubbing backwards reverses
+    the direction of the prefetched frames.
+
+    Frames are loaded into a ring of buffers allocated once, with as many slots as fit
+    into `max_bytes`. The array returned for a frame is one of these slots and is
+    reused for later frames. It stays valid for one further request, so that two
+    consecutive frames can be interpolated, and must be consumed (or copied) after.
+
+    Parameters
+    ----------
+    source : FrameSource
+        An array whose first axis is the frame, or a callable returning a frame.
+    n_ahead : int, optional
+        Number of frames to load ahead of the requested frame. Default is 4.
+    max_bytes : int, optional
+        Memory budget for the ring of frame buffers, which limits `n_ahead` for large
+        frames. At least three frames are always buffered. Default is 512 MiB.
+    max_workers : int, optional
+        Number of threads loading frames. Default is 2.
+    n_frames : int | None, optional
+        Number of frames of a callable source, frames outside of the range aren't
+        prefetched. Defaults to the length of an array source.
+    dtype : npt.DTypeLike | None, optional
+        Type to convert the frames to while loading them, such as the dtype of the
+        attribute they are written to. Defaults to the dtype of the first frame.
+
+    Attributes
+    ----------
+    n_hits : int
+        Number of requested frames that were already prefetched.
+    n_misses : int
+        Number of requested frames that had to be loaded on request.
+
+    Examples
+    --------
+    ```python
+    import numpy as np
+    import databpy as db
+
+    frames = np.load("trajectory.npy", mmap_mode="r")
+    bob = db.create_bob(frames[0])
+    with db.FramePrefetcher(frames, n_ahead=8, dtype=np.float32) as prefetcher:
+        player = db.TrajectoryPlayer(bob, prefetcher)
+        player.register()
+        # ... play the animation ...
+        player.unregister()
+    ```
+    """
+
+    def __init__(
+        self,
+        source: FrameSource,
+        n_ahead: int = 4,
+        max_bytes: int = PREFETCH_BYTES,
+        max_workers: int = 2,
+        n_frames: int | None = None,
+        dtype: npt.DTypeLike | None = None,
+    ):
+        self.source = source
+        self.n_frames = _source_length(source) if n_frames is None else n_frames
+
+        first = _read_source(source, 0)
+        self.shape = first.shape
+        self.dtype = np.dtype(first.dtype if dtype is None else dtype)
+        frame_bytes = max(first.size * self.dtype.itemsize, 1)
+        # slots for the previous and the current frame plus those loaded ahead
+        n_slots = max(3, min(n_ahead + 2, max_bytes // frame_bytes))
+        self.n_ahead = n_slots - 2
+
+        self._slots = np.empty((n_slots, *self.shape), dtype=self.dtype)
+        self._free = list(range(n_slots))
+        # frame index -> slot and the future that fills it
+        self._frames: dict[int, tuple[int, Future]] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="databpy-prefetch"
+        )
+        self._previous: int | None = None
+        self.direction = 1
+        self.n_hits = 0
+        self.n_misses = 0
+
+    def __len__(self) -> int:
+        if self.n_frames is None:
+            raise TypeError("The number of frames of the source is unknown")
+        return self.n_frames
+
+    @property
+    def nbytes(self) -> int:
+        "Bytes allocated for the ring of frame buffers."
+        return self._slots.nbytes
+
+    def _fill(self, slot: int, index: int) -> None:
+        data = _read_source(self.source, index)
+        np.copyto(self._slots[slot], data.reshape(self.shape), casting="same_kind")
+
+    def _schedule(self, index: int) -> None:
+        slot = self._free.pop()
+        self._frames[index] = (slot, self._executor.submit(self._fill, slot, index))
+
+    def _release(self, index: int) -> None:
+        slot, future = self._frames.pop(index)
+        # a slot can only be reused once no thread is writing to it anymore
+        if not future.cancel():
+            try:
+                future.result()
+            except Exception:
+                pass
+        self._free.append(slot)
+
+    def _upcoming(self, index: int) -> list[int]:
+        "The frames to prefetch after the requested frame, in order of priority."
+        upcoming = []
+        for step in range(1, self.n_ahead + 1):
+            i = index + step * self.direction
+            if i < 0 or (self.n_frames is not None and i >= self.n_frames):
+                break
+            upcoming.append(i)
+        return upcoming
+
+    def __call__(self, index: int) -> np.ndarray:
+        return self.get(index)
+
+    def get(self, index: int, direction: int | None = None) -> np.ndarray:
+        """
+        Get a frame, waiting for it to be loaded if it wasn't prefetched.
+
+        Parameters
+        ----------
+        index : int
+            The index of the frame.
+        direction : int | None, optional
+            1 to prefetch the frames after the requested one and -1 for those before.
+            By default the direction is taken from the previously requested frame,
+            which can't tell the direction when alternating between two frames.
+
+        Returns
+        -------
+        np.ndarray
+            The frame, in one of the prefetcher's buffers.
+        """
+        previous = self._previous
+        if direction is not None:
+            self.direction = direction
+        elif previous is not None and index != previous:
+            self.direction = 1 if index > previous else -1
+        self._previous = index
+
+        wanted = [index, *self._upcoming(index)]
+        for i in [i for i in self._frames if i not in wanted and i != previous]:
+            self._release(i)
+
+        if index in self._frames:
+            self.n_hits += 1
+        else:
+            self.n_misses += 1
+        for i in wanted:
+            if i not in self._frames:
+                self._schedule(i)
+
+        slot, future = self._frames[index]
+        try:
+            future.result()
+        except Exception:
+            self._frames.pop(index)
+            self._free.append(slot)
+            raise
+        return self._slots[slot]
+
+    def close(self) -> None:
+        "Stop loading frames and shut down the threads."
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._frames.clear()
+        self._free = list(range(len(self._slots)))
+
+    def __enter__(self) -> "FramePrefetcher":
+        return self
+
+    def __exit__(self, type, value, traceback) -> None:
+        self.close()
+
+
+class _Track:
+    "The frame source of a single attribute and the buffer it is written through."
+
+    def __init__(
+        self,
+        name: str,
+        source: FrameSource,
+        atype: AttributeTypes,
+        size: int,
+        interpolate: bool = False,
+        box: np.ndarray | None = None,
+    ):
+        self.name = name
+        self.source = source
+        self.atype = atype
+        self.shape = (size, *atype.value.dimensions)
+        self.buffer = np.empty(self.shape, dtype=atype.value.dtype)
+        self.n_frames = _source_length(source)
+        self.interpolate = interpolate and atype in INTERPOLATED_TYPES
+        self.box = box
+        # direction of playback, passed on to prefetched sources
+        self.direction = 1
+        # hash of the data the attribute holds, when detecting changes by hash
+        self.hash: bytes | None = None
+        self.n_bytes = 0
+        # frame position the attribute currently holds, None if not yet written
+        self.index: float | None = None
+
+    def source_index(self, index: int) -> int:
+        "Index into this source, which holds its last frame if it is shorter."
+        if self.n_frames is None:
+            return index
+        return min(index, self.n_frames - 1)
+
+    def _frame(self, index: int) -> np.ndarray:
+        if isinstance(self.source, FramePrefetcher):
+            data = self.source.get(index, direction=self.direction)
+        else:
+            data = _read_source(self.source, index)
+        if data.size != self.buffer.size:
+            raise AttributeMismatchError(
+                f"Frame {index} of '{self.name}' has shape {data.shape} which doesn't "
+                f"match the attribute shape {self.shape}"
+            )
+        return data
+
+    def read(self, index: int) -> np.ndarray:
+        "Frame data in the buffer, or the source's own array if it can be used as is."
+        data = self._frame(index)
+
+        # data that is already in the right layout is written without a copy, anything
+        # else is converted into the preallocated buffer rather than a new array
+        if data.dtype == self.buffer.dtype and data.flags.c_contiguous:
+            return data
+        np.copyto(self.buffer, data.reshape(self.shape), casting="same_kind")
+        return self.buffer
+
+    def read_between(self, index: int, t: float) -> np.ndarray:
+        "Interpolate between a frame and the next one into the buffer."
+        a = self._frame(index).reshape(self.shape)
+        b = self._frame(index + 1).reshape(self.shape)
+        return lerp(a, b, t, out=self.buffer, box=self.box)
+
+
+class TrajectoryPlayer:
+    """
+    Write frames of a trajectory to the attributes of an object as the scene frame
+    changes.
+
+    Each attribute is bound to a frame source: an array whose first axis is the frame,
+    such as a `np.memmap` of a file on disk, or a callable that returns the data for a
+    given frame index. An array without a frame axis is static and only written once.
+    On every frame change the data of each source is copied into a buffer that is
+    allocated once, written with a single `foreach_set()` and the object is refreshed
+    once for all attributes. Attributes which already hold the data for the frame
+    aren't written again.
+
+    Parameters
+    ----------
+    bob : BlenderObject | bpy.types.Object
+        The object to write the frames to.
+    sources : FrameSource | Mapping[str, FrameSource]
+        The frame source for each attribute name. A single source is used for the
+        "position" attribute.
+    domain : str or AttributeDomains, optional
+        The domain of the attributes. Default is "POINT".
+    frame_start : int, optional
+        The scene frame that shows the first frame of the sources. Default is 1.
+    n_frames : int | None, optional
+        Number of frames in the trajectory, frames outside of the range are clamped to
+        the first and last frame. Defaults to the length of the longest source, or
+        no clamping if none of the sources have a length. Shorter sources hold their
+        last frame, so a source with a single frame is only written once.
+    max_timings : int, optional
+        Number of frame timings to keep in `timings`. Default is 1000.
+    prefetch : int, optional
+        Number of frames to load ahead in background threads for each source, by
+        wrapping it in a `FramePrefetcher`. Default is 0, which reads frames on the
+        main thread when they are needed.
+    max_prefetch_bytes : int, optional
+        Memory budget of the prefetched frames for each source. Default is 512 MiB.
+    interpolate : bool, optional
+        Whether to interpolate float, vector and color attributes between frames for
+        fractional scene frames, such as the subframes rendered for motion blur.
+        Other attribute types show the earlier frame. Default is False.
+    box : np.ndarray | None, optional
+        Dimensions of the periodic box of the simulation. If given, "position" is
+        interpolated towards the nearest periodic image, so that particles wrapping
+        around the box don't travel across it between frames.
+    detect_changes : {"index", "hash"}, optional
+        How to tell whether an attribute needs writing. With "index" it is written
+        whenever the frame index of its source changes. With "hash" the frame data is
+        also hashed with `utils.content_hash()` and only written if it differs from the
+        data the attribute holds, for sources that repeat data across frames. Default
+        is "index".
+
+    Attributes
+    ----------
+    timings : collections.deque[FrameTiming]
+        The timings of the most recent frame updates.
+
+    Examples
+    --------
+    ```python
+    import numpy as np
+    import databpy as db
+
+    frames = np.load("trajectory.npy", mmap_mode="r")  # (n_frames, n_atoms, 3)
+    bob = db.create_bob(frames[0])
+    player = db.TrajectoryPlayer(bob, frames)
+    player.register()
+    # ... play the animation ...
+    player.unregister()
+    print(np.mean([t.total for t in player.timings]))
+    ```
+    """
+
+    def __init__(
+        self,
+        bob: BlenderObject | bpy.types.Object,
+        sources: FrameSource | Mapping[str, FrameSource],
+        domain: DomainNames | AttributeDomains = AttributeDomains.POINT,
+        frame_start: int = 1,
+        n_frames: int | None = None,
+        max_timings: int = MAX_TIMINGS,
+        prefetch: int = 0,
+        max_prefetch_bytes: int = PREFETCH_BYTES,
+        interpolate: bool = False,
+        box: np.ndarray | None = None,
+        detect_changes: ChangeDetection = "index",
+    ):
+        if not isinstance(bob, BlenderObject):
+            bob = BlenderObject(bob)
+        if not isinstance(sources, Mapping):
+            sources = {"position": sources}
+        if detect_changes not in ("index", "hash"):
+            raise ValueError(
+                f"detect_changes must be 'index' or 'hash', not {detect_changes!r}"
+            )
+
+        self.bob = bob
+        self.detect_changes = detect_changes
+        self.domain = _match_domain(domain)
+        self.frame_start = frame_start
+        self.n_frames = n_frames
+        self.timings: deque[FrameTiming] = deque(maxlen=max_timings)
+        self.prefetch = prefetch
+        self.max_prefetch_bytes = max_prefetch_bytes
+        self._prefetchers: list[FramePrefetcher] = []
+        self.interpolate = interpolate
+        self.box = None if box is None else np.asarray(box, dtype=np.float32)
+        self._position: float | None = None
+        self.tracks = [self._new_track(name, s) for name, s in sources.items()]
+        if self.n_frames is None:
+            lengths = [t.n_frames for t in self.tracks if t.n_frames is not None]
+            self.n_frames = max(lengths) if lengths else None
+
+    def _new_track(self, name: str, source: FrameSource) -> _Track:
+        obj = self.bob.object
+        attribute = obj.data.attributes.get(name)  # type: ignore
+        if attribute is None:
+            # create the attribute from the first frame, which determines its type
+            first = _read_source(source, 0)
+            size = _domain_size(obj, self.domain)
+            if isinstance(source, np.ndarray) and len(source) == size:
+                # unless the second axis is the elements too, the array is static
+                if source.ndim < 2 or source.shape[1] != size:
+                    first = source
+            attribute = store_named_attribute(obj, first, name, domain=self.domain)
+        atype = AttributeTypes[attribute.data_type]
+        size = len(attribute.data)
+        if _is_static(source, size, atype):
+            # a single frame of data, which is held for every frame
+            return _Track(name, source[np.newaxis], atype, size)
+        if self.prefetch:
+            source = FramePrefetcher(
+                source,
+                n_ahead=self.prefetch,
+                max_bytes=self.max_prefetch_bytes,
+                n_frames=self.n_frames,
+                dtype=atype.value.dtype,
+            )
+            self._prefetchers.append(source)
+        return _Track(
+            name,
+            source,
+            atype,
+            size,
+            interpolate=self.interpolate,
+            box=self.box if name == "position" else None,
+        )
+
+    def frame_index(self, frame: float) -> int:
+        "The index into the frame sources for a scene frame."
+        index = math.floor(frame - self.frame_start)
+        if self.n_frames is not None:
+            index = min(max(index, 0), self.n_frames - 1)
+        return index
+
+    def update(self, frame: float | None = None) -> FrameTiming:
+        """
+        Write the data for a frame to the attributes.
+
+        Parameters
+        ----------
+        frame : float | None, optional
+            The scene frame to show, which can be fractional when interpolating.
+            Defaults to the current frame and subframe of the scene.
+
+        Returns
+        -------
+        FrameTiming
+            How long reading and writing the frame took.
+        """
+        if frame is None:
+            scene = bpy.context.scene
+            frame = scene.frame_current + scene.frame_subframe  # type: ignore
+        index = self.frame_index(frame)
+        timing = FrameTiming(frame=frame, index=index)
+
+        # fraction of the way to the next frame, zero outside of the trajectory
+        t = frame - self.frame_start - index
+        if not 0 < t < 1:
+            t = 0.0
+
+        direction = 0
+        if self._position is not None and frame != self._position:
+            direction = 1 if frame > self._position else -1
+        self._position = frame
+
+        obj = self.bob.object
+        attributes = obj.data.attributes  # type: ignore
+        for track in self.tracks:
+            if direction:
+                track.direction = direction
+            source_index = track.source_index(index)
+            between = bool(t) and track.interpolate and source_index == index
+            if between and track.n_frames is not None:
+                between = index + 1 < track.n_frames
+            position = source_index + t if between else source_index
+            if track.index == position:
+                continue
+            start = time.perf_counter()
+            if between:
+                data = track.read_between(source_index, t)
+            else:
+                data = track.read(source_index)
+            track.index = position
+            if self.detect_changes == "hash":
+                digest = content_hash(data)
+                if digest == track.hash:
+                    timing.n_skipped += 1
+                    timing.read += time.perf_counter() - start
+                    continue
+                track.hash = digest
+            written = time.perf_counter()
+            attribute = attributes[track.name]
+            _forget_written(obj.data, track.name)
+            with stats.measure("foreach_set", obj, attribute, n_bytes=data.nbytes):
+                attribute.data.foreach_set(
+                    track.atype.value.value_name, data.reshape(-1)
+                )
+            track.n_bytes += data.nbytes
+            timing.n_bytes += data.nbytes
+            timing.n_written += 1
+            timing.read += written - start
+            timing.write += time.perf_counter() - written
+
+        if timing.n_written:
+            start = time.perf_counter()
+            _refresh_object_data(obj)
+            timing.write += time.perf_counter() - start
+
+        self.timings.append(timing)
+        return timing
+
+    def invalidate(self) -> None:
+        "Write every attribute on the next update, such as after editing them directly."
+        for track in self.tracks:
+            track.index = None
+            track.hash = None
+
+    @property
+    def bytes_written(self) -> dict[str, int]:
+        "Total bytes written to each attribute since the player was created."
+        return {track.name: track.n_bytes for track in self.tracks}
+
+    def _on_frame_change(self, scene: bpy.types.Scene, depsgraph=None) -> None:
+        try:
+            frame = scene.frame_current
+            if self.interpolate:
+                frame += scene.frame_subframe
+            self.update(frame)
+        except LinkedObjectError:
+            # the object was removed, so there is nothing left to play back
+            self.close()
+
+    @property
+    def registered(self) -> bool:
+        "Whether the player is updating the object on frame changes."
+        return self._on_frame_change in bpy.app.handlers.frame_change_pre
+
+    def register(self) -> None:
+        "Start updating the object whenever the scene frame changes."
+        if not self.registered:
+            bpy.app.handlers.frame_change_pre.append(self._on_frame_change)
+
+    def unregister(self) -> None:
+        "Stop updating the object on frame changes."
+        while self.registered:
+            bpy.app.handlers.frame_change_pre.remove(self._on_frame_change)
+
+    def close(self) -> None:
+        "Unregister the player and shut down the threads of prefetched sources."
+        self.unregister()
+        for prefetcher in self._prefetchers:
+            prefetcher.close()
@@ -1,5 +1,8 @@
-import numpy as np
+import hashlib
+from functools import cache
 from pathlib import Path
+
+import numpy as np
 import bpy
 
 
@@ -23,7 +26,13 @@ def centre(position: np.ndarray, weight: np.ndarray | None = None) -> np.ndarray
     return np.average(position, weights=weight, axis=0)
 
 
-def lerp(a: np.ndarray, b: np.ndarray, t: float = 0.5) -> np.ndarray:
+def lerp(
+    a: np.ndarray,
+    b: np.ndarray,
+    t: float = 0.5,
+    out: np.ndarray | None = None,
+    box: np.ndarray | None = None,
+) -> np.ndarray:
     """Linearly interpolate between two values.
 
     Parameters
@@ -34,11 +43,19 @@ def lerp(a: np.ndarray, b: np.ndarray, t: float = 0.5) -> np.ndarray:
         The ending value.
     t : float, optional
         The interpolation parameter. Default is 0.5.
+    out : np.ndarray | None, optional
+        Array to write the result into instead of allocating a new one. It may be the
+        same array as `a` or `b`. No temporary arrays are created when it is given.
+    box : np.ndarray | None, optional
+        Dimensions of a periodic box. If given, each value moves towards the nearest
+        periodic image of `b` (the minimum image convention), so positions that wrapped
+        around the box between `a` and `b` don't travel across the whole box. The
+        result isn't wrapped back into the box.
 
     Returns
     -------
     np.ndarray
-        The interpolated value(s).
+        The interpolated value(s), which is `out` if it was given.
 
     Notes
     -----
@@ -54,7 +71,68 @@ def lerp(a: np.ndarray, b: np.ndarray, t: float = 0.5) -> np.ndarray:
     lerp([1, 2, 3], [4, 5, 6], 0.5)
     ```
     """
-    return a + (b - a) * t
+    if out is None and box is None:
+        return a + (b - a) * t
+
+    if out is None:
+        out = np.subtract(b, a)
+    elif np.may_share_memory(out, a):
+        if box is not None:
+            raise ValueError("`out` can't share memory with `a` when using a `box`")
+        # a + (b - a) * t == b + (a - b) * (1 - t), which only needs `a` once
+        np.subtract(out, b, out=out)
+        np.multiply(out, 1 - t, out=out)
+        return np.add(out, b, out=out)
+    else:
+        np.subtract(b, a, out=out)
+
+    if box is not None:
+        # wrap the displacement into [-box / 2, box / 2)
+        half = np.asarray(box, dtype=out.dtype) / 2
+        np.add(out, half, out=out)
+        np.remainder(out, np.asarray(box, dtype=out.dtype), out=out)
+        np.subtract(out, half, out=out)
+
+    np.multiply(out, t, out=out)
+    return np.add(out, a, out=out)
+
+
+@cache
+def _hash_factory():
+    "The fastest available hash, xxhash if it is installed and sha1 otherwise."
+    try:
+        import xxhash
+
+        return xxhash.xxh3_128
+    except ImportError:
+        # hardware accelerated on most CPUs, which makes it faster than blake2b
+        return hashlib.sha1
+
+
+def content_hash(array: np.ndarray) -> bytes:
+    """Hash the contents of an array, for cheaply detecting whether data changed.
+
+    Uses xxhash if it is installed, which hashes at close to memory bandwidth, and
+    otherwise falls back to sha1 from the standard library which is several times
+    slower. The dtype and shape are part of the hash, so arrays with the same bytes but
+    a different layout don't collide. The digest is only meant to be compared within a
+    session as it differs between the two hash functions.
+
+    Parameters
+    ----------
+    array : np.ndarray
+        The array to hash. Non-contiguous arrays are copied before hashing.
+
+    Returns
+    -------
+    bytes
+        The digest of the array.
+    """
+    array = np.ascontiguousarray(array)
+    hasher = _hash_factory()()
+    hasher.update(f"{array.dtype.str}{array.shape}".encode())
+    hasher.update(memoryview(array).cast("B"))
+    return hasher.digest()
 
 
 def path_resolve(path: str | Path) -> Path:
@@ -1,9 +1,58 @@
+import mmap
+import os
+import re
+import struct
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 import bpy
+import numpy as np
 
 from .collection import create_collection
-from .object import ObjectTracker
+
+
+def _target_collection(
+    collection: str | bpy.types.Collection | None,
+) -> bpy.types.Collection:
+    if isinstance(collection, str):
+        return create_collection(collection)
+    if collection is not None:
+        return collection
+    # match the volume import operator, which adds to the active collection
+    return bpy.context.collection or bpy.context.scene.collection  # type: ignore
+
+
+def _new_volume_object(
+    name: str, file: str | Path, collection: str | bpy.types.Collection | None
+) -> bpy.types.Object:
+    volume = bpy.data.volumes.new(name)
+    volume.filepath = str(file)
+    volume_obj = bpy.data.objects.new(name, volume)
+    _target_collection(collection).objects.link(volume_obj)
+
+    # match the volume import operator, which adds the object at the 3D cursor and
+    # makes it the only selected and the active object
+    volume_obj.location = bpy.context.scene.cursor.location
+    view_layer = bpy.context.view_layer
+    try:
+        volume_obj.select_set(True)
+    except RuntimeError:
+        # the target collection isn't part of the view layer
+        return volume_obj
+    for obj in view_layer.objects.selected:
+        if obj != volume_obj:
+            obj.select_set(False)
+    view_layer.objects.active = volume_obj
+    return volume_obj
+
+
+def _remove_volume_object(volume_obj: bpy.types.Object) -> None:
+    volume = volume_obj.data
+    bpy.data.objects.remove(volume_obj)
+    bpy.data.volumes.remove(volume)  # type: ignore
 
 
 def import_vdb(
@@ -28,31 +77,664 @@ def import_vdb(
     Raises
     ------
     RuntimeError
-        If the VDB file could not be imported (e.g., file not found).
+        If the VDB file could not be imported (e.g., file not found or not a VDB
+        file).
+
+    Notes
+    -----
+    The volume data-block is created directly with its `filepath` set rather than
+    through `bpy.ops.object.volume_import`, so no operator context is needed and the
+    object is linked straight into the target collection. As with the operator, the
+    object is placed at the 3D cursor and made the active and only selected object
+    when it is in the current view layer. The file is validated by reading its header
+    and list of grids, the voxel data is only read once Blender needs it.
     """
     # Check if file exists
     file_path = Path(file)
     if not file_path.exists():
         raise RuntimeError(f"VDB file not found: {file_path}")
+    # OpenVDB trusts the sizes in a file's header, so a corrupt header is rejected
+    # here before Blender reads it
+    try:
+        read_vdb_header(file_path)
+    except (OSError, VDBHeaderError) as e:
+        raise RuntimeError(f"Failed to import VDB file: {e}") from e
 
-    with ObjectTracker() as tracker:
-        bpy.ops.object.volume_import(filepath=str(file))
-        new_objects = tracker.new_objects()
+    volume_obj = _new_volume_object(file_path.stem, file, collection)
+    grids = volume_obj.data.grids  # type: ignore
+    if not grids.load():
+        message = grids.error_message
+        _remove_volume_object(volume_obj)
+        raise RuntimeError(f"Failed to import VDB file: {file_path}: {message}")
 
-        # Check if any objects were created
-        if not new_objects:
-            raise RuntimeError(f"Failed to import VDB file: {file_path}")
+    return volume_obj
 
-        volume_obj = new_objects[-1]
 
-    if collection is not None:
-        initial_collection = volume_obj.users_collection[0]
-        initial_collection.objects.unlink(volume_obj)
+# Blender finds the frame number of a sequence from the last run of digits in the name
+_SEQUENCE_PATTERN = re.compile(r"^(.*?)(\d+)(\D*)$")
+
+
+def _sequence_files(files: str | Path | list[str | Path]) -> list[Path]:
+    if isinstance(files, (list, tuple)):
+        return [Path(file) for file in files]
+
+    path = Path(files)
+    if path.is_dir():
+        return list(path.glob("*.vdb"))
+    # treat anything else as a glob pattern relative to its parent directory
+    return list(path.parent.glob(path.name))
+
+
+def _sequence_numbers(
+    paths: list[Path],
+) -> tuple[dict[int, Path], tuple[Path, str, int, str]]:
+    "Frame number of each path, along with the naming layout that all paths share."
+    if not paths:
+        raise RuntimeError("No VDB files found for the sequence")
+
+    numbered: dict[int, Path] = {}
+    layouts = set()
+    for path in paths:
+        match = _SEQUENCE_PATTERN.match(path.name)
+        if match is None:
+            raise ValueError(f"VDB file has no frame number in its name: {path}")
+        prefix, digits, suffix = match.groups()
+        # Blender writes the frame number with the padding of the first file, so all
+        # files need to have the same directory, prefix, suffix and padding
+        layouts.add((path.parent, prefix, len(digits), suffix))
+        if int(digits) in numbered:
+            raise ValueError("VDB sequence contains duplicated frame numbers")
+        numbered[int(digits)] = path
 
-        target_collection = collection
-        if isinstance(collection, str):
-            target_collection = create_collection(collection)
+    if len(layouts) > 1:
+        layouts = sorted(map(str, layouts))
+        raise ValueError(f"VDB files don't share a single naming pattern: {layouts}")
 
-        target_collection.objects.link(volume_obj)
+    return numbered, layouts.pop()
+
+
+def _parse_sequence(paths: list[Path]) -> list[tuple[int, Path]]:
+    "Validate that paths form a contiguous numbered sequence, sorted by frame number."
+    numbered, _ = _sequence_numbers(paths)
+    numbers = sorted(numbered)
+    missing = sorted(set(range(numbers[0], numbers[-1] + 1)) - set(numbers))
+    if missing:
+        raise ValueError(f"VDB sequence is missing frames: {missing}")
+
+    return [(number, numbered[number]) for number in numbers]
+
+
+def import_vdb_sequence(
+    files: str | Path | list[str | Path],
+    frame_start: int = 1,
+    frame_offset: int = 0,
+    collection: str | bpy.types.Collection | None = None,
+) -> bpy.types.Object:
+    """
+    Imports a sequence of numbered VDB files as a single Blender volume object.
+
+    A single volume data-block is created with `is_sequence` enabled, which Blender
+    steps through during playback. The sequence is validated from the file names only
+    and no grid data is read, so the cost and scene size don't grow with the number of
+    frames.
+
+    Parameters
+    ----------
+    files : str | Path | list[str | Path]
+        A directory containing the .vdb files, a glob pattern such as
+        "cache/smoke_*.vdb", or a list of the files in the sequence.
+    frame_start : int, optional
+        The scene frame on which the first file of the sequence is shown. Default is 1.
+    frame_offset : int, optional
+        Number of files to skip into the sequence, which shortens the sequence by as
+        many frames. Default is 0.
+    collection : str | bpy.types.Collection | None, optional
+        Collection to place the imported volume in. Can be either a collection name,
+        an existing collection, or None to use the active collection.
+
+    Returns
+    -------
+    bpy.types.Object
+        A Blender object containing the volume sequence.
+
+    Raises
+    ------
+    RuntimeError
+        If no files were found for the sequence, or listed files don't exist.
+    ValueError
+        If the files don't form a single contiguous numbered sequence, or
+        `frame_offset` skips every file.
+
+    Examples
+    --------
+    ```python
+    import databpy as db
+
+    obj = db.import_vdb_sequence("cache/smoke_*.vdb", frame_start=10)
+    obj.data.frame_duration  # number of files in the sequence
+    ```
+    """
+    paths = _sequence_files(files)
+    missing = [str(path) for path in paths if not path.is_file()]
+    if missing:
+        raise RuntimeError(f"VDB files not found: {missing}")
+    frames = _parse_sequence(paths)
+    if not 0 <= frame_offset < len(frames):
+        raise ValueError(
+            f"frame_offset {frame_offset} must be at least 0 and less than the "
+            f"{len(frames)} files of the sequence"
+        )
+    first_number, first_path = frames[0]
+
+    name = _SEQUENCE_PATTERN.match(first_path.stem)
+    name = name.group(1).rstrip("_.- ") if name else ""
+    volume_obj = _new_volume_object(name or first_path.stem, first_path, collection)
+
+    volume: bpy.types.Volume = volume_obj.data  # type: ignore
+    volume.is_sequence = True
+    # Blender clips the frame to the duration before adding the offset, so skipped
+    # files shorten the sequence rather than running past its last file
+    volume.frame_duration = len(frames) - frame_offset
+    volume.frame_start = frame_start
+    # Blender shows file number 1 on the first frame, so offset to the first number
+    volume.frame_offset = first_number - 1 + frame_offset
 
     return volume_obj
+
+
+class VDBHeaderError(Exception):
+    """
+    Error raised when the header of a file can't be read as an OpenVDB file.
+
+    Parameters
+    ----------
+    message : str
+        The error message describing why the header couldn't be read.
+    """
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+
+@dataclass
+class VDBGridInfo:
+    """
+    Description of a single grid inside of a .vdb file, read from the file header.
+
+    Attributes
+    ----------
+    name : str
+        Name of the grid, such as "density".
+    grid_type : str
+        OpenVDB tree type, such as "Tree_float_5_4_3".
+    value_type : str
+        Type of the voxel values, such as "float", "vec3s" or "int32".
+    half_float : bool
+        Whether float values are stored on disk at half precision.
+    map_type : str
+        Name of the OpenVDB map of the grid's transform, such as "UniformScaleMap".
+    voxel_size : tuple[float, float, float] | None
+        World space size of a voxel, or None for maps without a fixed voxel size.
+    bbox_min : tuple[int, int, int] | None
+        Minimum index space coordinate of the active voxels, if stored in the file.
+    bbox_max : tuple[int, int, int] | None
+        Maximum index space coordinate of the active voxels, if stored in the file.
+    voxel_count : int | None
+        Number of active voxels, if stored in the file.
+    metadata : dict[str, Any]
+        All of the metadata stored for the grid.
+    """
+
+    name: str
+    grid_type: str
+    value_type: str
+    half_float: bool
+    map_type: str
+    voxel_size: tuple[float, float, float] | None
+    bbox_min: tuple[int, int, int] | None
+    bbox_max: tuple[int, int, int] | None
+    voxel_count: int | None
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class VDBFileInfo:
+    """
+    Header information of a .vdb file.
+
+    Attributes
+    ----------
+    path : Path
+        Path to the file.
+    file_version : int
+        Version of the OpenVDB file format.
+    library_version : tuple[int, int]
+        Major and minor version of the OpenVDB library that wrote the file.
+    uuid : str
+        Unique identifier written into the file.
+    metadata : dict[str, Any]
+        File level metadata.
+    grids : list[VDBGridInfo]
+        The grids stored in the file.
+    """
+
+    path: Path
+    file_version: int
+    library_version: tuple[int, int]
+    uuid: str
+    metadata: dict[str, Any]
+    grids: list[VDBGridInfo]
+
+    @property
+    def grid_names(self) -> list[str]:
+        "Names of the grids stored in the file."
+        return [grid.name for grid in self.grids]
+
+
+# `int64` magic number at the start of every .vdb file
+_VDB_MAGIC = 0x56444220
+
+# file format versions that changed the layout of the header, from openvdb/version.h
+_FILE_VERSION_ROOTNODE_MAP = 213
+_FILE_VERSION_GRID_INSTANCING = 216
+_FILE_VERSION_BOOST_UUID = 218
+_FILE_VERSION_NEW_TRANSFORM = 219
+_FILE_VERSION_SELECTIVE_COMPRESSION = 220
+_FILE_VERSION_NODE_MASK_COMPRESSION = 222
+
+_HALF_FLOAT_SUFFIX = "_HalfFloat"
+# duplicated grid names are made unique with this separator and an index
+_UNIQUE_NAME_SEPARATOR = "\x1e"
+
+_METADATA_FORMATS = {
+    "bool": "<?",
+    "int32": "<i",
+    "int64": "<q",
+    "float": "<f",
+    "double": "<d",
+    "vec2i": "<2i",
+    "vec2s": "<2f",
+    "vec2d": "<2d",
+    "vec3i": "<3i",
+    "vec3s": "<3f",
+    "vec3d": "<3d",
+    "vec4i": "<4i",
+    "vec4s": "<4f",
+    "vec4d": "<4d",
+    "mat4s": "<16f",
+    "mat4d": "<16d",
+}
+
+
+_UINT32 = struct.Struct("<I")
+
+
+class _HeaderReader:
+    "Sequential little-endian reads from a buffer, used for parsing .vdb headers."
+
+    def __init__(self, buffer: mmap.mmap | bytes, offset: int = 0) -> None:
+        self.buffer = buffer
+        self.offset = offset
+
+    def read(self, fmt: str) -> tuple:
+        values = struct.unpack_from(fmt, self.buffer, self.offset)
+        self.offset += struct.calcsize(fmt)
+        return values
+
+    def skip(self, size: int) -> None:
+        self.offset += size
+
+    def bytes(self, size: int) -> bytes:
+        start = self.offset
+        self.offset += size
+        if self.offset > len(self.buffer):
+            raise struct.error("read beyond the end of the file")
+        return self.buffer[start : self.offset]
+
+    def sized_bytes(self) -> bytes:
+        "Read bytes that are prefixed by their `uint32` length."
+        (size,) = _UINT32.unpack_from(self.buffer, self.offset)
+        self.offset += 4
+        return self.bytes(size)
+
+    def string(self) -> str:
+        return str(self.sized_bytes(), "utf-8", "replace")
+
+    def metadata(self) -> dict[str, Any]:
+        (count,) = self.read("<i")
+        metadata = {}
+        for _ in range(count):
+            name = self.string()
+            type_name = self.string()
+            data = self.sized_bytes()
+            if type_name.startswith("__"):
+                # internal metadata such as delayed loading masks
+                continue
+            if type_name == "string":
+                metadata[name] = str(data, "utf-8", "replace")
+            elif type_name in _METADATA_FORMATS:
+                value = struct.unpack(_METADATA_FORMATS[type_name], data)
+                metadata[name] = value[0] if len(value) == 1 else value
+            else:
+                metadata[name] = data
+        return metadata
+
+    def transform(self) -> tuple[str, tuple[float, float, float] | None]:
+        "Read a transform, returning the map type and the voxel size."
+        map_type = self.string()
+        if map_type in ("ScaleMap", "UniformScaleMap"):
+            # scale values, followed by the voxel size
+            self.skip(24)
+            return map_type, self.read("<3d")
+        if map_type in ("ScaleTranslateMap", "UniformScaleTranslateMap"):
+            # translation and scale values, followed by the voxel size
+            self.skip(48)
+            return map_type, self.read("<3d")
+        if map_type == "TranslationMap":
+            return map_type, (1.0, 1.0, 1.0)
+        if map_type in ("AffineMap", "UnitaryMap"):
+            # row-major 4x4 matrix applied to row vectors, so the voxel size is the
+            # length of each of the first three rows
+            matrix = self.read("<16d")
+            rows = [matrix[i * 4 : i * 4 + 3] for i in range(3)]
+            voxel_size = tuple(sum(x * x for x in row) ** 0.5 for row in rows)
+            return map_type, voxel_size  # type: ignore
+        return map_type, None
+
+
+def _read_grid(
+    reader: _HeaderReader, buffer: mmap.mmap | bytes, file_version: int
+) -> VDBGridInfo:
+    unique_name = reader.string()
+    grid_type = reader.string()
+    if file_version >= _FILE_VERSION_GRID_INSTANCING:
+        reader.string()  # name of the grid this one is an instance of
+    grid_pos, _block_pos, end_pos = reader.read("<3q")
+
+    half_float = grid_type.endswith(_HALF_FLOAT_SUFFIX)
+    grid_type = grid_type.removesuffix(_HALF_FLOAT_SUFFIX)
+    # tree types are named such as "Tree_float_5_4_3"
+    parts = grid_type.split("_")
+    value_type = parts[1] if len(parts) > 1 else grid_type
+
+    # the grid's metadata and transform are stored at the start of the grid's data
+    grid_reader = _HeaderReader(buffer, grid_pos)
+    if file_version >= _FILE_VERSION_NODE_MASK_COMPRESSION:
+        grid_reader.skip(4)  # per grid compression flags
+    metadata = grid_reader.metadata()
+    map_type, voxel_size = grid_reader.transform()
+
+    # descriptors are stored in front of each grid's data, so the next one starts
+    # where this grid ends
+    reader.offset = end_pos
+
+    return VDBGridInfo(
+        name=unique_name.split(_UNIQUE_NAME_SEPARATOR)[0],
+        grid_type=grid_type,
+        value_type=value_type,
+        half_float=half_float,
+        map_type=map_type,
+        voxel_size=voxel_size,
+        bbox_min=metadata.get("file_bbox_min"),
+        bbox_max=metadata.get("file_bbox_max"),
+        voxel_count=metadata.get("file_voxel_count"),
+        metadata=metadata,
+    )
+
+
+def _read_header(buffer: mmap.mmap | bytes, path: Path) -> VDBFileInfo:
+    reader = _HeaderReader(buffer)
+    if len(buffer) < 8 or reader.read("<q")[0] != _VDB_MAGIC:
+        raise VDBHeaderError(f"Not an OpenVDB file: {path}")
+
+    (file_version,) = reader.read("<I")
+    if file_version < _FILE_VERSION_NEW_TRANSFORM:
+        raise VDBHeaderError(
+            f"OpenVDB file version {file_version} is too old to be read: {path}"
+        )
+    library_version = reader.read("<2I")
+    (has_grid_offsets,) = reader.read("<?")
+    if (
+        _FILE_VERSION_SELECTIVE_COMPRESSION
+        <= file_version
+        < _FILE_VERSION_NODE_MASK_COMPRESSION
+    ):
+        reader.skip(1)  # file wide compression
+    uuid = reader.bytes(36).decode("ascii", errors="replace")
+
+    metadata = reader.metadata()
+    if not has_grid_offsets:
+        raise VDBHeaderError(f"OpenVDB file was written without grid offsets: {path}")
+
+    (n_grids,) = reader.read("<i")
+    grids = [_read_grid(reader, buffer, file_version) for _ in range(n_grids)]
+
+    return VDBFileInfo(
+        path=path,
+        file_version=file_version,
+        library_version=library_version,  # type: ignore
+        uuid=uuid,
+        metadata=metadata,
+        grids=grids,
+    )
+
+
+def read_vdb_header(file: str | Path) -> VDBFileInfo:
+    """
+    Read the grids and metadata of a .vdb file without loading it into Blender.
+
+    Only the file header, grid descriptors and each grid's metadata and transform are
+    parsed, through a memory-mapped view of the file, so no voxel data is read. This
+    is fast enough to scan thousands of files before deciding what to import.
+
+    Parameters
+    ----------
+    file : str | Path
+        Path to the .vdb file.
+
+    Returns
+    -------
+    VDBFileInfo
+        The file's metadata and a `VDBGridInfo` for each grid, including value type,
+        voxel size and active voxel bounding box.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file doesn't exist.
+    VDBHeaderError
+        If the file isn't a valid OpenVDB file or uses an unsupported layout.
+
+    Examples
+    --------
+    ```python
+    import databpy as db
+
+    info = db.read_vdb_header("smoke.vdb")
+    for grid in info.grids:
+        print(grid.name, grid.value_type, grid.voxel_size, grid.bbox_min, grid.bbox_max)
+    ```
+    """
+    path = Path(file)
+    with open(path, "rb") as f:
+        try:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files can't be memory-mapped
+            raise VDBHeaderError(f"Not an OpenVDB file: {path}")
+
+        with buffer:
+            try:
+                return _read_header(buffer, path)
+            except (struct.error, IndexError):
+                raise VDBHeaderError(f"OpenVDB file header is truncated: {path}")
+
+
+# number of files each task of the thread pool scans, so that the overhead of
+# scheduling a task is shared by several files
+_SCAN_CHUNK_SIZE = 64
+
+
+def _scan_vdb_file(path: Path) -> tuple:
+    "Stat and read the header of a single file, for a row of `scan_vdb_sequence()`."
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return (False, 0, 0.0, False, None)
+    except OSError:
+        # such as a directory that can't be accessed, the file may still exist
+        return (True, 0, 0.0, False, None)
+    try:
+        info = read_vdb_header(path)
+    except (OSError, VDBHeaderError):
+        # unreadable frames, such as directories or files without permission, are
+        # flagged in their row rather than stopping the scan
+        return (True, stat.st_size, stat.st_mtime, False, None)
+    return (True, stat.st_size, stat.st_mtime, True, info)
+
+
+def _grids_bbox(grids: list[VDBGridInfo]) -> tuple | None:
+    "Bounding box around the active voxels of all grids, if stored in the file."
+    bbox_min = [grid.bbox_min for grid in grids if grid.bbox_min is not None]
+    bbox_max = [grid.bbox_max for grid in grids if grid.bbox_max is not None]
+    if not bbox_min or not bbox_max:
+        return None
+    return tuple(map(min, zip(*bbox_min))), tuple(map(max, zip(*bbox_max)))
+
+
+def _scan_vdb_files(paths: list[Path]) -> list[tuple]:
+    return [_scan_vdb_file(path) for path in paths]
+
+
+def scan_vdb_sequence(
+    files: str | Path | list[str | Path], max_workers: int | None = None
+) -> np.ndarray:
+    """
+    Check every frame of a VDB sequence before importing it.
+
+    Each file is stat'ed and its header read with `read_vdb_header()` on a thread pool,
+    so no voxel data is loaded. Frames missing from the numbering get a row as well.
+    Frames are flagged as inconsistent if they are missing, can't be read (including
+    permission errors and directories), or their grids or voxel size differ from the
+    most common layout in the sequence.
+
+    Parameters
+    ----------
+    files : str | Path | list[str | Path]
+        A directory containing the .vdb files, a glob pattern such as
+        "cache/smoke_*.vdb", or a list of the files in the sequence.
+    max_workers : int | None, optional
+        Number of threads used for reading the files. Defaults to the
+        `ThreadPoolExecutor` default.
+
+    Returns
+    -------
+    np.ndarray
+        A structured array with one row per frame number, sorted by frame, with the
+        fields `frame`, `path`, `exists`, `size` (bytes), `mtime`, `valid` (header
+        could be read), `n_grids`, `grids` (comma separated names), `voxel_size` (of
+        the first grid), `voxel_count` (summed over grids), `bbox_min` and `bbox_max`
+        (over all grids, in index space) and `consistent`.
+
+    Raises
+    ------
+    RuntimeError
+        If no files were found for the sequence.
+    ValueError
+        If the file names don't share a single numbered naming pattern.
+
+    Examples
+    --------
+    ```python
+    import databpy as db
+
+    frames = db.scan_vdb_sequence("cache/smoke_*.vdb")
+    bad = frames[~frames["consistent"]]
+    if len(bad):
+        print("Inconsistent frames:", bad["frame"], bad["grids"])
+    else:
+        db.import_vdb_sequence("cache/smoke_*.vdb")
+    ```
+    """
+    numbered, (directory, prefix, padding, suffix) = _sequence_numbers(
+        _sequence_files(files)
+    )
+    numbers = range(min(numbered), max(numbered) + 1)
+    paths = [
+        numbered.get(number, directory / f"{prefix}{number:0{padding}d}{suffix}")
+        for number in numbers
+    ]
+
+    chunks = [
+        paths[i : i + _SCAN_CHUNK_SIZE] for i in range(0, len(paths), _SCAN_CHUNK_SIZE)
+    ]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        scanned = executor.map(_scan_vdb_files, chunks)
+        results = [row for rows in scanned for row in rows]
+
+    exists, sizes, mtimes, valid, infos = zip(*results)
+    grids = [",".join(info.grid_names) if info else "" for info in infos]
+    dtype = np.dtype(
+        [
+            ("frame", np.int64),
+            ("path", f"U{max(len(str(path)) for path in paths)}"),
+            ("exists", np.bool_),
+            ("size", np.int64),
+            ("mtime", np.float64),
+            ("valid", np.bool_),
+            ("n_grids", np.int32),
+            ("grids", f"U{max(max(len(names) for names in grids), 1)}"),
+            ("voxel_size", np.float64, 3),
+            ("voxel_count", np.int64),
+            ("bbox_min", np.int32, 3),
+            ("bbox_max", np.int32, 3),
+            ("consistent", np.bool_),
+        ]
+    )
+    table = np.zeros(len(paths), dtype=dtype)
+    table["frame"] = numbers
+    table["path"] = [str(path) for path in paths]
+    table["exists"] = exists
+    table["size"] = sizes
+    table["mtime"] = mtimes
+    table["valid"] = valid
+    table["grids"] = grids
+    table["voxel_size"] = np.nan
+
+    # grid details are collected per column rather than assigned row by row
+    rows = [i for i, info in enumerate(infos) if info and info.grids]
+    if rows:
+        first_grids = [infos[i].grids[0] for i in rows]
+        table["n_grids"][rows] = [len(infos[i].grids) for i in rows]
+        table["voxel_size"][rows] = [
+            grid.voxel_size or (np.nan,) * 3 for grid in first_grids
+        ]
+        table["voxel_count"][rows] = [
+            sum(grid.voxel_count or 0 for grid in infos[i].grids) for i in rows
+        ]
+        bboxes = [_grids_bbox(infos[i].grids) for i in rows]
+        with_bbox = [i for i, bbox in zip(rows, bboxes) if bbox]
+        if with_bbox:
+            bbox_fields = table[["bbox_min", "bbox_max"]]
+            bbox_fields[with_bbox] = [bbox for bbox in bboxes if bbox]
+
+    # compare every readable frame against the most common grids and voxel size
+    readable = table[table["valid"]]
+    if len(readable):
+        # grids without a fixed voxel size have a NaN voxel size, which has to count
+        # as equal to itself when finding and comparing against the common layout
+        layouts = Counter(
+            (row["grids"], tuple(None if np.isnan(v) else v for v in row["voxel_size"]))
+            for row in readable
+        )
+        grids, voxel_size = layouts.most_common(1)[0][0]
+        voxel_size = np.array([np.nan if v is None else v for v in voxel_size])
+        same_voxel_size = np.isclose(
+            table["voxel_size"], voxel_size, rtol=0, atol=0, equal_nan=True
+        )
+        table["consistent"] = (
+            table["valid"] & (table["grids"] == grids) & np.all(same_voxel_size, axis=1)
+        )
+
+    return table
@@ -7,6 +7,9 @@ argv = argv[argv.index("--") + 1 :]
 # run this script like this:
 # /Applications/Blender.app/Contents/MacOS/Blender -b -P tests/run.py -- . -v
 # /Applications/Blender.app/Contents/MacOS/Blender -b -P tests/run.py -- . -k test_color_lookup_supplied
+# run the benchmarks and write their timings to a JSON file like this:
+# /Applications/Blender.app/Contents/MacOS/Blender -b -P tests/run.py -- \
+#     benchmarks --databpy-bench-json results.json
 
 
 def main():
@@ -560,3 +560,20 @@ def test_position_array_integration():
     tracked_pos += 0.5
     updated = tracked_bob.named_attribute("position")
     assert np.all(updated >= 0.5)
+
+
+def test_attribute_array_skip_unchanged():
+    bob = db.create_bob(np.zeros((10, 3)))
+    pos = db.AttributeArray(bob.object, "position", skip_unchanged=True)
+    pos[:, 0] = 1.0
+    np.testing.assert_array_equal(bob.named_attribute("position")[:, 0], 1.0)
+
+    # the position is edited outside of databpy, so assigning the same values is
+    # skipped while new values are still written
+    bob.data.vertices[0].co = (5, 5, 5)
+    pos[:, 0] = 1.0
+    np.testing.assert_array_equal(bob.named_attribute("position")[0], (5, 5, 5))
+    view = pos[2:4]
+    view += 1.0
+    np.testing.assert_array_equal(bob.named_attribute("position")[2], (2, 1, 1))
+    np.testing.assert_array_equal(bob.named_attribute("position")[0], (1, 0, 0))
@@ -471,3 +471,62 @@ def test_attribute_from_array_reshaping():
     result = attr.as_array()
     assert result.shape == (3, 3)
     np.testing.assert_array_equal(result, flat_data.reshape(3, 3))
+
+
+def _set_raw(obj, name, data):
+    "Write attribute values without going through databpy."
+    obj.data.attributes[name].data.foreach_set("value", np.ravel(data))
+
+
+def test_store_skip_unchanged(monkeypatch):
+    obj = bpy.data.objects["Cube"]
+    data = np.arange(8, dtype=np.float32)
+    db.store_named_attribute(obj, data, "skipped", skip_unchanged=True)
+
+    refreshes = []
+    monkeypatch.setattr(
+        db.attribute, "_refresh_object_data", lambda obj: refreshes.append(obj)
+    )
+    # changes made outside of databpy aren't seen, so this write is skipped
+    _set_raw(obj, "skipped", np.zeros(8))
+    db.store_named_attribute(obj, data, "skipped", skip_unchanged=True)
+    np.testing.assert_array_equal(db.named_attribute(obj, "skipped"), 0)
+    assert refreshes == []
+
+    # different data, a different type or a write without skipping are all written
+    db.store_named_attribute(obj, data + 1, "skipped", skip_unchanged=True)
+    np.testing.assert_array_equal(db.named_attribute(obj, "skipped"), data + 1)
+    assert len(refreshes) == 1
+
+    db.store_named_attribute(obj, data + 1, "skipped")
+    _set_raw(obj, "skipped", np.zeros(8))
+    db.store_named_attribute(obj, data + 1, "skipped", skip_unchanged=True)
+    np.testing.assert_array_equal(db.named_attribute(obj, "skipped"), data + 1)
+
+
+def test_store_skip_unchanged_removed_attribute():
+    obj = bpy.data.objects["Cube"]
+    data = np.arange(8, dtype=np.float32)
+    db.store_named_attribute(obj, data, "skipped", skip_unchanged=True)
+    db.remove_named_attribute(obj, "skipped")
+    db.store_named_attribute(obj, data, "skipped", skip_unchanged=True)
+    np.testing.assert_array_equal(db.named_attribute(obj, "skipped"), data)
+
+
+def test_store_attributes_skip_unchanged(monkeypatch):
+    obj = bpy.data.objects["Cube"]
+    attributes = {"a": np.arange(8), "b": np.random.rand(8, 3)}
+    db.store_named_attributes(obj, attributes, skip_unchanged=True)
+
+    refreshes = []
+    monkeypatch.setattr(
+        db.attribute, "_refresh_object_data", lambda obj: refreshes.append(obj)
+    )
+    db.store_named_attributes(obj, attributes, skip_unchanged=True)
+    assert refreshes == []
+
+    attributes["a"] = attributes["a"] + 1
+    written = db.store_named_attributes(obj, attributes, skip_unchanged=True)
+    assert [a.name for a in written] == ["a", "b"]
+    assert len(refreshes) == 1
+    np.testing.assert_array_equal(db.named_attribute(obj, "a"), attributes["a"])
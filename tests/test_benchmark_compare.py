@@ -0,0 +1,99 @@
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+PATH = Path(__file__).parent.parent / "benchmarks" / "compare.py"
+spec = importlib.util.spec_from_file_location("benchmark_compare", PATH)
+compare = importlib.util.module_from_spec(spec)  # type: ignore
+spec.loader.exec_module(compare)  # type: ignore
+
+
+def write_results(path, benchmarks):
+    results = [
+        {
+            "name": name,
+            "group": name.split("::")[0].removeprefix("bench_").removesuffix(".py"),
+            "params": params,
+            "samples": samples,
+        }
+        for name, params, samples in benchmarks
+    ]
+    path.write_text(json.dumps({"format": 1, "benchmarks": results}))
+    return path
+
+
+def scaled(name, exponent, noise=0.0):
+    "A benchmark run at several sizes whose time grows as n ** exponent."
+    return [
+        (
+            f"{name}[{n}]",
+            {"n_elements": str(n)},
+            [n**exponent * 1e-6 * (1 + noise * i) for i in range(5)],
+        )
+        for n in (10**3, 10**4, 10**5)
+    ]
+
+
+def test_compare_identical(tmp_path, capsys):
+    benchmarks = scaled("bench_create.py::test_create_mesh_object", 1.0, noise=0.01)
+    base = write_results(tmp_path / "base.json", benchmarks)
+    cand = write_results(tmp_path / "cand.json", benchmarks)
+
+    assert compare.main([str(base), str(cand)]) == 0
+    assert "0 regressions" in capsys.readouterr().out
+
+
+def test_compare_slowdown(tmp_path, capsys):
+    name = "bench_attribute.py::test_as_array[FLOAT-1000]"
+    base = write_results(tmp_path / "base.json", [(name, {}, [1.0, 1.01, 0.99, 1.0])])
+    cand = write_results(tmp_path / "cand.json", [(name, {}, [1.5, 1.51, 1.49, 1.5])])
+
+    assert compare.main([str(base), str(cand)]) == 1
+    out = capsys.readouterr().out
+    assert "SLOWER" in out and "1.50x" in out
+
+    # regressions outside of the gated groups don't fail the comparison
+    assert compare.main([str(base), str(cand), "--group", "create"]) == 0
+
+
+def test_compare_ignores_noise(tmp_path):
+    name = "bench_attribute.py::test_as_array[FLOAT-1000]"
+    base = write_results(tmp_path / "base.json", [(name, {}, [1.0, 2.0, 1.0, 2.0])])
+    cand = write_results(tmp_path / "cand.json", [(name, {}, [1.2, 2.2, 1.3, 2.1])])
+
+    assert compare.main([str(base), str(cand)]) == 0
+
+
+def test_compare_scaling(tmp_path, capsys):
+    family = "bench_create.py::test_create_curves_object"
+    base = write_results(tmp_path / "base.json", scaled(family, 1.0))
+    cand = write_results(tmp_path / "cand.json", scaled(family, 1.5))
+
+    comparisons, scaling = compare.compare(
+        compare.load_results(base), compare.load_results(cand)
+    )
+    assert len(comparisons) == 3
+    assert scaling[0].family == family
+    assert scaling[0].baseline == pytest.approx(1.0)
+    assert scaling[0].candidate == pytest.approx(1.5)
+    assert scaling[0].status == "slower"
+
+    assert compare.main([str(base), str(cand)]) == 1
+    assert "n^1.50" in capsys.readouterr().out
+
+
+def test_compare_pools_directory(tmp_path):
+    name = "bench_objects.py::test_get_from_uuid[100]"
+    runs = tmp_path / "runs"
+    runs.mkdir()
+    write_results(runs / "1.json", [(name, {}, [1.0, 1.1])])
+    write_results(runs / "2.json", [(name, {}, [0.9, 1.0])])
+
+    results = compare.load_results(runs)
+    assert sorted(results[name].samples) == [0.9, 1.0, 1.0, 1.1]
+    assert results[name].median == pytest.approx(1.0)
+
+    with pytest.raises(FileNotFoundError):
+        compare.load_results(tmp_path / "runs" / "missing")
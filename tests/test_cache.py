@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+import databpy as db
+from databpy.cache import HEADER_SIZE
+
+N_POINTS = 50
+
+
+def test_cache_roundtrip(tmp_path):
+    frames = np.random.default_rng(0).random((10, N_POINTS, 3))
+    with db.FrameCacheWriter(tmp_path) as writer:
+        writer.append({"res_id": np.arange(N_POINTS)})
+        for frame in frames:
+            writer.append({"position": frame})
+
+    cache = db.FrameCache(tmp_path)
+    assert set(cache) == {"position", "res_id"}
+    assert cache.n_frames("position") == 10
+    assert cache.n_frames() == 1
+
+    positions = cache["position"]
+    assert isinstance(positions, np.memmap)
+    assert positions.shape == (10, N_POINTS, 3)
+    assert positions.dtype == np.float32
+    np.testing.assert_allclose(positions[7], frames[7], rtol=1e-6)
+    assert cache["res_id"].shape == (1, N_POINTS)
+    assert cache["res_id"].dtype == np.int32
+
+
+def test_cache_header(tmp_path):
+    with db.FrameCacheWriter(tmp_path, domain="FACE") as writer:
+        writer.append({"color": np.ones((4, 4))}, atypes={"color": "FLOAT_COLOR"})
+
+    header = db.read_frame_cache_header(tmp_path / "color.frames")
+    assert header.atype == db.AttributeTypes.FLOAT_COLOR
+    assert header.domain == "FACE"
+    assert header.n_frames == 1
+    assert header.n_elements == 4
+    assert header.frame_nbytes == 4 * 4 * 4
+    assert (tmp_path / "color.frames").stat().st_size == HEADER_SIZE + 64
+
+
+def test_cache_append_while_reading(tmp_path):
+    writer = db.FrameCacheWriter(tmp_path)
+    writer.append({"position": np.zeros((N_POINTS, 3))})
+    cache = db.FrameCache(tmp_path)
+    assert cache.n_frames("position") == 1
+
+    writer.append({"position": np.ones((N_POINTS, 3))})
+    writer.close()
+    cache.refresh()
+    assert cache["position"].shape[0] == 2
+    np.testing.assert_array_equal(cache["position"][1], 1)
+
+    # reopening continues appending to the existing files
+    with db.FrameCacheWriter(tmp_path) as writer:
+        writer.append({"position": np.full((N_POINTS, 3), 2)})
+    assert db.FrameCache(tmp_path).n_frames("position") == 3
+
+
+def test_cache_frame_mismatch(tmp_path):
+    with db.FrameCacheWriter(tmp_path) as writer:
+        writer.append({"position": np.zeros((N_POINTS, 3))})
+        with pytest.raises(db.AttributeMismatchError):
+            writer.append({"position": np.zeros((N_POINTS + 1, 3))})
+
+
+def test_cache_invalid_file(tmp_path):
+    (tmp_path / "bad.frames").write_bytes(b"not a cache file" * 8)
+    with pytest.raises(db.FrameCacheError, match="Not a frame cache"):
+        db.FrameCache(tmp_path)
+
+
+def test_cache_trajectory_player(tmp_path):
+    frames = np.random.default_rng(1).random((5, N_POINTS, 3))
+    with db.FrameCacheWriter(tmp_path) as writer:
+        writer.append({"res_id": np.arange(N_POINTS)})
+        for frame in frames:
+            writer.append({"position": frame})
+
+    bob = db.create_bob(frames[0])
+    player = db.TrajectoryPlayer(bob, db.FrameCache(tmp_path))
+    assert player.n_frames == 5
+
+    assert player.update(1).n_written == 2
+    # the static attribute only has a single frame and isn't written again
+    assert player.update(4).n_written == 1
+    np.testing.assert_allclose(bob.position, frames[3], rtol=1e-6)
+    np.testing.assert_array_equal(bob.named_attribute("res_id"), np.arange(N_POINTS))
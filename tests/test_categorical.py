@@ -0,0 +1,62 @@
+import bpy
+import numpy as np
+import pytest
+
+import databpy as db
+from databpy.categorical import categories
+
+
+def test_store_categorical_attribute():
+    bob = db.create_bob(np.random.rand(5, 3))
+    strings = ["B", "A", "C", "A", "B"]
+    tree = db.store_categorical_attribute(bob.object, strings, "chain_id")
+
+    assert bob.attributes["chain_id"].data_type == "INT8"
+    np.testing.assert_array_equal(bob.named_attribute("chain_id"), [1, 0, 2, 0, 1])
+    np.testing.assert_array_equal(categories(bob.object, "chain_id"), ["A", "B", "C"])
+    np.testing.assert_array_equal(
+        db.categorical_attribute(bob.object, "chain_id"), strings
+    )
+
+    assert tree.name == "chain_id"
+    iswitch = next(n for n in tree.nodes if n.type == "INDEX_SWITCH")
+    assert [iswitch.inputs[i + 1].default_value for i in range(3)] == ["A", "B", "C"]
+
+
+def test_store_categorical_attribute_int():
+    n = 300
+    bob = db.create_bob(np.random.rand(n, 3))
+    strings = np.array([f"res_{i}" for i in np.random.randint(0, 200, n)])
+    db.store_categorical_attribute(bob.object, strings, "res_name")
+
+    assert bob.attributes["res_name"].data_type == "INT"
+    np.testing.assert_array_equal(
+        db.categorical_attribute(bob.object, "res_name"), strings
+    )
+
+
+def test_store_categorical_attribute_changing_type():
+    n = 300
+    bob = db.create_bob(np.random.rand(n, 3))
+    db.store_categorical_attribute(bob.object, [str(i) for i in range(n)], "label")
+    assert bob.attributes["label"].data_type == "INT"
+
+    db.store_categorical_attribute(bob.object, ["A"] * n, "label")
+    assert bob.attributes["label"].data_type == "INT8"
+    assert (db.categorical_attribute(bob.object, "label") == "A").all()
+
+
+def test_store_categorical_attribute_reuses_tree():
+    bob1 = db.create_bob(np.random.rand(3, 3))
+    bob2 = db.create_bob(np.random.rand(3, 3))
+    tree1 = db.store_categorical_attribute(bob1.object, ["A", "B", "C"], "chain_id")
+    tree2 = db.store_categorical_attribute(bob2.object, ["C", "B", "A"], "chain_id")
+    assert tree1 == tree2
+    assert "chain_id.001" not in bpy.data.node_groups
+
+
+def test_categorical_attribute_missing():
+    bob = db.create_bob(np.random.rand(3, 3))
+    bob.store_named_attribute(np.arange(3), "not_categorical")
+    with pytest.raises(db.NamedAttributeError):
+        db.categorical_attribute(bob.object, "not_categorical")
@@ -249,3 +249,121 @@ def test_move_to_collection_between_collections():
     db.move_to_collection(cube, col_b)
     assert cube.name in col_b.objects
     assert cube.name not in col_a.objects
+
+
+def test_move_to_collection_stats():
+    col_a = db.create_collection("StatsA")
+    col_b = db.create_collection("StatsB")
+    target = db.create_collection("StatsTarget")
+    mesh = bpy.data.meshes.new("StatsMesh")
+    objs = [bpy.data.objects.new(f"StatsObj{i}", mesh) for i in range(6)]
+
+    for obj in objs[:2]:
+        target.objects.link(obj)
+    # already in the target but also in another collection
+    target.objects.link(objs[2])
+    col_a.objects.link(objs[2])
+    for obj in objs[3:5]:
+        col_a.objects.link(obj)
+        col_b.objects.link(obj)
+    # objs[5] isn't in any collection
+
+    stats = db.move_to_collection(objs + objs[:1], target)
+
+    assert stats == db.CollectionMoveStats(n_linked=3, n_unlinked=5, n_skipped=2)
+    for obj in objs:
+        assert list(obj.users_collection) == [target]
+
+    assert db.move_to_collection(objs, target) == db.CollectionMoveStats(n_skipped=6)
+
+
+def test_move_to_collection_scene_root():
+    col = db.create_collection("MoveFromHere")
+    obj = bpy.data.objects.new("MoveToRoot", bpy.data.meshes.new("MoveToRoot"))
+    col.objects.link(obj)
+
+    stats = db.move_to_collection(obj, bpy.context.scene.collection)
+
+    assert stats.n_linked == 1 and stats.n_unlinked == 1
+    assert list(obj.users_collection) == [bpy.context.scene.collection]
+
+
+def test_ensure_collection_path():
+    leaf = db.ensure_collection_path("Project/Molecule/Chains/A")
+
+    assert leaf.name == "A"
+    chains = bpy.data.collections["Chains"]
+    assert leaf.name in chains.children
+    assert chains.name in bpy.data.collections["Molecule"].children
+    assert "Project" in bpy.context.scene.collection.children
+    assert "Molecule" not in bpy.context.scene.collection.children
+
+    n_coll = len(bpy.data.collections)
+    assert db.ensure_collection_path(["Project", "Molecule", "Chains", "A"]) == leaf
+    assert len(bpy.data.collections) == n_coll
+
+
+def test_ensure_collection_paths_shared_prefix():
+    paths = [f"Bulk/Chains/{chain}" for chain in "ABCD"] + ["Bulk/Ligands"]
+    leaves = db.ensure_collection_paths(paths, parent="Collection")
+
+    assert [coll.name for coll in leaves] == ["A", "B", "C", "D", "Ligands"]
+    chains = bpy.data.collections["Chains"]
+    assert sorted(chains.children.keys()) == ["A", "B", "C", "D"]
+    bulk = bpy.data.collections["Bulk"]
+    assert bulk.name in bpy.data.collections["Collection"].children
+    assert sorted(bulk.children.keys()) == ["Chains", "Ligands"]
+
+
+def test_ensure_collection_path_existing_outside_index():
+    db.ensure_collection_path("Indexed")
+    # created and renamed without going through databpy after the index was built
+    bpy.data.collections.new("Unindexed")
+    bpy.data.collections["Indexed"].name = "Renamed"
+
+    assert db.ensure_collection_path("Unindexed/Child").name == "Child"
+    assert "Unindexed.001" not in bpy.data.collections
+    assert db.ensure_collection_path("Renamed") == bpy.data.collections["Renamed"]
+    assert "Renamed.001" not in bpy.data.collections
+
+
+def test_ensure_collection_path_empty():
+    with pytest.raises(ValueError):
+        db.ensure_collection_path("//")
+
+
+def test_ensure_collection_paths_separate_hierarchies():
+    mol1, mol2 = db.ensure_collection_paths(["Mol1/Chains/A", "Mol2/Chains/A"])
+
+    assert mol1 != mol2
+    assert (mol1.name, mol2.name) == ("A", "A.001")
+    chains1 = bpy.data.collections["Mol1"].children[0]
+    chains2 = bpy.data.collections["Mol2"].children[0]
+    assert chains1 != chains2
+    assert list(chains1.children) == [mol1]
+    assert list(chains2.children) == [mol2]
+
+    # found again by their path rather than by name
+    n_coll = len(bpy.data.collections)
+    assert db.ensure_collection_path("Mol2/Chains/A") == mol2
+    assert db.ensure_collection_path("Mol1/Chains/A") == mol1
+    assert len(bpy.data.collections) == n_coll
+
+    # an existing collection elsewhere in the scene isn't moved into the path
+    existing = db.create_collection("Ligands")
+    ligands = db.ensure_collection_path("Mol1/Ligands")
+    assert ligands != existing
+    assert existing.name in bpy.context.scene.collection.children
+
+
+@pytest.mark.parametrize("path", ["X/X", "P/Q/P", ["R", "S", "R"]])
+def test_ensure_collection_paths_self_nested(path):
+    n_coll = len(bpy.data.collections)
+    with pytest.raises(ValueError, match="inside of itself"):
+        db.ensure_collection_paths(["Valid/Path", path])
+    # nothing is created when any of the paths is invalid
+    assert len(bpy.data.collections) == n_coll
+
+    parent = db.create_collection("Parent")
+    with pytest.raises(ValueError, match="inside of itself"):
+        db.ensure_collection_path("Child/Parent", parent=parent)
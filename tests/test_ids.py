@@ -0,0 +1,156 @@
+import bpy
+import numpy as np
+
+import databpy as db
+from databpy.ids import deduplicate_ids
+from databpy.material import append_from_blend as append_material
+
+
+def test_deduplicate_materials():
+    mat = bpy.data.materials.new("TestMat")
+    dup = mat.copy()
+    assert dup.name == "TestMat.001"
+
+    obj = bpy.data.objects["Cube"]
+    obj.data.materials.append(dup)
+
+    stats = deduplicate_ids(collections=("materials",))
+
+    assert stats.n_ids == 1
+    assert stats.per_collection == {"materials": 1}
+    assert "TestMat.001" not in bpy.data.materials
+    assert obj.data.materials[-1] == bpy.data.materials["TestMat"]
+
+
+def test_deduplicate_only_given_ids():
+    bpy.data.materials.new("Given")
+    given = bpy.data.materials["Given"].copy()
+    bpy.data.materials.new("Other")
+    bpy.data.materials["Other"].copy()
+
+    stats = deduplicate_ids([given], collections=("materials",))
+
+    assert stats.n_ids == 1
+    assert "Given.001" not in bpy.data.materials
+    assert "Other.001" in bpy.data.materials
+
+
+def test_deduplicate_mixed_types_in_one_pass():
+    tree = db.nodes.new_tree("DedupTree")
+    tree.copy()
+    bpy.data.materials.new("DedupMat").copy()
+    image = bpy.data.images.new("DedupImage", 16, 16)
+    # access the pixels so that the image buffer of the duplicate is loaded
+    image.copy().pixels[0]
+
+    stats = deduplicate_ids(collections=("node_groups", "materials", "images"))
+
+    assert stats.n_ids == 3
+    assert stats.per_collection == {"node_groups": 1, "materials": 1, "images": 1}
+    # a 16x16 RGBA byte image
+    assert stats.n_bytes == 16 * 16 * 4
+
+
+def test_deduplicate_skips_objects_by_default():
+    bpy.data.objects["Cube"].copy()
+    assert deduplicate_ids().n_ids == 0
+    assert "Cube.001" in bpy.data.objects
+
+
+def test_deduplicate_only_node_groups_by_default():
+    db.nodes.new_tree("DefaultTree").copy()
+    bpy.data.materials.new("DefaultMat").copy()
+    bpy.data.images.new("DefaultImage", 4, 4).copy()
+
+    stats = deduplicate_ids()
+
+    assert stats.per_collection == {"node_groups": 1}
+    assert "DefaultMat.001" in bpy.data.materials
+    assert "DefaultImage.001" in bpy.data.images
+
+
+def test_append_material_keeps_existing_ids(tmp_path):
+    # a material in another file which happens to share names with unrelated IDs in
+    # the current file, only differing by the numeric suffix
+    mat = bpy.data.materials.new("Material.001")
+    mat.diffuse_color = (1.0, 0.0, 0.0, 1.0)
+    image = bpy.data.images.new("Texture", 8, 8)
+    mat.node_tree.nodes.new("ShaderNodeTexImage").image = image
+    filepath = str(tmp_path / "material.blend")
+    bpy.data.libraries.write(filepath, {mat})
+    bpy.data.materials.remove(mat)
+    bpy.data.images.remove(image)
+
+    existing = bpy.data.materials["Material"]
+    color = tuple(existing.diffuse_color)
+    texture = bpy.data.images.new("Texture", 2, 2)
+
+    appended = append_material("Material.001", filepath)
+
+    assert appended.name == "Material.001"
+    assert appended != existing
+    assert tuple(appended.diffuse_color) == (1.0, 0.0, 0.0, 1.0)
+    assert tuple(existing.diffuse_color) == color
+    node = appended.node_tree.nodes["Image Texture"]
+    assert node.image != texture
+    assert tuple(node.image.size) == (8, 8)
+    assert tuple(texture.size) == (2, 2)
+
+
+def test_deduplicate_mesh_bytes():
+    bob = db.create_bob(np.random.rand(10, 3), name="DedupMesh")
+    bob.data.copy()
+    stats = deduplicate_ids(collections=("meshes",))
+    assert stats.n_ids == 1
+    # at least the float3 positions are reclaimed
+    assert stats.n_bytes >= 10 * 3 * 4
+
+
+def test_deduplication_stats_add():
+    a = db.DeduplicationStats(1, 10, {"materials": 1})
+    b = db.DeduplicationStats(2, 5, {"materials": 1, "images": 1})
+    c = a + b
+    assert c.n_ids == 3
+    assert c.n_bytes == 15
+    assert c.per_collection == {"materials": 2, "images": 1}
+
+
+def test_purge_orphans_only_tracked():
+    tracked = bpy.data.materials.new("Tracked")
+    untracked = bpy.data.materials.new("Untracked")
+    used = bpy.data.materials.new("Used")
+    bpy.data.objects["Cube"].data.materials.append(used)
+
+    assert db.purge_orphans([tracked, used]) == 1
+
+    assert "Tracked" not in bpy.data.materials
+    assert "Used" in bpy.data.materials
+    assert untracked.name in bpy.data.materials
+
+
+def test_purge_orphans_recursive():
+    inner = db.nodes.new_tree("Inner")
+    outer = db.nodes.new_tree("Outer")
+    outer.nodes.new("GeometryNodeGroup").node_tree = inner
+
+    assert inner.users == 1
+    assert db.purge_orphans([inner, outer], recursive=False) == 1
+    assert "Inner" in bpy.data.node_groups
+
+    assert db.purge_orphans([inner]) == 1
+    assert "Inner" not in bpy.data.node_groups
+
+
+def test_purge_orphans_recursive_chain():
+    inner = db.nodes.new_tree("Inner")
+    outer = db.nodes.new_tree("Outer")
+    outer.nodes.new("GeometryNodeGroup").node_tree = inner
+
+    assert db.purge_orphans([inner, outer]) == 2
+    assert len(bpy.data.node_groups) == 0
+
+
+def test_purge_orphans_ignores_removed():
+    mat = bpy.data.materials.new("Removed")
+    bpy.data.materials.remove(mat)
+    assert db.purge_orphans([mat]) == 0
@@ -0,0 +1,87 @@
+import bpy
+import numpy as np
+import pytest
+
+import databpy as db
+
+
+def test_memory_report_sizes():
+    bob = db.create_bob(np.random.rand(100, 3), name="Report")
+    bob.store_named_attribute(np.random.rand(100, 4, 4), "matrix")
+    bob.store_named_attribute(np.random.rand(100) > 0.5, "mask")
+
+    report = bob.memory_report()
+    rows = {row["name"]: row for row in report}
+
+    assert rows["position"]["n_bytes"] == 100 * 3 * 4
+    assert rows["matrix"]["n_bytes"] == 100 * 16 * 4
+    assert rows["mask"]["n_bytes"] == 100
+    assert rows["position"]["object"] == "Report"
+    assert rows["position"]["domain"] == "POINT"
+    assert rows["matrix"]["type"] == "FLOAT4X4"
+    # largest first
+    assert report[0]["name"] == "matrix"
+    assert list(report["n_bytes"]) == sorted(report["n_bytes"], reverse=True)
+
+
+def test_memory_report_hidden():
+    report = db.memory_report(bpy.data.objects["Cube"])
+    hidden = report[report["hidden"]]
+    assert ".corner_vert" in hidden["name"]
+    assert "position" not in hidden["name"]
+
+    corner_vert = report[report["name"] == ".corner_vert"][0]
+    assert corner_vert["domain"] == "CORNER"
+    assert corner_vert["n_elements"] == 24
+    # hidden attributes are used by Blender and not suggested for a smaller type
+    assert corner_vert["suggested_type"] == ""
+
+
+def test_memory_report_downcast():
+    bob = db.create_bob(np.random.rand(50, 3))
+    bob.store_named_attribute(np.arange(50) % 10, "small_int", atype="INT")
+    bob.store_named_attribute(np.arange(50) * 1000, "large_int", atype="INT")
+    bob.store_named_attribute(np.random.rand(50, 4), "color", atype="FLOAT_COLOR")
+    bob.store_named_attribute(
+        np.random.rand(50, 4) * 10, "hdr_color", atype="FLOAT_COLOR"
+    )
+
+    rows = {row["name"]: row for row in bob.memory_report(downcast=True)}
+    assert rows["small_int"]["suggested_type"] == "INT8"
+    assert rows["small_int"]["n_saved_bytes"] == 50 * 3
+    assert rows["large_int"]["suggested_type"] == ""
+    assert rows["color"]["suggested_type"] == "BYTE_COLOR"
+    assert rows["color"]["n_saved_bytes"] == 50 * 12
+    assert rows["hdr_color"]["suggested_type"] == ""
+
+    # only sizes are reported by default, without reading any values
+    rows = {row["name"]: row for row in bob.memory_report()}
+    assert rows["small_int"]["suggested_type"] == ""
+    assert rows["small_int"]["n_saved_bytes"] == 0
+
+
+def test_scene_memory_report():
+    bob = db.create_bob(np.random.rand(10, 3), name="First")
+    linked = bpy.data.objects.new("Linked", bob.data)
+    bpy.context.scene.collection.objects.link(linked)
+    db.create_pointcloud_object(np.random.rand(20, 3), name="Points")
+
+    report = db.scene_memory_report()
+    # shared geometry is only reported once, cameras and lights not at all
+    objects = set(report["object"])
+    assert len(objects) == 3
+    assert {"Cube", "Points"} < objects
+    assert len({"First", "Linked"} & objects) == 1
+    assert report[report["object"] == "Points"]["n_elements"][0] == 20
+    assert list(report["n_bytes"]) == sorted(report["n_bytes"], reverse=True)
+
+    by_name = np.sort(report, order="name")
+    assert list(by_name["name"]) == sorted(report["name"])
+
+    report = db.scene_memory_report([bpy.data.objects["Cube"]])
+    assert set(report["object"]) == {"Cube"}
+
+
+def test_memory_report_not_geometry():
+    with pytest.raises(TypeError):
+        db.memory_report(bpy.data.objects["Camera"])
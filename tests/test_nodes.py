@@ -2,6 +2,7 @@ import tempfile
 from pathlib import Path
 
 import bpy
+import numpy as np
 import pytest
 
 import databpy as db
@@ -67,6 +68,79 @@ def test_long_list():
         assert tree.nodes["Index Switch"].inputs[i + 1].default_value == str(val)
 
 
+def test_custom_string_iswitch_reuses_identical():
+    """Test that requesting the same values returns the existing tree"""
+    info = db.nodes.tree_cache_info()
+    hits = info.hits
+    tree1 = custom_string_iswitch("CacheTest", ["A", "B", "C"])
+    tree2 = custom_string_iswitch("CacheTest", ["A", "B", "C"])
+    tree3 = custom_string_iswitch("CacheTest", ["A", "B", "C"], "other_attr")
+
+    assert tree1 == tree2
+    assert tree3 != tree1
+    assert info.hits == hits + 1
+    assert "CacheTest.002" not in bpy.data.node_groups
+
+
+def test_custom_string_iswitch_cache_renamed_tree():
+    tree = custom_string_iswitch("Renamed", ["A", "B"])
+    tree.name = "SomethingElse"
+    assert custom_string_iswitch("Renamed", ["A", "B"]) == tree
+
+
+def test_custom_string_iswitch_cache_removed_tree():
+    tree = custom_string_iswitch("Removed", ["A", "B"])
+    bpy.data.node_groups.remove(tree)
+    tree = custom_string_iswitch("Removed", ["A", "B"])
+    assert tree.name == "Removed"
+
+
+def test_custom_string_iswitch_chunked():
+    """Test that long lists are split across chunked node groups"""
+    values = [f"value_{i}" for i in range(db.nodes.generating.ISWITCH_MAX_ITEMS + 10)]
+    chunk_size = db.nodes.generating.ISWITCH_CHUNK_SIZE
+    tree = custom_string_iswitch("ChunkTest", values, "res_id")
+
+    assert tree.interface.items_tree["res_id"].in_out == "INPUT"
+    assert tree.interface.items_tree["String"].in_out == "OUTPUT"
+
+    iswitch = next(n for n in tree.nodes if n.type == "INDEX_SWITCH")
+    n_chunks = len(iswitch.index_switch_items)
+    assert n_chunks == -(-len(values) // chunk_size)
+
+    for i in range(n_chunks):
+        chunk_tree = iswitch.inputs[i + 1].links[0].from_node.node_tree
+        assert chunk_tree.name.startswith(".")
+        chunk_switch = next(n for n in chunk_tree.nodes if n.type == "INDEX_SWITCH")
+        chunk = values[i * chunk_size : (i + 1) * chunk_size]
+        for j, value in enumerate(chunk):
+            assert chunk_switch.inputs[j + 1].default_value == value
+
+
+def test_custom_string_iswitch_chunked_failure():
+    """Test that chunks built before a failing chunk are removed"""
+    values = [f"value_{i}" for i in range(db.nodes.generating.ISWITCH_MAX_ITEMS + 10)]
+    values[-1] = 1  # type: ignore
+    # a chunk that is already cached from an earlier lookup is kept
+    cached = custom_string_iswitch(".Cached", values[:256])
+    n_trees = len(bpy.data.node_groups)
+
+    with pytest.raises(NodeGroupCreationError):
+        custom_string_iswitch("ChunkFail", values)
+
+    assert len(bpy.data.node_groups) == n_trees
+    assert ".Cached" in bpy.data.node_groups
+    assert custom_string_iswitch(".Cached", values[:256]) == cached
+
+
+def test_custom_string_iswitch_key_normalised():
+    """Test that numpy strings and tuples reuse the tree built from a list"""
+    tree = custom_string_iswitch("Normalised", ["A", "B", "C"])
+    assert custom_string_iswitch("Normalised", np.array(["A", "B", "C"])) == tree
+    assert custom_string_iswitch("Normalised", ("A", "B", "C")) == tree
+    assert "Normalised.001" not in bpy.data.node_groups
+
+
 def test_raises_error():
     """Test that an error is raised if the node group already exists"""
     with pytest.raises(NodeGroupCreationError):
@@ -205,3 +279,147 @@ def test_append_from_blend(suffix):
         assert tree2.nodes["Index Switch"].inputs[2].default_value == "B"
         assert tree2.nodes["Index Switch"].inputs[3].default_value == "C"
         assert tree2.nodes["Index Switch"].inputs[4].default_value == "D"
+
+
+def test_cleanup_duplicates_purge():
+    tree = db.nodes.new_tree("Used")
+    bpy.data.objects["Cube"].modifiers.new(type="NODES", name="Nodes").node_group = tree
+    tree.copy()
+    db.nodes.new_tree("Unused")
+    mat = bpy.data.materials.new("UnusedMaterial")
+
+    stats = db.nodes.cleanup_duplicates(purge=True)
+
+    assert stats.n_ids == 1
+    assert list(bpy.data.node_groups.keys()) == ["Used"]
+    # orphans outside of the node groups are left alone
+    assert mat.name in bpy.data.materials
+
+
+def _group_with_sockets(name, sockets):
+    group = db.nodes.new_tree(name)
+    for socket_name, socket_type in sockets:
+        group.interface.new_socket(
+            socket_name, in_out="INPUT", socket_type=f"NodeSocket{socket_type}"
+        )
+    return group
+
+
+def test_swap_tree_everywhere():
+    old = _group_with_sockets("Old", [("test_float", "Float"), ("test_int", "Int")])
+    new = _group_with_sockets("New", [("test_float", "Float"), ("test_int2", "Int")])
+    new.interface.items_tree["test_float"].default_value = 2.5
+
+    trees = [db.nodes.new_tree(f"Tree{i}") for i in range(2)]
+    for tree in trees:
+        node_in = db.nodes.get_input(tree)
+        node_out = db.nodes.get_output(tree)
+        tree.interface.new_socket(
+            "value", in_out="INPUT", socket_type="NodeSocketFloat"
+        )
+        # two group nodes chained together, so links between swapped nodes are kept
+        node_a = tree.nodes.new("GeometryNodeGroup")
+        node_a.node_tree = old
+        node_b = tree.nodes.new("GeometryNodeGroup")
+        node_b.node_tree = old
+        tree.links.new(node_in.outputs["Geometry"], node_a.inputs["Geometry"])
+        tree.links.new(node_in.outputs["value"], node_a.inputs["test_int"])
+        tree.links.new(node_a.outputs["Geometry"], node_b.inputs["Geometry"])
+        tree.links.new(node_b.outputs["Geometry"], node_out.inputs["Geometry"])
+
+    unrelated = db.nodes.new_tree("Unrelated").nodes.new("GeometryNodeGroup")
+    unrelated.node_tree = new
+
+    assert db.nodes.swap_tree_everywhere(old, new) == 4
+    assert old.users == 0
+
+    for tree in trees:
+        node_b = db.nodes.get_output(tree).inputs["Geometry"].links[0].from_node
+        node_a = node_b.inputs["Geometry"].links[0].from_node
+        assert node_a.inputs["Geometry"].links[0].from_node.type == "GROUP_INPUT"
+        for node in (node_a, node_b):
+            assert node.node_tree == new
+            assert not node.inputs["test_int2"].is_linked
+            assert node.inputs["test_float"].default_value == 2.5
+
+
+def test_swap_tree_everywhere_materials():
+    old = bpy.data.node_groups.new("OldShader", "ShaderNodeTree")
+    new = bpy.data.node_groups.new("NewShader", "ShaderNodeTree")
+    mat = bpy.data.materials.new("SwapMaterial")
+    node = mat.node_tree.nodes.new("ShaderNodeGroup")
+    node.node_tree = old
+
+    assert db.nodes.swap_tree_everywhere(old, new) == 1
+    assert node.node_tree == new
+
+
+OFFSET_SPEC = {
+    "name": "Offset",
+    "sockets": [
+        {"name": "Geometry", "socket_type": "NodeSocketGeometry"},
+        {"name": "Offset", "socket_type": "NodeSocketVector"},
+        {"name": "Scale", "socket_type": "NodeSocketFloat", "default_value": 2.0},
+        {"name": "Geometry", "socket_type": "NodeSocketGeometry", "in_out": "OUTPUT"},
+    ],
+    "nodes": [
+        {"bl_idname": "GeometryNodeSetPosition", "name": "Set"},
+        {
+            "bl_idname": "ShaderNodeVectorMath",
+            "name": "Scale",
+            "properties": {"operation": "SCALE"},
+        },
+    ],
+    "links": [
+        ("Group Input", "Geometry", "Set", "Geometry"),
+        ("Group Input", "Offset", "Scale", 0),
+        ("Group Input", "Scale", "Scale", "Scale"),
+        ("Scale", "Vector", "Set", "Offset"),
+        ("Set", "Geometry", "Group Output", "Geometry"),
+    ],
+}
+
+
+def test_build_tree():
+    tree = db.nodes.build_tree(OFFSET_SPEC)
+
+    assert tree.name == "Offset"
+    assert tree.interface.items_tree["Scale"].default_value == 2.0
+    assert tree.nodes["Scale"].operation == "SCALE"
+    assert tree.nodes["Set"].inputs["Offset"].links[0].from_node == tree.nodes["Scale"]
+    output = db.nodes.get_output(tree)
+    assert output.inputs["Geometry"].links[0].from_node == tree.nodes["Set"]
+    assert len(tree.links) == 5
+
+
+def test_build_tree_cached():
+    hits = db.nodes.tree_cache_info().hits
+    tree = db.nodes.build_tree(OFFSET_SPEC)
+    assert db.nodes.build_tree(db.nodes.TreeSpec.from_dict(OFFSET_SPEC)) == tree
+    assert db.nodes.tree_cache_info().hits == hits + 1
+    assert len(bpy.data.node_groups) == 1
+
+
+def test_build_tree_input_values():
+    spec = db.nodes.TreeSpec(
+        name="Values",
+        nodes=[
+            db.nodes.NodeSpec(
+                "ShaderNodeMath",
+                properties={"operation": "MULTIPLY"},
+                inputs={0: 3.0, 1: 4.0},
+            )
+        ],
+    )
+    tree = db.nodes.build_tree(spec)
+    assert tree.nodes["Math"].inputs[0].default_value == 3.0
+    assert tree.nodes["Math"].inputs[1].default_value == 4.0
+
+
+def test_build_tree_error_cleanup():
+    spec = db.nodes.TreeSpec(
+        name="Broken", nodes=[db.nodes.NodeSpec("GeometryNodeDoesNotExist")]
+    )
+    with pytest.raises(NodeGroupCreationError):
+        db.nodes.build_tree(spec)
+    assert "Broken" not in bpy.data.node_groups
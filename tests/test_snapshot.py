@@ -0,0 +1,122 @@
+import io
+import zipfile
+
+import bpy
+import numpy as np
+import pytest
+
+import databpy as db
+
+
+def check_restored(original, restored):
+    assert restored.type == original.type
+    assert sorted(restored.data.attributes.keys()) == sorted(
+        original.data.attributes.keys()
+    )
+    for attribute in original.data.attributes:
+        np.testing.assert_array_equal(
+            db.named_attribute(restored, attribute.name),
+            db.named_attribute(original, attribute.name),
+        )
+        assert restored.data.attributes[attribute.name].domain == attribute.domain
+        assert restored.data.attributes[attribute.name].data_type == (
+            attribute.data_type
+        )
+
+
+@pytest.mark.parametrize("filename", ["snapshot.npz", "snapshot"])
+def test_snapshot_mesh(tmp_path, filename):
+    cube = bpy.data.objects["Cube"]
+    db.store_named_attribute(cube, np.arange(6), "face_id", domain="FACE")
+    db.store_categorical_attribute(cube, list("ABCABCAB"), "chain_id")
+    cube.location = (1, 2, 3)
+
+    path = db.save_snapshot(cube, tmp_path / filename)
+    restored = db.load_snapshot(path, name="Restored")
+
+    assert restored.name == "Restored"
+    check_restored(cube, restored)
+    assert [tuple(p.vertices) for p in restored.data.polygons] == [
+        tuple(p.vertices) for p in cube.data.polygons
+    ]
+    np.testing.assert_allclose(restored.location, (1, 2, 3))
+    np.testing.assert_array_equal(
+        db.categorical_attribute(restored, "chain_id"), list("ABCABCAB")
+    )
+
+
+def test_snapshot_memory_mapped(tmp_path):
+    bob = db.create_bob(np.random.rand(100, 3))
+    bob.store_named_attribute(np.random.rand(100), "b_factor")
+    bob.save_snapshot(tmp_path / "snapshot")
+
+    array = np.load(tmp_path / "snapshot" / "attribute_0000.npy", mmap_mode="r")
+    assert isinstance(array, np.memmap)
+
+    restored = db.BlenderObject.load_snapshot(tmp_path / "snapshot")
+    assert isinstance(restored, db.BlenderObject)
+    check_restored(bob.object, restored.object)
+
+
+def test_snapshot_npz_loadable_by_numpy(tmp_path):
+    bob = db.create_bob(np.random.rand(10, 3))
+    path = bob.save_snapshot(tmp_path / "snapshot.npz")
+    with np.load(path) as archive:
+        np.testing.assert_allclose(archive["attribute_0000"], bob.position)
+
+
+def test_snapshot_curves(tmp_path):
+    obj = db.create_curves_object(np.random.rand(9, 3), [2, 3, 4])
+    db.store_named_attribute(obj, np.random.rand(3), "width", domain="CURVE")
+
+    restored = db.load_snapshot(db.save_snapshot(obj, tmp_path / "curves.npz"))
+
+    assert [len(c.points) for c in restored.data.curves] == [2, 3, 4]
+    check_restored(obj, restored)
+
+
+def test_snapshot_pointcloud(tmp_path):
+    obj = db.create_pointcloud_object(np.random.rand(20, 3))
+    db.store_named_attribute(obj, np.random.rand(20, 3), "velocity")
+
+    restored = db.load_snapshot(db.save_snapshot(obj, tmp_path / "points"))
+
+    check_restored(obj, restored)
+
+
+@pytest.mark.parametrize("version", [(1, 0), (2, 0), (3, 0)])
+def test_snapshot_npy_header_versions(tmp_path, version):
+    bob = db.create_bob(np.random.rand(10, 3))
+    bob.store_named_attribute(np.random.rand(10), "b_factor")
+    path = bob.save_snapshot(tmp_path / "snapshot.npz")
+
+    rewritten = tmp_path / "rewritten.npz"
+    with zipfile.ZipFile(path) as source, zipfile.ZipFile(rewritten, "w") as target:
+        for name in source.namelist():
+            data = source.read(name)
+            if name.endswith(".npy"):
+                buffer = io.BytesIO()
+                array = np.lib.format.read_array(io.BytesIO(data))
+                np.lib.format.write_array(buffer, array, version=version)
+                data = buffer.getvalue()
+            target.writestr(name, data)
+
+    _, arrays = db.snapshot._read_snapshot(rewritten, mmap=True)
+    # there is no public reader for the header of version 3, so it isn't mapped
+    assert isinstance(arrays["attribute_0000"], np.memmap) == (version != (3, 0))
+
+    collection = db.create_collection("Snapshots")
+    restored = db.load_snapshot(rewritten, collection=collection)
+    assert restored.users_collection[0] == collection
+    check_restored(bob.object, restored)
+
+
+def test_snapshot_newer_version(tmp_path):
+    path = tmp_path / "snapshot"
+    db.save_snapshot(bpy.data.objects["Cube"], path)
+    manifest = (path / "manifest.json").read_text()
+    manifest = manifest.replace('"version": 1', '"version": 99')
+    (path / "manifest.json").write_text(manifest)
+
+    with pytest.raises(ValueError, match="newer"):
+        db.load_snapshot(path)
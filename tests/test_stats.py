@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+import databpy as db
+from databpy import stats
+
+
+def test_profiler_counts_reads_and_writes():
+    bob = db.create_bob(np.random.rand(100, 3), name="Profiled")
+    values = np.random.rand(100).astype(np.float32)
+
+    with stats.Profiler() as profiler:
+        bob.store_named_attribute(values, "b_factor")
+        bob.named_attribute("b_factor")
+        bob.named_attribute("position")
+
+    entry = profiler.entries[("foreach_set", "Profiled", "b_factor")]
+    assert entry.n_calls == 1
+    assert entry.n_elements == 100
+    assert entry.n_bytes == values.nbytes
+    assert entry.seconds >= 0
+
+    reads = profiler.totals("operation")["foreach_get"]
+    assert reads.n_calls == 2
+    assert reads.n_bytes == values.nbytes + 100 * 3 * 4
+    assert profiler.totals("operation")["refresh"].n_calls == 1
+    assert set(profiler.totals("attribute")) >= {"b_factor", "position"}
+
+
+def test_profiler_off_records_nothing():
+    bob = db.create_bob(np.random.rand(10, 3))
+    profiler = stats.Profiler()
+    with profiler:
+        pass
+    bob.store_named_attribute(np.random.rand(10), "b_factor")
+    assert profiler.entries == {}
+    assert stats.measure("foreach_get") is stats._NOT_MEASURING
+
+
+def test_profiler_nesting():
+    bob = db.create_bob(np.random.rand(10, 3))
+    with stats.Profiler() as outer:
+        with stats.Profiler() as inner:
+            bob.named_attribute("position")
+        bob.named_attribute("position")
+
+    assert inner.totals()["total"].n_calls == 1
+    assert outer.totals()["total"].n_calls == 1
+    assert stats._ACTIVE is None
+
+
+def test_profiler_evaluate_and_uuid_lookup():
+    bob = db.create_bob(np.random.rand(10, 3), name="Lookup")
+    bob.object.name = "Renamed"
+
+    with stats.Profiler() as profiler:
+        assert bob.object.name == "Renamed"
+        db.evaluate_object(bob.object)
+
+    lookup = profiler.entries[("uuid_lookup", "Renamed", "")]
+    assert lookup.n_calls == 1
+    assert lookup.n_elements >= 1
+    assert profiler.entries[("evaluate", "Renamed", "")].n_calls == 1
+
+
+def test_profiler_array_and_report():
+    bob = db.create_bob(np.random.rand(10, 3), name="Table")
+    with stats.Profiler() as profiler:
+        bob.store_named_attribute(np.random.rand(10), "b_factor")
+        bob.named_attribute("position")
+
+    array = np.sort(profiler.to_array(), order="n_bytes")
+    assert list(array["operation"]) == ["refresh", "foreach_set", "foreach_get"]
+    assert array["n_calls"].sum() == 3
+
+    report = profiler.report()
+    assert report.splitlines()[0].split() == [
+        "operation",
+        "object",
+        "attribute",
+        "calls",
+        "elements",
+        "MB",
+        "ms",
+    ]
+    assert len(report.splitlines()) == 4
+
+    with pytest.raises(ValueError):
+        profiler.totals("domain")  # type: ignore
+
+
+def test_profiler_skips_failed_operations():
+    with stats.Profiler() as profiler:
+        with pytest.raises(RuntimeError), stats.measure("refresh", "Failing"):
+            raise RuntimeError("failed")
+        with stats.measure("refresh", "Passing"):
+            pass
+
+    assert list(profiler.entries) == [("refresh", "Passing", "")]
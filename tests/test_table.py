@@ -0,0 +1,270 @@
+import bpy
+import numpy as np
+import pytest
+
+import databpy as db
+
+N = 20
+
+
+@pytest.fixture
+def columns():
+    rng = np.random.default_rng(0)
+    return {
+        "x": rng.random(N),
+        "y": rng.random(N),
+        "z": rng.random(N),
+        "b_factor": rng.random(N),
+        "res_id": np.arange(N, dtype=np.int64),
+        "velocity_x": rng.random(N),
+        "velocity_y": rng.random(N),
+        "velocity_z": rng.random(N),
+        "is_backbone": rng.random(N) > 0.5,
+        "chain_id": rng.choice(["A", "B", "C"], N),
+    }
+
+
+def check_table_bob(bob, columns):
+    assert len(bob) == N
+    np.testing.assert_allclose(
+        bob.position, np.column_stack([columns[c] for c in "xyz"]), rtol=1e-6
+    )
+    assert bob.attributes["b_factor"].data_type == "FLOAT"
+    assert bob.attributes["res_id"].data_type == "INT"
+    assert bob.attributes["is_backbone"].data_type == "BOOLEAN"
+    assert bob.attributes["velocity"].data_type == "FLOAT_VECTOR"
+    assert bob.attributes["chain_id"].data_type == "INT8"
+    for name in ("x", "velocity_x"):
+        assert name not in bob.attributes
+
+    np.testing.assert_array_equal(bob.named_attribute("res_id"), columns["res_id"])
+    np.testing.assert_array_equal(
+        bob.named_attribute("is_backbone"), columns["is_backbone"]
+    )
+    np.testing.assert_allclose(
+        bob.named_attribute("velocity")[:, 1], columns["velocity_y"], rtol=1e-6
+    )
+    np.testing.assert_array_equal(
+        db.categorical_attribute(bob.object, "chain_id"), columns["chain_id"]
+    )
+
+
+def test_from_table_dict(columns):
+    bob = db.BlenderObject.from_table(columns, name="FromDict")
+    assert bob.name == "FromDict"
+    check_table_bob(bob, columns)
+
+
+def test_from_table_polars(columns):
+    pl = pytest.importorskip("polars")
+    bob = db.BlenderObject.from_table(pl.DataFrame(columns))
+    check_table_bob(bob, columns)
+
+
+def test_from_table_arrow_stream(columns):
+    pl = pytest.importorskip("polars")
+
+    class ArrowStream:
+        "Only exposes the Arrow PyCapsule stream interface."
+
+        def __init__(self, df):
+            self.df = df
+
+        def __arrow_c_stream__(self, requested_schema=None):
+            return self.df.__arrow_c_stream__(requested_schema)
+
+    bob = db.BlenderObject.from_table(ArrowStream(pl.DataFrame(columns)))
+    check_table_bob(bob, columns)
+
+
+def test_from_table_position_column(columns):
+    positions = np.random.rand(N, 3)
+    velocity = np.random.rand(N, 3)
+    table = {
+        "pos": positions,
+        "vx": velocity[:, 0],
+        "vy": velocity[:, 1],
+        "vz": velocity[:, 2],
+    }
+    bob = db.BlenderObject.from_table(
+        table, position="pos", vectors={"vel": ("vx", "vy", "vz")}
+    )
+    np.testing.assert_allclose(bob.position, positions, rtol=1e-6)
+    np.testing.assert_allclose(bob.named_attribute("vel"), velocity, rtol=1e-6)
+    assert "vx" not in bob.attributes
+
+
+def test_from_table_missing_position():
+    with pytest.raises(ValueError, match="no column"):
+        db.BlenderObject.from_table({"a": np.zeros(3)})
+
+
+def test_from_table_failure_removes_object():
+    n_objects = len(bpy.data.objects)
+    n_meshes = len(bpy.data.meshes)
+    table = {"x": np.zeros(3), "y": np.zeros(3), "z": np.zeros(3)}
+
+    with pytest.raises(ValueError, match="32-bit INT"):
+        db.BlenderObject.from_table({**table, "id": np.array([0, 1, 2**40])})
+    with pytest.raises(db.NamedAttributeError):
+        db.BlenderObject.from_table({**table, "short": np.zeros(2)})
+
+    assert len(bpy.data.objects) == n_objects
+    assert len(bpy.data.meshes) == n_meshes
+
+
+def test_store_table_int_range():
+    bob = db.create_bob(np.random.rand(3, 3))
+    bob.store_table(
+        {
+            "id": np.array([0, 1, 2**31 - 1], dtype=np.int64),
+            "flags": np.array([0, 1, 2], dtype=np.uint32),
+            "pairs": np.array([[0, 1], [2, 3], [4, 5]], dtype=np.int64),
+        }
+    )
+    np.testing.assert_array_equal(bob.named_attribute("id"), [0, 1, 2**31 - 1])
+    assert bob.attributes["pairs"].data_type == "INT32_2D"
+
+    for column in (
+        np.array([0, 1, 2**31], dtype=np.int64),
+        np.array([0, 1, 2**32 - 1], dtype=np.uint32),
+        np.array([[0, 1], [2, 3], [4, -(2**40)]], dtype=np.int64),
+    ):
+        with pytest.raises(ValueError, match="32-bit INT"):
+            bob.store_table({"too_large": column})
+    assert "too_large" not in bob.attributes
+
+
+def test_store_table_face_domain():
+    bob = db.BlenderObject(bpy.data.objects["Cube"])
+    names = bob.store_table(
+        {"area": np.arange(6, dtype=np.float32), "material": ["a", "b"] * 3},
+        domain="FACE",
+    )
+    assert names == ["area", "material"]
+    assert bob.attributes["area"].domain == "FACE"
+    assert bob.attributes["material"].domain == "FACE"
+    np.testing.assert_array_equal(
+        db.categorical_attribute(bob.object, "material"), ["a", "b"] * 3
+    )
+
+
+def test_store_table_single_refresh(monkeypatch):
+    bob = db.create_bob(np.random.rand(N, 3))
+    calls = []
+    refresh = db.attribute._refresh_object_data
+    monkeypatch.setattr(
+        db.attribute,
+        "_refresh_object_data",
+        lambda obj: calls.append(obj) or refresh(obj),
+    )
+    bob.store_table({"a": np.zeros(N), "b": np.ones(N), "c": np.arange(N)})
+    assert len(calls) == 1
+
+
+def test_store_table_unsupported_column():
+    bob = db.create_bob(np.random.rand(3, 3))
+    with pytest.raises(TypeError, match="unsupported dtype"):
+        bob.store_table({"when": np.array([1, 2, 3], dtype="datetime64[s]")})
+    with pytest.raises(TypeError):
+        db.table_columns(42)
+
+
+def test_to_table_components():
+    pl = pytest.importorskip("polars")
+    positions = np.random.rand(N, 3).astype(np.float32)
+    bob = db.create_bob(positions)
+    bob.store_named_attribute(np.arange(N), "res_id")
+    bob.store_named_attribute(np.random.rand(N, 4).astype(np.float32), "color")
+
+    df = bob.to_table()
+
+    assert isinstance(df, pl.DataFrame)
+    assert df.height == N
+    assert set(df.columns) == {
+        "position_x",
+        "position_y",
+        "position_z",
+        "res_id",
+        "color_r",
+        "color_g",
+        "color_b",
+        "color_a",
+    }
+    np.testing.assert_array_equal(df["position_y"].to_numpy(), positions[:, 1])
+    np.testing.assert_array_equal(df["res_id"].to_numpy(), np.arange(N))
+
+    # vectors split into components are grouped again when stored
+    position = ("position_x", "position_y", "position_z")
+    copy = db.BlenderObject.from_table(df, position=position)
+    np.testing.assert_array_equal(copy.position, positions)
+    assert copy.attributes["color_r"].data_type == "FLOAT"
+
+
+def test_to_table_categorical_round_trip(columns):
+    pl = pytest.importorskip("polars")
+    bob = db.BlenderObject.from_table(columns)
+
+    df = bob.to_table()
+    assert df["chain_id"].dtype == pl.String
+    assert df["chain_id"].to_list() == list(columns["chain_id"])
+    _, table = next(bob.iter_tables(domains=["POINT"]))
+    assert table["chain_id"].to_list() == list(columns["chain_id"])
+
+    position = ("position_x", "position_y", "position_z")
+    copy = db.BlenderObject.from_table(df, position=position)
+    assert copy.attributes["chain_id"].data_type == "INT8"
+    np.testing.assert_array_equal(
+        db.categorical_attribute(copy.object, "chain_id"), columns["chain_id"]
+    )
+
+    codes = bob.to_table(categorical=False)["chain_id"]
+    assert codes.dtype == pl.Int8
+    np.testing.assert_array_equal(codes.to_numpy(), bob.named_attribute("chain_id"))
+    _, table = next(bob.iter_tables(domains=["POINT"], categorical=False))
+    assert table["chain_id"].dtype == pl.Int8
+
+
+def test_to_table_list_zero_copy():
+    pl = pytest.importorskip("polars")
+    bob = db.create_bob(np.random.rand(N, 3))
+    arrays = db.table_arrays(bob.object, names=["position"], vectors="list")
+    df = bob.to_table(names=["position"], vectors="list")
+
+    assert df.columns == ["position"]
+    assert df["position"].dtype == pl.Array(pl.Float32, 3)
+    np.testing.assert_array_equal(df["position"].to_numpy(), arrays["position"])
+
+
+def test_to_table_names_and_domain():
+    pytest.importorskip("polars")
+    bob = db.BlenderObject(bpy.data.objects["Cube"])
+    bob.store_named_attribute(np.arange(6), "face_id", domain="FACE")
+
+    df = bob.to_table(domain="FACE", names=["face_id"])
+    assert df.columns == ["face_id"]
+    assert df.height == 6
+
+    with pytest.raises(db.NamedAttributeError):
+        bob.to_table(domain="FACE", names=["position"])
+
+
+def test_iter_tables():
+    pytest.importorskip("polars")
+    bob = db.BlenderObject(bpy.data.objects["Cube"])
+    bob.store_named_attribute(np.arange(6), "face_id", domain="FACE")
+
+    tables = dict(bob.iter_tables())
+    assert tables["POINT"].height == 8
+    assert tables["FACE"]["face_id"].to_list() == list(range(6))
+    assert [domain for domain, _ in bob.iter_tables(domains=["FACE"])] == ["FACE"]
+
+
+def test_to_table_pyarrow():
+    pa = pytest.importorskip("pyarrow")
+    bob = db.create_bob(np.random.rand(N, 3))
+    bob.store_named_attribute(np.random.rand(N) > 0.5, "flag")
+    table = bob.to_table(vectors="list", backend="pyarrow")
+    assert isinstance(table, pa.Table)
+    assert table.schema.field("position").type == pa.list_(pa.float32(), 3)
+    assert table.column("flag").type == pa.bool_()
@@ -0,0 +1,244 @@
+import bpy
+import numpy as np
+import pytest
+
+import databpy as db
+
+N_FRAMES = 5
+N_POINTS = 20
+
+
+@pytest.fixture
+def frames():
+    return np.random.default_rng(0).random((N_FRAMES, N_POINTS, 3))
+
+
+def test_player_updates_on_frame_change(frames):
+    bob = db.create_bob(frames[0])
+    player = db.TrajectoryPlayer(bob, frames)
+    player.register()
+    try:
+        assert player.registered
+        bpy.context.scene.frame_set(3)
+        np.testing.assert_allclose(bob.position, frames[2], rtol=1e-6)
+    finally:
+        player.unregister()
+
+    assert not player.registered
+    bpy.context.scene.frame_set(4)
+    np.testing.assert_allclose(bob.position, frames[2], rtol=1e-6)
+
+
+def test_player_clamps_frames(frames):
+    bob = db.create_bob(frames[0])
+    player = db.TrajectoryPlayer(bob, frames, frame_start=10)
+    assert player.frame_index(0) == 0
+    assert player.frame_index(12) == 2
+    assert player.frame_index(100) == N_FRAMES - 1
+
+    player.update(100)
+    np.testing.assert_allclose(bob.position, frames[-1], rtol=1e-6)
+
+
+def test_player_memmap_and_callable(tmp_path, frames):
+    np.save(tmp_path / "frames.npy", frames.astype(np.float32))
+    memmap = np.load(tmp_path / "frames.npy", mmap_mode="r")
+    bob = db.create_bob(frames[0])
+
+    player = db.TrajectoryPlayer(
+        bob,
+        {
+            "position": memmap,
+            "frame": lambda i: np.full(N_POINTS, i, dtype=np.int64),
+        },
+    )
+    assert bob.attributes["frame"].data_type == "INT"
+    assert player.n_frames == N_FRAMES
+
+    player.update(4)
+    np.testing.assert_array_equal(bob.position, memmap[3])
+    np.testing.assert_array_equal(bob.named_attribute("frame"), 3)
+
+
+def test_player_only_writes_changed_frames(frames):
+    bob = db.create_bob(frames[0])
+    player = db.TrajectoryPlayer(bob, frames)
+
+    assert player.update(2).n_written == 1
+    assert player.update(2).n_written == 0
+    player.invalidate()
+    timing = player.update(2)
+    assert timing.n_written == 1
+    assert timing.total == timing.read + timing.write
+    assert [t.index for t in player.timings] == [1, 1, 1]
+
+
+def test_player_shape_mismatch(frames):
+    bob = db.create_bob(frames[0])
+    player = db.TrajectoryPlayer(bob, {"position": lambda i: np.zeros((3, 3))})
+    with pytest.raises(db.AttributeMismatchError):
+        player.update(1)
+
+
+def test_player_unregisters_when_object_removed(frames):
+    bob = db.create_bob(frames[0])
+    player = db.TrajectoryPlayer(bob, frames)
+    player.register()
+    bpy.data.objects.remove(bob.object)
+
+    bpy.context.scene.frame_set(2)
+    assert not player.registered
+
+
+def test_prefetcher_loads_ahead(frames):
+    requested = []
+
+    def source(i):
+        requested.append(i)
+        return frames[i]
+
+    with db.FramePrefetcher(
+        source, n_ahead=2, n_frames=N_FRAMES, dtype=np.float32
+    ) as prefetcher:
+        assert len(prefetcher) == N_FRAMES
+        first = prefetcher(0)
+        assert first.dtype == np.float32
+        np.testing.assert_allclose(first, frames[0], rtol=1e-6)
+
+        np.testing.assert_allclose(prefetcher(1), frames[1], rtol=1e-6)
+        np.testing.assert_allclose(prefetcher(2), frames[2], rtol=1e-6)
+        assert prefetcher.n_hits == 2
+        assert prefetcher.n_misses == 1
+        assert {0, 1, 2} <= set(requested)
+        # the previous frame is kept for interpolating between the two
+        assert set(prefetcher._frames) == {1, 2, 3, 4}
+
+
+def test_prefetcher_direction(frames):
+    with db.FramePrefetcher(frames, n_ahead=2) as prefetcher:
+        prefetcher(3)
+        prefetcher(2)
+        assert prefetcher.direction == -1
+        assert set(prefetcher._frames) == {3, 2, 1, 0}
+        np.testing.assert_array_equal(prefetcher(1), frames[1])
+        assert prefetcher.n_hits == 1
+
+
+def test_prefetcher_byte_budget(frames):
+    with db.FramePrefetcher(frames, n_ahead=10, max_bytes=frames[0].nbytes * 4) as p:
+        assert p.n_ahead == 2
+        assert p.nbytes == frames[0].nbytes * 4
+
+
+def test_prefetcher_propagates_errors(frames):
+    def source(i):
+        if i == 2:
+            raise OSError("corrupt frame")
+        return frames[i]
+
+    with db.FramePrefetcher(source, n_frames=N_FRAMES) as prefetcher:
+        prefetcher(1)
+        with pytest.raises(OSError, match="corrupt"):
+            prefetcher(2)
+        np.testing.assert_array_equal(prefetcher(3), frames[3])
+
+
+def test_player_prefetch(frames):
+    bob = db.create_bob(frames[0])
+    player = db.TrajectoryPlayer(bob, frames, prefetch=2)
+    try:
+        for frame in range(1, N_FRAMES + 1):
+            player.update(frame)
+            np.testing.assert_allclose(bob.position, frames[frame - 1], rtol=1e-6)
+        assert player._prefetchers[0].n_hits >= N_FRAMES - 2
+    finally:
+        player.close()
+
+
+def test_prefetcher_explicit_direction(frames):
+    with db.FramePrefetcher(frames, n_ahead=1) as prefetcher:
+        prefetcher.get(2, direction=1)
+        prefetcher.get(1, direction=1)
+        assert prefetcher.direction == 1
+        assert set(prefetcher._frames) == {2, 1}
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_player_interpolates_subframes(frames, prefetch):
+    bob = db.create_bob(frames[0])
+    bob.store_named_attribute(np.zeros(N_POINTS, dtype=np.int32), "step")
+    steps = np.arange(N_FRAMES)[:, None].repeat(N_POINTS, axis=1).astype(np.int32)
+    player = db.TrajectoryPlayer(
+        bob,
+        {"position": frames, "step": steps},
+        interpolate=True,
+        prefetch=prefetch,
+    )
+    try:
+        for frame in (2.25, 2.5, 1.75):
+            index = int(frame) - 1
+            t = frame - int(frame)
+            player.update(frame)
+            expected = frames[index] + (frames[index + 1] - frames[index]) * t
+            np.testing.assert_allclose(bob.position, expected, rtol=1e-5)
+            # integer attributes show the earlier frame
+            np.testing.assert_array_equal(bob.named_attribute("step"), index)
+
+        # past the last frame there is nothing to interpolate towards
+        player.update(N_FRAMES + 0.5)
+        np.testing.assert_allclose(bob.position, frames[-1], rtol=1e-6)
+    finally:
+        player.close()
+
+
+def test_player_interpolates_periodic_box():
+    frames = np.array([[[9.5, 5.0, 5.0]], [[0.5, 5.0, 5.0]]])
+    bob = db.create_bob(frames[0])
+    player = db.TrajectoryPlayer(bob, frames, interpolate=True, box=(10, 10, 10))
+
+    player.update(1.25)
+    np.testing.assert_allclose(bob.position, [[9.75, 5.0, 5.0]], rtol=1e-6)
+    player.update(1.75)
+    np.testing.assert_allclose(bob.position, [[10.25, 5.0, 5.0]], rtol=1e-6)
+
+
+def test_player_static_sources(frames):
+    bob = db.create_bob(frames[0])
+    res_id = np.arange(N_POINTS)
+    player = db.TrajectoryPlayer(bob, {"position": frames, "res_id": res_id})
+    assert player.n_frames == N_FRAMES
+    assert bob.attributes["res_id"].data_type == "INT"
+
+    first = player.update(1)
+    assert first.n_written == 2
+    assert first.n_bytes == N_POINTS * 3 * 4 + N_POINTS * 4
+    for frame in range(2, N_FRAMES + 1):
+        timing = player.update(frame)
+        assert timing.n_written == 1
+        assert timing.n_bytes == N_POINTS * 3 * 4
+
+    np.testing.assert_array_equal(bob.named_attribute("res_id"), res_id)
+    assert player.bytes_written == {
+        "position": N_FRAMES * N_POINTS * 3 * 4,
+        "res_id": N_POINTS * 4,
+    }
+
+
+def test_player_detect_changes_by_hash(frames):
+    bob = db.create_bob(frames[0])
+    # the colors only change every other frame
+    colors = np.random.default_rng(2).random((N_FRAMES, N_POINTS, 4))
+    colors[1] = colors[0]
+    player = db.TrajectoryPlayer(
+        bob, {"position": frames, "Color": colors}, detect_changes="hash"
+    )
+
+    assert player.update(1).n_written == 2
+    timing = player.update(2)
+    assert timing.n_written == 1
+    assert timing.n_skipped == 1
+    assert player.update(3).n_written == 2
+    np.testing.assert_allclose(bob.named_attribute("Color"), colors[2], rtol=1e-6)
+
+    with pytest.raises(ValueError):
+        db.TrajectoryPlayer(bob, frames, detect_changes="never")
@@ -38,6 +38,39 @@ def test_lerp_extremes():
     np.testing.assert_array_equal(result_one, b)
 
 
+@pytest.mark.parametrize("alias", [None, "a", "b"])
+def test_lerp_out(alias):
+    rng = np.random.default_rng(0)
+    a = rng.random((10, 3))
+    b = rng.random((10, 3))
+    expected = a + (b - a) * 0.3
+    out = {"a": a, "b": b}.get(alias, np.empty((10, 3)))
+    result = utils.lerp(a, b, 0.3, out=out)
+    assert result is out
+    np.testing.assert_allclose(result, expected)
+
+
+def test_lerp_out_casts():
+    out = np.empty(3, dtype=np.float32)
+    utils.lerp(np.zeros(3), np.ones(3), 0.25, out=out)
+    np.testing.assert_allclose(out, 0.25)
+
+
+def test_lerp_periodic_box():
+    box = np.array([10.0, 10.0, 10.0])
+    a = np.array([[9.0, 1.0, 5.0]])
+    b = np.array([[1.0, 9.0, 6.0]])
+    result = utils.lerp(a, b, 0.5, box=box)
+    np.testing.assert_allclose(result, [[10.0, 0.0, 5.5]])
+
+    out = np.empty((1, 3))
+    assert utils.lerp(a, b, 0.5, out=out, box=box) is out
+    np.testing.assert_allclose(out, result)
+
+    with pytest.raises(ValueError):
+        utils.lerp(a, b, 0.5, out=a, box=box)
+
+
 def test_path_resolve_str():
     result = utils.path_resolve("//test.blend")
     assert isinstance(result, Path)
@@ -54,3 +87,15 @@ def test_path_resolve_path():
 def test_path_resolve_invalid():
     with pytest.raises(ValueError):
         utils.path_resolve(123)
+
+
+def test_content_hash():
+    a = np.arange(12, dtype=np.float32)
+    assert utils.content_hash(a) == utils.content_hash(a.copy())
+    assert utils.content_hash(a) != utils.content_hash(a + 1)
+    # the same bytes with a different layout hash differently
+    assert utils.content_hash(a) != utils.content_hash(a.reshape(4, 3))
+    assert utils.content_hash(a.view(np.int32)) != utils.content_hash(a)
+    # non-contiguous arrays are hashed by their values
+    b = np.arange(24, dtype=np.float32).reshape(12, 2)
+    assert utils.content_hash(b[:, 0]) == utils.content_hash(b[:, 0].copy())
@@ -1,8 +1,10 @@
 import pytest
 import tempfile
 import os
+import struct
 from pathlib import Path
 import bpy
+import numpy as np
 
 try:
     bpy.utils.expose_bundled_modules()
@@ -12,8 +14,9 @@ try:
 except Exception:
     HAS_OPENVDB = False
 
-from databpy.vdb import import_vdb
+from databpy.vdb import VDBHeaderError, import_vdb
 from databpy.collection import create_collection
+import databpy as db
 
 
 def create_simple_vdb(filepath: Path) -> None:
@@ -174,9 +177,368 @@ class TestVDBImport:
         # This test focuses on verifying the volume object structure rather than
         # the specific grid content, which may vary by Blender/OpenVDB version.
 
+    def test_import_vdb_single_collection(self, temp_vdb_file, clean_scene):
+        """Test that the object is only linked into the target collection."""
+        collection = create_collection("OnlyHere")
+        volume_obj = import_vdb(temp_vdb_file, collection=collection)
+
+        assert list(volume_obj.users_collection) == [collection]
+        assert volume_obj.name == temp_vdb_file.stem
+
+    def test_import_vdb_grids_load_lazily(self, temp_vdb_file, clean_scene):
+        """Test that the grids are listed but their voxels aren't read yet."""
+        volume_obj = import_vdb(temp_vdb_file)
+
+        grids = volume_obj.data.grids
+        assert grids.is_loaded
+        assert [grid.name for grid in grids] == ["density"]
+        assert not any(grid.is_loaded for grid in grids)
+
+    def test_import_vdb_cursor_and_selection(self, temp_vdb_file, clean_scene):
+        """Test that the object is placed like the volume import operator does."""
+        bpy.context.scene.cursor.location = (1, 2, 3)
+        other = db.create_object(name="Other")
+        other.select_set(True)
+
+        volume_obj = import_vdb(temp_vdb_file)
+
+        assert tuple(volume_obj.location) == (1, 2, 3)
+        assert bpy.context.view_layer.objects.active == volume_obj
+        assert list(bpy.context.selected_objects) == [volume_obj]
+
+
+def test_import_vdb_invalid_file(tmp_path, clean_scene):
+    """Test that files which aren't VDB files raise instead of importing empty."""
+    n_volumes = len(bpy.data.volumes)
+    junk = tmp_path / "junk.vdb"
+    junk.write_bytes(b"not a volume at all")
+    with pytest.raises(RuntimeError, match="Failed to import VDB file"):
+        import_vdb(junk)
+
+    truncated = tmp_path / "truncated.vdb"
+    write_vdb_header(
+        truncated, [("density", "Tree_float_5_4_3", 1.0, (0,) * 3, (1,) * 3)]
+    )
+    truncated.write_bytes(truncated.read_bytes()[:120])
+    with pytest.raises(RuntimeError, match="truncated"):
+        import_vdb(truncated)
+
+    # a readable header without any grid data is caught when Blender loads the grids
+    no_data = tmp_path / "no_data.vdb"
+    write_vdb_header(
+        no_data, [("density", "Tree_float_5_4_3", 1.0, (0,) * 3, (1,) * 3)]
+    )
+    with pytest.raises(RuntimeError, match="Failed to import VDB file"):
+        import_vdb(no_data)
+
+    assert len(bpy.data.volumes) == n_volumes
+    assert "no_data" not in bpy.data.objects
+
 
 @pytest.mark.skipif(HAS_OPENVDB, reason="Testing OpenVDB not available case")
 def test_import_vdb_without_openvdb():
     """Test that we can still run tests when OpenVDB is not available."""
     # This test just ensures our skip logic works correctly
     assert not HAS_OPENVDB
+
+
+@pytest.fixture
+def vdb_sequence_dir():
+    """Create a directory of empty, numbered .vdb files."""
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        for i in range(5, 15):
+            (directory / f"smoke_{i:04d}.vdb").touch()
+        yield directory
+
+
+@pytest.mark.parametrize("as_pattern", [True, False])
+def test_import_vdb_sequence(vdb_sequence_dir, clean_scene, as_pattern):
+    files = vdb_sequence_dir / "smoke_*.vdb" if as_pattern else vdb_sequence_dir
+    obj = db.import_vdb_sequence(files, frame_start=20, collection="Sequence")
+
+    volume = obj.data
+    assert obj.name == "smoke"
+    assert volume.is_sequence
+    assert volume.frame_duration == 10
+    assert volume.frame_start == 20
+    # first file is number 5, which Blender shows as file 1 without an offset
+    assert volume.frame_offset == 4
+    assert Path(volume.filepath).name == "smoke_0005.vdb"
+    assert list(obj.users_collection) == [bpy.data.collections["Sequence"]]
+
+    # the scene frames map onto the numbers of the files in the sequence
+    for scene_frame, file_number in [(20, 5), (24, 9), (29, 14)]:
+        bpy.context.scene.frame_set(scene_frame)
+        evaluated = obj.evaluated_get(bpy.context.evaluated_depsgraph_get())
+        assert evaluated.data.grids.frame == file_number
+
+
+def test_import_vdb_sequence_list(vdb_sequence_dir, clean_scene):
+    files = sorted(vdb_sequence_dir.iterdir(), reverse=True)
+    obj = db.import_vdb_sequence(files, frame_offset=2)
+    assert Path(obj.data.filepath).name == "smoke_0005.vdb"
+    assert obj.data.frame_offset == 6
+
+    with pytest.raises(RuntimeError, match="not found"):
+        db.import_vdb_sequence([*files, vdb_sequence_dir / "smoke_0015.vdb"])
+
+
+def test_import_vdb_sequence_frame_offset(vdb_sequence_dir, clean_scene):
+    obj = db.import_vdb_sequence(vdb_sequence_dir, frame_start=1, frame_offset=3)
+    volume = obj.data
+    assert volume.frame_duration == 7
+
+    # the first frame skips three files and the last frame shows the last file
+    for scene_frame, file_number in [(1, 8), (7, 14)]:
+        bpy.context.scene.frame_set(scene_frame)
+        evaluated = obj.evaluated_get(bpy.context.evaluated_depsgraph_get())
+        assert evaluated.data.grids.frame == file_number
+        assert (vdb_sequence_dir / f"smoke_{file_number:04d}.vdb").exists()
+
+    # frames after the sequence are hidden like those before it, rather than pointing
+    # past the last file
+    hidden = []
+    for scene_frame in (0, 8):
+        bpy.context.scene.frame_set(scene_frame)
+        evaluated = obj.evaluated_get(bpy.context.evaluated_depsgraph_get())
+        hidden.append(evaluated.data.grids.frame)
+    assert hidden[0] == hidden[1]
+
+    for frame_offset in (-1, 10):
+        with pytest.raises(ValueError, match="frame_offset"):
+            db.import_vdb_sequence(vdb_sequence_dir, frame_offset=frame_offset)
+
+
+def test_import_vdb_sequence_missing_frames(vdb_sequence_dir, clean_scene):
+    (vdb_sequence_dir / "smoke_0009.vdb").unlink()
+    with pytest.raises(ValueError, match="missing frames: \\[9\\]"):
+        db.import_vdb_sequence(vdb_sequence_dir)
+
+
+def test_import_vdb_sequence_mixed_names(vdb_sequence_dir, clean_scene):
+    (vdb_sequence_dir / "fire_0015.vdb").touch()
+    with pytest.raises(ValueError, match="naming pattern"):
+        db.import_vdb_sequence(vdb_sequence_dir)
+
+
+def test_import_vdb_sequence_empty(clean_scene):
+    with tempfile.TemporaryDirectory() as tmp:
+        with pytest.raises(RuntimeError):
+            db.import_vdb_sequence(tmp)
+
+
+def _vdb_string(value: str) -> bytes:
+    data = value.encode()
+    return struct.pack("<I", len(data)) + data
+
+
+def _vdb_metadata(entries: list[tuple[str, str, bytes]]) -> bytes:
+    data = struct.pack("<i", len(entries))
+    for name, type_name, value in entries:
+        data += _vdb_string(name) + _vdb_string(type_name)
+        data += struct.pack("<I", len(value)) + value
+    return data
+
+
+def write_vdb_header(
+    filepath: Path,
+    grids: list[tuple[str, str, float, tuple, tuple]],
+    map_type: str = "UniformScaleMap",
+) -> None:
+    """
+    Write the header of a .vdb file without any voxel data, for testing the header
+    reader without OpenVDB. Each grid is (name, grid_type, voxel_size, bbox_min,
+    bbox_max). Map types other than "UniformScaleMap" are written without any values,
+    so the grids don't have a voxel size.
+    """
+    data = struct.pack("<qIIIB", 0x56444220, 224, 12, 0, 1)
+    data += b"00000000-0000-0000-0000-000000000000"
+    data += _vdb_metadata([("creator", "string", b"databpy")])
+    data += struct.pack("<i", len(grids))
+
+    for name, grid_type, voxel_size, bbox_min, bbox_max in grids:
+        descriptor = _vdb_string(name) + _vdb_string(grid_type) + _vdb_string("")
+        grid_pos = len(data) + len(descriptor) + 3 * 8
+        grid = struct.pack("<I", 0)
+        grid += _vdb_metadata(
+            [
+                ("class", "string", b"fog volume"),
+                ("file_bbox_min", "vec3i", struct.pack("<3i", *bbox_min)),
+                ("file_bbox_max", "vec3i", struct.pack("<3i", *bbox_max)),
+                ("file_delayed_load", "__delayedload", b"\x00" * 8),
+                ("file_voxel_count", "int64", struct.pack("<q", 27)),
+                ("name", "string", name.encode()),
+            ]
+        )
+        grid += _vdb_string(map_type)
+        if map_type == "UniformScaleMap":
+            grid += struct.pack("<15d", *[voxel_size] * 6, *[1 / voxel_size] * 9)
+        end_pos = grid_pos + len(grid)
+        data += descriptor + struct.pack("<3q", grid_pos, grid_pos, end_pos) + grid
+
+    filepath.write_bytes(data)
+
+
+def test_read_vdb_header(tmp_path):
+    filepath = tmp_path / "header.vdb"
+    write_vdb_header(
+        filepath,
+        [
+            ("density", "Tree_float_5_4_3", 0.25, (-1, -2, -3), (1, 2, 3)),
+            ("velocity", "Tree_vec3s_5_4_3_HalfFloat", 0.5, (0, 0, 0), (4, 4, 4)),
+        ],
+    )
+
+    info = db.read_vdb_header(filepath)
+
+    assert info.file_version == 224
+    assert info.library_version == (12, 0)
+    assert info.metadata == {"creator": "databpy"}
+    assert info.grid_names == ["density", "velocity"]
+
+    density, velocity = info.grids
+    assert density.value_type == "float"
+    assert not density.half_float
+    assert density.voxel_size == (0.25, 0.25, 0.25)
+    assert density.bbox_min == (-1, -2, -3)
+    assert density.bbox_max == (1, 2, 3)
+    assert density.voxel_count == 27
+    assert density.metadata["class"] == "fog volume"
+    # internal metadata is skipped
+    assert "file_delayed_load" not in density.metadata
+
+    assert velocity.grid_type == "Tree_vec3s_5_4_3"
+    assert velocity.value_type == "vec3s"
+    assert velocity.half_float
+    assert velocity.voxel_size == (0.5, 0.5, 0.5)
+
+
+def test_read_vdb_header_invalid(tmp_path):
+    empty = tmp_path / "empty.vdb"
+    empty.touch()
+    with pytest.raises(VDBHeaderError, match="Not an OpenVDB file"):
+        db.read_vdb_header(empty)
+
+    text = tmp_path / "text.vdb"
+    text.write_text("definitely not a volume")
+    with pytest.raises(VDBHeaderError, match="Not an OpenVDB file"):
+        db.read_vdb_header(text)
+
+    truncated = tmp_path / "truncated.vdb"
+    write_vdb_header(
+        truncated, [("density", "Tree_float_5_4_3", 1.0, (0,) * 3, (1,) * 3)]
+    )
+    truncated.write_bytes(truncated.read_bytes()[:120])
+    with pytest.raises(VDBHeaderError, match="truncated"):
+        db.read_vdb_header(truncated)
+
+    with pytest.raises(FileNotFoundError):
+        db.read_vdb_header(tmp_path / "missing.vdb")
+
+
+@pytest.mark.skipif(not HAS_OPENVDB, reason="OpenVDB not available")
+def test_read_vdb_header_openvdb(tmp_path):
+    filepath = tmp_path / "grids.vdb"
+    density = vdb.FloatGrid()
+    density.name = "density"
+    density.transform = vdb.createLinearTransform(voxelSize=0.5)
+    accessor = density.getAccessor()
+    for ijk in [(0, 0, -2), (2, 4, 0), (1, 1, 1)]:
+        accessor.setValueOn(ijk, 1.0)
+    velocity = vdb.Vec3SGrid()
+    velocity.name = "velocity"
+    velocity.saveFloatAsHalf = True
+    velocity.getAccessor().setValueOn((1, 1, 1), (1.0, 0.0, 0.0))
+    vdb.write(str(filepath), grids=[density, velocity])
+
+    info = db.read_vdb_header(filepath)
+
+    assert info.grid_names == ["density", "velocity"]
+    assert info.grids[0].value_type == "float"
+    assert info.grids[0].voxel_size == (0.5, 0.5, 0.5)
+    assert info.grids[0].bbox_min == (0, 0, -2)
+    assert info.grids[0].bbox_max == (2, 4, 1)
+    assert info.grids[0].voxel_count == 3
+    assert info.grids[1].value_type == "vec3s"
+    assert info.grids[1].half_float
+    assert info.grids[1].voxel_size == (1.0, 1.0, 1.0)
+
+
+@pytest.fixture
+def vdb_header_sequence_dir(tmp_path):
+    """Create a directory of numbered .vdb files that only contain headers."""
+    grids = [
+        ("density", "Tree_float_5_4_3", 0.5, (0, 0, 0), (3, 3, 3)),
+        ("temperature", "Tree_float_5_4_3", 0.5, (-1, 0, 0), (2, 2, 2)),
+    ]
+    for i in range(1, 11):
+        write_vdb_header(tmp_path / f"smoke_{i:03d}.vdb", grids)
+    return tmp_path
+
+
+def test_scan_vdb_sequence(vdb_header_sequence_dir):
+    frames = db.scan_vdb_sequence(vdb_header_sequence_dir / "smoke_*.vdb")
+
+    assert frames["frame"].tolist() == list(range(1, 11))
+    assert frames["consistent"].all()
+    assert frames["valid"].all()
+    assert (frames["size"] > 0).all()
+    assert (frames["n_grids"] == 2).all()
+    assert frames["grids"][0] == "density,temperature"
+    assert frames["voxel_size"][0].tolist() == [0.5, 0.5, 0.5]
+    assert frames["voxel_count"][0] == 54
+    # the bounding box covers every grid
+    assert frames["bbox_min"][0].tolist() == [-1, 0, 0]
+    assert frames["bbox_max"][0].tolist() == [3, 3, 3]
+
+
+def test_scan_vdb_sequence_flags_frames(vdb_header_sequence_dir):
+    directory = vdb_header_sequence_dir
+    (directory / "smoke_004.vdb").unlink()
+    (directory / "smoke_006.vdb").write_bytes(b"junk")
+    write_vdb_header(
+        directory / "smoke_008.vdb",
+        [("density", "Tree_float_5_4_3", 0.5, (0, 0, 0), (3, 3, 3))],
+    )
+    write_vdb_header(
+        directory / "smoke_009.vdb",
+        [
+            ("density", "Tree_float_5_4_3", 0.25, (0, 0, 0), (3, 3, 3)),
+            ("temperature", "Tree_float_5_4_3", 0.25, (0, 0, 0), (3, 3, 3)),
+        ],
+    )
+
+    frames = db.scan_vdb_sequence(directory, max_workers=2)
+
+    assert frames["frame"][~frames["consistent"]].tolist() == [4, 6, 8, 9]
+    missing = frames[frames["frame"] == 4][0]
+    assert not missing["exists"]
+    assert missing["path"] == str(directory / "smoke_004.vdb")
+    junk = frames[frames["frame"] == 6][0]
+    assert junk["exists"] and not junk["valid"]
+    assert frames[frames["frame"] == 8][0]["grids"] == "density"
+
+
+def test_scan_vdb_sequence_unreadable_frame(vdb_header_sequence_dir):
+    directory = vdb_header_sequence_dir
+    (directory / "smoke_005.vdb").unlink()
+    (directory / "smoke_005.vdb").mkdir()
+
+    frames = db.scan_vdb_sequence(directory / "smoke_*.vdb")
+
+    assert frames["frame"][~frames["consistent"]].tolist() == [5]
+    unreadable = frames[frames["frame"] == 5][0]
+    assert unreadable["exists"] and not unreadable["valid"]
+
+
+def test_scan_vdb_sequence_without_voxel_size(tmp_path):
+    grids = [("density", "Tree_float_5_4_3", 1.0, (0, 0, 0), (3, 3, 3))]
+    for i in range(1, 5):
+        write_vdb_header(tmp_path / f"smoke_{i:03d}.vdb", grids, "NonlinearFrustumMap")
+    write_vdb_header(tmp_path / "smoke_005.vdb", grids)
+
+    frames = db.scan_vdb_sequence(tmp_path)
+
+    assert np.isnan(frames["voxel_size"][0]).all()
+    assert frames["frame"][~frames["consistent"]].tolist() == [5]